@@ -1,6 +1,5 @@
 import argparse
-import json
-from pathlib import Path
+import sys
 
 from backgammon.core.game import BackgammonGame
 from backgammon.core.board import Board
@@ -48,11 +47,19 @@ def _roll_from_arg(s: str) -> tuple[int, int]:
 
 def _print_status(game: BackgammonGame):
     print("Estado:")
-    cur = game.current_player()
-    color = getattr(cur, "get_color", lambda: getattr(cur, "_Player__color__", "unknown"))()
-    print(f"Jugador: {color}")
-    print(f"Dados: {game.last_roll()}")
-    print(f"Pips: {game.pips()}")
+    print(f"Jugador: {_color_of(game.current_player())}")
+    _print_dice(game)
+    print(f"Position ID: {game.to_position_id()}")
+
+
+def _print_hint(game: BackgammonGame, ply: int):
+    from backgammon.engine.search import Searcher  # import diferido: sólo para --hint
+
+    res = Searcher().search(game, ply)
+    steps = " ".join(f"{o},{pip}" for (o, pip) in res["play"]) or "(sin movimientos)"
+    print(f"Sugerencia ({res['ply']}-ply): {steps} | valor {res['value']:+.3f}")
+    for p in res["per_ply"]:
+        print(f"  ply {p['ply']}: nodos {p['nodes']} | hits TT {p['tt_hits']} | {p['elapsed'] * 1000:.1f} ms")
 
 
 def _print_history(game: BackgammonGame):
@@ -67,6 +74,123 @@ def _print_history(game: BackgammonGame):
             print(f"{o}->{d} (pip {pip})")
 
 
+def _color_of(player) -> str:
+    return getattr(player, "get_color", lambda: getattr(player, "_Player__color__", "unknown"))()
+
+
+def _print_dice(game: BackgammonGame):
+    print(f"Dados: {game.last_roll()}")
+    print(f"Pips: {game.pips()}")
+
+
+# ---------- acciones (compartidas por los flags, --batch y --serve) ----------
+def load_game(path: str) -> BackgammonGame:
+    """Lector compartido con la UI: journal, JSON plano, envuelto {"board": {...}} o formato viejo."""
+    from backgammon.core import journal  # import diferido: sólo --load/--journal (arranque más rápido)
+
+    try:
+        return journal.load_game(path)
+    except OSError as e:  # directorio, sin permisos...: mismo error que un archivo inválido
+        raise ValueError(f"No se pudo leer {path}: {e.strerror or e}") from e
+
+
+def save_game(game: BackgammonGame, path: str) -> None:
+    import json  # import diferido: sólo --save
+    from pathlib import Path
+
+    p = Path(path)
+    data = game.to_dict()  # formato PLANO (con 'points' en la raíz)
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    except OSError as e:
+        raise ValueError(f"No se pudo guardar en {path}: {e.strerror or e}") from e
+
+
+# `journal`, si se pasa, registra cada acción aplicada (autoguardado de pocos bytes)
+def do_setup(game: BackgammonGame, journal=None):
+    game.setup_board()
+    if journal is not None:
+        journal.checkpoint(game)
+    print(format_board_summary(game.board()))
+
+
+def do_roll(game: BackgammonGame, roll: tuple[int, int] | None = None, journal=None):
+    game.start_turn(roll)
+    if journal is not None:
+        journal.started(game)
+    _print_dice(game)
+
+
+def ensure_turn(game: BackgammonGame, journal=None):
+    """Las acciones que necesitan pips inician un turno automático si no hay tirada."""
+    if game.last_roll() is None:
+        do_roll(game, journal=journal)
+
+
+def do_list_moves(game: BackgammonGame):
+    print("Legal moves:")
+    for (o, d, pip) in game.legal_moves():
+        if o == -1:
+            print(f"  BAR->{d} (pip {pip})")
+        else:
+            print(f"  {o}->{d} (pip {pip})")
+    # Bear-off disponibles
+    offs = game.legal_bear_off_moves()
+    if offs:
+        print("Bear-off moves:")
+        for (o, pip) in offs:
+            print(f"  {o}->OFF (pip {pip})")
+
+
+def do_move(game: BackgammonGame, move: str, journal=None):
+    origin, pip = _parse_move_str(move)  # valida formato
+    record = game.make_move(origin, pip)
+    if journal is not None:
+        journal.moved(game, record)
+    real_dest = record[2]  # puede ser None si bear-off
+    if real_dest is None:
+        print(f"Bear-off: {origin} (pip {pip})")
+    else:
+        print(f"Move: {origin}->{real_dest} (pip {pip})")
+    _print_dice(game)
+
+
+def do_bear_off(game: BackgammonGame, move: str, journal=None):
+    origin, pip = _parse_move_str(move)
+    game.bear_off(origin, pip)
+    if journal is not None:
+        journal.moved(game, ("off", origin, None, pip))
+    print(f"Bear-off: {origin} (pip {pip})")
+    _print_dice(game)
+
+
+def do_auto_end_turn(game: BackgammonGame, journal=None):
+    if game.auto_end_turn():
+        if journal is not None:
+            journal.ended(game)
+        print("Sin jugadas → turno rotado.")
+    else:
+        print("Aún hay jugadas; no se rota.")
+    _print_dice(game)
+
+
+def do_end_turn(game: BackgammonGame, journal=None):
+    game.end_turn()  # puede lanzar ValueError si quedan pips
+    if journal is not None:
+        journal.ended(game)
+    print("Turno finalizado.")
+    _print_dice(game)
+    # Mostrar jugador actual y chequear victoria del jugador anterior
+    print(f"Turno ahora: {_color_of(game.current_player())}")
+
+    prev_idx = _idx_prev_del_actual(game)
+    prev_color = _color_of(game.players()[prev_idx])
+    prev_int = Board.WHITE if prev_color == "white" else Board.BLACK
+    if hasattr(game, "has_won") and game.has_won(prev_int):
+        print(f"¡Victoria de {prev_color}!")
+
+
 def _idx_prev_del_actual(game: BackgammonGame) -> int:
     """
     Evita depender de nombres 'mangled'. Calcula el índice del jugador anterior
@@ -83,7 +207,26 @@ def _idx_prev_del_actual(game: BackgammonGame) -> int:
     return (cur_idx - 1) % len(players)
 
 
+def _main_simulate(argv) -> None:
+    """Subcomando `simulate`: partidas headless en un pool de procesos."""
+    from backgammon import sim  # import diferido: sólo lo necesita este subcomando
+
+    parser = argparse.ArgumentParser(prog="backgammon-cli simulate")
+    parser.add_argument("--games", type=int, default=100, help="Cantidad de partidas")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base (una por partida)")
+    parser.add_argument("--white", default="random", help=f"Política de White ({', '.join(sorted(sim.POLICIES))})")
+    parser.add_argument("--black", default="random", help=f"Política de Black ({', '.join(sorted(sim.POLICIES))})")
+    args = parser.parse_args(argv)
+    summary = sim.simulate(args.games, args.workers, args.seed, args.white, args.black)
+    print(sim.format_summary(summary))
+
+
 def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] == "simulate":
+        return _main_simulate(argv[1:])
+
     parser = argparse.ArgumentParser(prog="backgammon-cli")
     parser.add_argument("--setup", action="store_true", help="Inicializa el tablero estándar")
     parser.add_argument("--roll", type=str, help="Usa tirada fija a,b (ej: 3,4)")
@@ -94,12 +237,28 @@ def main(argv=None):
     parser.add_argument("--end-turn", action="store_true", help="Finaliza turno si no quedan pips")
     parser.add_argument("--auto-end-turn", action="store_true",
                         help="Rota turno automáticamente si no hay jugadas legales")
+    parser.add_argument("--hint", type=int, metavar="PLY", choices=(0, 1, 2),
+                        help="Sugiere la mejor jugada con búsqueda expectiminimax de 0/1/2 ply")
     parser.add_argument("--history", action="store_true", help="Muestra el historial del turno")
     parser.add_argument("--status", action="store_true", help="Muestra el estado actual")
     parser.add_argument("--save", type=str, help="Guarda la partida en JSON en la ruta indicada")
     parser.add_argument("--load", type=str, help="Carga la partida desde JSON en la ruta indicada")
+    parser.add_argument("--position-id", type=str,
+                        help="Carga la posición desde un Position ID de 14 caracteres (estilo GNUbg)")
+    parser.add_argument("--turn", choices=("white", "black"), default="white",
+                        help="Color al turno para --position-id (default: white)")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="Autoguardado: continúa la partida del journal (si existe) y le agrega "
+                             "cada acción (tirada, movimiento, bear-off, fin de turno)")
+    parser.add_argument("--batch", metavar="FILE|-",
+                        help="Ejecuta comandos (uno por línea: roll, move, bear-off, end-turn, list-moves, save...) "
+                             "sobre la misma partida; '-' lee de stdin")
+    parser.add_argument("--serve", metavar="SOCKET",
+                        help="Sesión persistente: atiende comandos de --batch por un socket Unix")
 
     args = parser.parse_args(argv)
+    if args.serve and args.batch:
+        parser.error("--batch y --serve no se combinan")
 
     # juego base
     game = BackgammonGame()
@@ -108,97 +267,79 @@ def main(argv=None):
 
     # cargar partida si corresponde (antes de setup/roll)
     if args.load:
-        p = Path(args.load)
-        if not p.exists():
-            raise ValueError(f"Archivo a cargar no existe: {args.load}")
-        data = json.loads(p.read_text(encoding="utf-8"))
-        # Soporta ambos formatos: plano o envuelto {"board": {...}}
-        if "board" in data and isinstance(data["board"], dict):
-            data = data["board"]
-        game = BackgammonGame.from_dict(data)
+        game = load_game(args.load)
+
+    # cargar posición compacta (puede lanzar ValueError si el ID es inválido)
+    if args.position_id:
+        game = BackgammonGame.from_position_id(args.position_id, args.turn)
+
+    # journal: se retoma si existe (salvo que --load/--position-id traigan otra partida)
+    journal = None
+    if args.journal:
+        from backgammon.core.journal import Journal  # import diferido: sólo --journal
+        from pathlib import Path
+
+        journal = Journal(args.journal)
+        if Path(args.journal).exists() and not (args.load or args.position_id):
+            game = journal.resume()  # recorta una última línea cortada antes de agregar
+        else:
+            journal.checkpoint(game)
+
+    try:
+        _run_actions(game, args, journal)
+    finally:
+        if journal is not None:
+            journal.close()
+
 
+def _run_actions(game: BackgammonGame, args, journal) -> None:
     if args.setup:
-        game.setup_board()
-        print(format_board_summary(game.board()))
+        do_setup(game, journal)
 
     # Tirada fija / automática si se piden acciones de turno
     if args.roll is not None:
-        roll = _roll_from_arg(args.roll)  # puede lanzar ValueError
-        game.start_turn(roll)
-        print(f"Dados: {game.last_roll()}")
-        print(f"Pips: {game.pips()}")
+        do_roll(game, _roll_from_arg(args.roll), journal)  # puede lanzar ValueError
     else:
         # Si no hay roll explícito pero se piden acciones que requieren pips,
         # iniciamos turno automático.
-        needs_turn = any([args.list_moves, args.move, args.bear_off, args.end_turn, args.auto_end_turn])
-        if needs_turn and game.last_roll() is None:
-            game.start_turn()
-            print(f"Dados: {game.last_roll()}")
-            print(f"Pips: {game.pips()}")
+        needs_turn = any([args.list_moves, args.move, args.bear_off, args.end_turn, args.auto_end_turn,
+                          args.hint is not None])
+        if needs_turn:
+            ensure_turn(game, journal)
 
     # Listar movimientos
     if args.list_moves:
-        print("Legal moves:")
-        for (o, d, pip) in game.legal_moves():
-            if o == -1:
-                print(f"  BAR->{d} (pip {pip})")
-            else:
-                print(f"  {o}->{d} (pip {pip})")
-        # Bear-off disponibles
-        offs = game.legal_bear_off_moves()
-        if offs:
-            print("Bear-off moves:")
-            for (o, pip) in offs:
-                print(f"  {o}->OFF (pip {pip})")
+        do_list_moves(game)
+
+    # Sugerencia del motor (antes de mover)
+    if args.hint is not None:
+        _print_hint(game, args.hint)
 
     # Aplicar movimientos (puede lanzar ValueError si inválidos)
-    if args.move:
-        for m in args.move:
-            origin, pip = _parse_move_str(m)  # valida formato
-            real_dest = game.apply_move(origin, pip)  # puede ser None si bear-off
-            if real_dest is None:
-                print(f"Bear-off: {origin} (pip {pip})")
-            else:
-                print(f"Move: {origin}->{real_dest} (pip {pip})")
-            print(f"Dados: {game.last_roll()}")
-            print(f"Pips: {game.pips()}")
+    for m in args.move or ():
+        do_move(game, m, journal)
 
     # Bear-off explícito
-    if args.bear_off:
-        for m in args.bear_off:
-            origin, pip = _parse_move_str(m)
-            game.bear_off(origin, pip)
-            print(f"Bear-off: {origin} (pip {pip})")
-            print(f"Dados: {game.last_roll()}")
-            print(f"Pips: {game.pips()}")
+    for m in args.bear_off or ():
+        do_bear_off(game, m, journal)
 
     # Auto end-turn
     if args.auto_end_turn:
-        ok = game.auto_end_turn()
-        if ok:
-            print("Sin jugadas → turno rotado.")
-        else:
-            print("Aún hay jugadas; no se rota.")
-        print(f"Dados: {game.last_roll()}")
-        print(f"Pips: {game.pips()}")
+        do_auto_end_turn(game, journal)
 
     # Cerrar turno (puede lanzar ValueError si quedan pips)
     if args.end_turn:
-        game.end_turn()
-        print("Turno finalizado.")
-        print(f"Dados: {game.last_roll()}")
-        print(f"Pips: {game.pips()}")
-        # Mostrar jugador actual y chequear victoria del jugador anterior
-        nxt = game.current_player()
-        ncolor = getattr(nxt, "get_color", lambda: getattr(nxt, "_Player__color__", "unknown"))()
-        print(f"Turno ahora: {ncolor}")
-
-        prev_idx = _idx_prev_del_actual(game)
-        prev = game.players()[prev_idx]
-        prev_color = getattr(prev, "get_color", lambda: getattr(prev, "_Player__color__", "unknown"))()
-        prev_int = Board.WHITE if prev_color == "white" else Board.BLACK
-        if hasattr(game, "has_won") and game.has_won(prev_int):
-            print(f"¡Victoria de {prev_color}!")
+        do_end_turn(game, journal)
+
+    # Comandos en lote / sesión persistente sobre la misma partida en memoria
+    if args.batch or args.serve:
+        from backgammon.cli.session import Session  # import diferido: sólo para --batch/--serve
+        session = Session(game, journal)
+        if args.batch:
+            session.run_batch(args.batch)
+        else:
+            session.serve(args.serve)
+        game = session.game
 
     # History
     if args.history:
@@ -210,10 +351,7 @@ def main(argv=None):
 
     # Guardar partida (al final, con estado actual)
     if args.save:
-        p = Path(args.save)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        data = game.to_dict()  # formato PLANO (con 'points' en la raíz)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        save_game(game, args.save)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,179 @@
+"""
+Sesión de comandos sobre una partida en memoria (`--batch` y `--serve`).
+
+Un comando por línea, con los mismos nombres que los flags (el `--` inicial
+es opcional) y la misma salida:
+
+    setup | roll [a,b] | list-moves | move o,p | bear-off o,p | end-turn |
+    auto-end-turn | hint PLY | history | status | save RUTA | load RUTA |
+    position-id ID [white|black]
+
+Las líneas vacías y las que empiezan con `#` se ignoran. Como con los
+flags, `list-moves`, `move`, `bear-off`, `end-turn`, `auto-end-turn` y
+`hint` tiran los dados si no hay turno en curso.
+
+- `--batch FILE|-`: corta en el primer error (ValueError con el número de
+  línea).
+- `--serve SOCKET`: atiende conexiones por un socket Unix; cada línea
+  recibida devuelve su salida seguida de `ok` o `error: <mensaje>`, y la
+  partida se conserva entre conexiones (`quit` cierra la conexión,
+  `shutdown` el servidor). Ejemplo: `echo "move 7,3" | nc -U /tmp/bg.sock`.
+"""
+import asyncio
+import contextlib
+import io
+import os
+import stat
+import sys
+
+from backgammon.cli import app
+from backgammon.core.game import BackgammonGame
+
+_NEEDS_TURN = {"list-moves", "move", "bear-off", "end-turn", "auto-end-turn", "hint"}
+
+
+class Session:
+    """Una partida y el intérprete de comandos que la modifica (con `journal`, autoguardada)."""
+
+    def __init__(self, game: BackgammonGame, journal=None):
+        self.game = game
+        self.journal = journal
+        self.__commands__ = {
+            "setup": lambda arg: app.do_setup(self.game, self.journal),
+            "roll": self.__roll__,
+            "list-moves": lambda arg: app.do_list_moves(self.game),
+            "move": lambda arg: app.do_move(self.game, arg, self.journal),
+            "bear-off": lambda arg: app.do_bear_off(self.game, arg, self.journal),
+            "end-turn": lambda arg: app.do_end_turn(self.game, self.journal),
+            "auto-end-turn": lambda arg: app.do_auto_end_turn(self.game, self.journal),
+            "hint": self.__hint__,
+            "history": lambda arg: app._print_history(self.game),
+            "status": lambda arg: app._print_status(self.game),
+            "save": self.__save__,
+            "load": self.__load__,
+            "position-id": self.__position_id__,
+        }
+
+    # ---------- comandos ----------
+    def execute(self, line: str) -> bool:
+        """Ejecuta una línea (salida por stdout). False si era vacía o comentario."""
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return False
+        cmd, _, arg = line.partition(" ")
+        cmd = cmd.removeprefix("--")
+        arg = arg.strip()
+        if cmd not in self.__commands__:
+            raise ValueError(f"Comando desconocido: {cmd}")
+        if cmd in _NEEDS_TURN:
+            app.ensure_turn(self.game, self.journal)
+        self.__commands__[cmd](arg)
+        return True
+
+    def __roll__(self, arg: str):
+        app.do_roll(self.game, app._roll_from_arg(arg) if arg else None, self.journal)
+
+    def __hint__(self, arg: str):
+        if arg not in ("0", "1", "2"):
+            raise ValueError("hint requiere PLY 0, 1 o 2")
+        app._print_hint(self.game, int(arg))
+
+    def __save__(self, arg: str):
+        if not arg:
+            raise ValueError("save requiere una ruta")
+        app.save_game(self.game, arg)
+        print(f"Guardado: {arg}")
+
+    def __load__(self, arg: str):
+        if not arg:
+            raise ValueError("load requiere una ruta")
+        self.game = app.load_game(arg)
+        self.__rebase__()
+        print(f"Cargado: {arg}")
+
+    def __position_id__(self, arg: str):
+        pid, _, color = arg.partition(" ")
+        self.game = BackgammonGame.from_position_id(pid, color.strip() or "white")
+        self.__rebase__()
+        print(f"Position ID: {self.game.to_position_id()}")
+
+    def __rebase__(self):
+        # partida nueva en memoria: el journal vuelve a empezar desde un checkpoint
+        if self.journal is not None:
+            self.journal.checkpoint(self.game)
+
+    # ---------- --batch ----------
+    def run_batch(self, source: str) -> int:
+        """Ejecuta los comandos de un archivo (o stdin con '-'); devuelve cuántos se ejecutaron."""
+        if source == "-":
+            return self.run_lines(sys.stdin)
+        if not os.path.exists(source):
+            raise ValueError(f"Archivo de comandos no existe: {source}")
+        with open(source, encoding="utf-8") as f:
+            return self.run_lines(f)
+
+    def run_lines(self, lines) -> int:
+        done = 0
+        for n, line in enumerate(lines, 1):
+            try:
+                done += self.execute(line)
+            except ValueError as e:
+                raise ValueError(f"Línea {n}: {e}") from e
+        return done
+
+    # ---------- --serve ----------
+    def respond(self, line: str) -> str:
+        """Salida de un comando + `ok` o `error: ...` (protocolo de --serve)."""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            try:
+                self.execute(line)
+                status = "ok"
+            except (ValueError, OSError) as e:   # p. ej. el journal en un disco lleno: el cliente sigue
+                status = f"error: {e}"
+        return out.getvalue() + status + "\n"
+
+    async def __client__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, stop: asyncio.Event):
+        try:
+            while not stop.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").strip()
+                if text == "quit":
+                    break
+                if text == "shutdown":
+                    writer.write(b"ok\n")
+                    stop.set()
+                    break
+                # comandos síncronos: nunca se ejecutan dos a la vez sobre la partida
+                writer.write(self.respond(text).encode())
+                await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve_async(self, path: str) -> None:
+        stop = asyncio.Event()
+        if os.path.exists(path):
+            # sólo se reemplaza un socket viejo, nunca un archivo común
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise ValueError(f"La ruta existe y no es un socket: {path}")
+            os.unlink(path)
+        server = await asyncio.start_unix_server(lambda r, w: self.__client__(r, w, stop), path)
+        print(f"Sesión escuchando en {path}", flush=True)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def serve(self, path: str) -> None:
+        """Bloquea atendiendo el socket hasta `shutdown` (o Ctrl-C)."""
+        try:
+            asyncio.run(self.serve_async(path))
+        except KeyboardInterrupt:
+            pass
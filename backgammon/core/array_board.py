@@ -0,0 +1,487 @@
+from array import array
+
+from backgammon.core import position_id, tables
+from backgammon.core.zobrist import BAR_KEYS, MAX_COUNT, OFF_KEYS, POINT_KEYS, board_hash
+
+
+class ArrayBoard:
+    """
+    Tablero compacto para motores y self-play.
+
+    Misma API pública que `Board` (UI/CLI pueden usarlo sin cambios), pero el
+    estado vive en un `array('b')` fijo de 26 celdas:
+    - 0..23: puntos con signo (positivo = WHITE, negativo = BLACK)
+    - 24: fichas de WHITE en barra
+    - 25: fichas de BLACK en barra
+
+    Además expone una API interna *sin validaciones* (métodos `_...`) pensada
+    para generadores de movimientos: asume índices, pips y colores válidos.
+    """
+    __slots__ = (
+        "__cells__", "__white_off__", "__black_off__",
+        # contadores incrementales (ver Board.__reset_counters__)
+        "__white_total__", "__black_total__", "__white_pips__", "__black_pips__",
+        "__white_outside__", "__black_outside__", "__white_back__", "__black_back__",
+        "__zobrist__",
+    )
+
+    NUM_POINTS = 24
+    WHITE = 1
+    BLACK = -1
+    WHITE_BAR = 24
+    BLACK_BAR = 25
+
+    def __init__(self):
+        self.__cells__ = array("b", bytes(26))
+        self.__white_off__ = 0
+        self.__black_off__ = 0
+        self.__reset_counters__()
+
+    # ---------- contadores incrementales ----------
+    def __reset_counters__(self) -> None:
+        c = self.__cells__
+        p = c[:24]
+        self.__white_total__ = sum(v for v in p if v > 0)
+        self.__black_total__ = sum(-v for v in p if v < 0)
+        self.__white_pips__ = sum(v * (i + 1) for i, v in enumerate(p) if v > 0) + 25 * c[24]
+        self.__black_pips__ = sum(-v * (24 - i) for i, v in enumerate(p) if v < 0) + 25 * c[25]
+        self.__white_outside__ = sum(v for v in p[6:] if v > 0) + c[24]
+        self.__black_outside__ = sum(-v for v in p[:18] if v < 0) + c[25]
+        self.__white_back__ = max((i for i, v in enumerate(p) if v > 0), default=-1)
+        self.__black_back__ = min((i for i, v in enumerate(p) if v < 0), default=24)
+        self.__zobrist__ = board_hash(p, c[24], c[25], self.__white_off__, self.__black_off__)
+
+    def __write__(self, idx: int, new: int) -> None:
+        """Escribe un punto (sin validar) actualizando los contadores."""
+        c = self.__cells__
+        old = c[idx]
+        c[idx] = new
+        keys = POINT_KEYS[idx]
+        self.__zobrist__ ^= keys[old + MAX_COUNT] ^ keys[new + MAX_COUNT]
+        if old > 0:
+            self.__white_total__ -= old
+            self.__white_pips__ -= old * (idx + 1)
+            if idx >= 6:
+                self.__white_outside__ -= old
+            if new <= 0 and idx == self.__white_back__:
+                i = idx - 1
+                while i >= 0 and c[i] <= 0:
+                    i -= 1
+                self.__white_back__ = i
+        elif old < 0:
+            self.__black_total__ += old
+            self.__black_pips__ += old * (24 - idx)
+            if idx < 18:
+                self.__black_outside__ += old
+            if new >= 0 and idx == self.__black_back__:
+                i = idx + 1
+                while i < 24 and c[i] >= 0:
+                    i += 1
+                self.__black_back__ = i
+        if new > 0:
+            self.__white_total__ += new
+            self.__white_pips__ += new * (idx + 1)
+            if idx >= 6:
+                self.__white_outside__ += new
+            if idx > self.__white_back__:
+                self.__white_back__ = idx
+        elif new < 0:
+            self.__black_total__ -= new
+            self.__black_pips__ -= new * (24 - idx)
+            if idx < 18:
+                self.__black_outside__ -= new
+            if idx < self.__black_back__:
+                self.__black_back__ = idx
+
+    def __add_bar__(self, color: int, n: int) -> None:
+        slot = 24 if color == 1 else 25
+        old = self.__cells__[slot]
+        keys = BAR_KEYS[slot - 24]
+        self.__zobrist__ ^= keys[old] ^ keys[old + n]
+        if color == 1:
+            self.__cells__[24] += n
+            self.__white_pips__ += 25 * n
+            self.__white_outside__ += n
+        else:
+            self.__cells__[25] += n
+            self.__black_pips__ += 25 * n
+            self.__black_outside__ += n
+
+    def pip_count(self, color: int) -> int:
+        """Pips que le faltan al color para retirar todo (barra = 25)."""
+        self.__check_color__(color)
+        return self.__white_pips__ if color == self.WHITE else self.__black_pips__
+
+    def outside_home_count(self, color: int) -> int:
+        """Fichas del color fuera de su home (incluye barra)."""
+        self.__check_color__(color)
+        return self.__white_outside__ if color == self.WHITE else self.__black_outside__
+
+    def zobrist_hash(self) -> int:
+        """Hash Zobrist de 64 bits de la posición (puntos, barras y off)."""
+        return self.__zobrist__
+
+    def farthest_back(self, color: int):
+        """Ver `Board.farthest_back` (24/-1 = barra, None si no quedan fichas)."""
+        self.__check_color__(color)
+        if color == self.WHITE:
+            if self.__cells__[24]:
+                return 24
+            return self.__white_back__ if self.__white_back__ >= 0 else None
+        if self.__cells__[25]:
+            return -1
+        return self.__black_back__ if self.__black_back__ < 24 else None
+
+    # ---------- utilidades básicas ----------
+    def num_points(self) -> int:
+        return self.NUM_POINTS
+
+    def __check_index__(self, idx: int):
+        if not isinstance(idx, int):
+            raise TypeError("El índice debe ser int")
+        if not (0 <= idx < self.NUM_POINTS):
+            raise ValueError("Índice fuera de rango")
+
+    def __check_color__(self, color: int):
+        if color != self.WHITE and color != self.BLACK:
+            raise ValueError("Color inválido")
+
+    def copy(self) -> "ArrayBoard":
+        b = ArrayBoard()
+        b.__cells__ = array("b", self.__cells__)
+        b.__white_off__ = self.__white_off__
+        b.__black_off__ = self.__black_off__
+        b.__white_total__ = self.__white_total__
+        b.__black_total__ = self.__black_total__
+        b.__white_pips__ = self.__white_pips__
+        b.__black_pips__ = self.__black_pips__
+        b.__white_outside__ = self.__white_outside__
+        b.__black_outside__ = self.__black_outside__
+        b.__white_back__ = self.__white_back__
+        b.__black_back__ = self.__black_back__
+        b.__zobrist__ = self.__zobrist__
+        return b
+
+    # ---------- position ID ----------
+    def to_position_id(self, color: int = WHITE) -> str:
+        """Position ID de 14 caracteres (estilo GNUbg) desde el lado de `color`."""
+        return position_id.board_to_id(self, color)
+
+    @classmethod
+    def from_position_id(cls, pid: str, color: int = WHITE) -> "ArrayBoard":
+        return position_id.load_into(cls(), pid, color)
+
+    def get_point(self, idx: int) -> int:
+        self.__check_index__(idx)
+        return self.__cells__[idx]
+
+    def set_point(self, idx: int, value: int) -> None:
+        self.__check_index__(idx)
+        value = int(value)
+        if not (-MAX_COUNT <= value <= MAX_COUNT):
+            raise ValueError("Cantidad de fichas fuera de rango")
+        self.__write__(idx, value)
+
+    def owner_at(self, idx: int) -> int:
+        self.__check_index__(idx)
+        v = self.__cells__[idx]
+        if v > 0: return self.WHITE
+        if v < 0: return self.BLACK
+        return 0
+
+    def count_at(self, idx: int) -> int:
+        self.__check_index__(idx)
+        return abs(self.__cells__[idx])
+
+    def count_total(self, color: int) -> int:
+        """Total de fichas del color en tablero (excluye barra y off)."""
+        if color == self.WHITE:
+            return self.__white_total__
+        elif color == self.BLACK:
+            return self.__black_total__
+        raise ValueError("Color inválido")
+
+    # ---------- barra ----------
+    def bar_count(self, color: int) -> int:
+        if color == self.WHITE:
+            return self.__cells__[24]
+        elif color == self.BLACK:
+            return self.__cells__[25]
+        raise ValueError("Color inválido")
+
+    def set_bar(self, color: int, n: int) -> None:
+        self.__check_color__(color)
+        if n < 0:
+            raise ValueError("Cantidad inválida")
+        self.__add_bar__(color, int(n) - self._bar(color))
+
+    def _inc_bar(self, color: int) -> None:
+        self.__check_color__(color)
+        self.__add_bar__(color, 1)
+
+    def _dec_bar(self, color: int) -> None:
+        self.__check_color__(color)
+        if self._bar(color) <= 0:
+            raise ValueError("Barra blanca vacía" if color == self.WHITE else "Barra negra vacía")
+        self.__add_bar__(color, -1)
+
+    # ---------- borne-off / off ----------
+    def off_count(self, color: int) -> int:
+        if color == self.WHITE:
+            return self.__white_off__
+        elif color == self.BLACK:
+            return self.__black_off__
+        raise ValueError("Color inválido")
+
+    # alias de compatibilidad
+    def borne_off_count(self, color: int) -> int:
+        return self.off_count(color)
+
+    def set_off(self, color: int, n: int) -> None:
+        self.__check_color__(color)
+        if n < 0:
+            raise ValueError("Cantidad inválida")
+        self._inc_off(color, int(n) - self.off_count(color))
+
+    def _inc_off(self, color: int, n: int = 1) -> None:
+        self.__check_color__(color)
+        if color == self.WHITE:
+            keys = OFF_KEYS[0]
+            self.__zobrist__ ^= keys[self.__white_off__] ^ keys[self.__white_off__ + n]
+            self.__white_off__ += n
+        else:
+            keys = OFF_KEYS[1]
+            self.__zobrist__ ^= keys[self.__black_off__] ^ keys[self.__black_off__ + n]
+            self.__black_off__ += n
+
+    # ---------- setup ----------
+    def setup_initial(self) -> None:
+        c = array("b", bytes(26))
+        c[23] = 2; c[12] = 5; c[7] = 3; c[5] = 5
+        c[0] = -2; c[11] = -5; c[16] = -3; c[18] = -5
+        self.__cells__ = c
+        self.__white_off__ = 0
+        self.__black_off__ = 0
+        self.__reset_counters__()
+
+    # ---------- reglas de bloqueo ----------
+    def is_blocked(self, idx: int, mover_color: int) -> bool:
+        """Punto bloqueado si tiene 2+ fichas del rival."""
+        self.__check_index__(idx)
+        self.__check_color__(mover_color)
+        return self.__cells__[idx] * mover_color <= -2
+
+    # ---------- destinos / movimiento normal ----------
+    def dest_from(self, origin: int, pip: int, mover_color: int) -> int:
+        self.__check_index__(origin)
+        if not isinstance(pip, int) or pip <= 0:
+            raise ValueError("Pip inválido")
+        self.__check_color__(mover_color)
+        dest = tables.dest(origin, pip, mover_color)
+        if dest is tables.OFF:
+            raise ValueError("Destino fuera de tablero")
+        return dest
+
+    def can_move(self, origin: int, pip: int, mover_color: int) -> bool:
+        self.__check_color__(mover_color)
+        self.__check_index__(origin)
+        if not isinstance(pip, int) or pip <= 0:
+            return False
+        return self._legal_dest(origin, pip, mover_color) >= 0
+
+    def move(self, origin: int, pip: int, mover_color: int) -> int:
+        if not self.can_move(origin, pip, mover_color):
+            raise ValueError("Movimiento inválido para el estado actual del tablero")
+        dest = tables.DEST[mover_color][origin][pip]
+        self._move(origin, dest, mover_color)
+        return dest
+
+    # ---------- entrada desde barra ----------
+    def entry_index(self, pip: int, color: int) -> int:
+        """
+        Punto de entrada desde barra:
+          - WHITE entra en 23..18 => 24 - pip
+          - BLACK entra en 0..5   => pip - 1
+        """
+        if not isinstance(pip, int) or pip <= 0:
+            raise ValueError("Pip inválido")
+        self.__check_color__(color)
+        dest = tables.entry(pip, color)
+        if dest is tables.OFF:
+            raise ValueError("Destino fuera de tablero")
+        return dest
+
+    def can_enter(self, pip: int, color: int) -> bool:
+        self.__check_color__(color)
+        if not isinstance(pip, int) or pip <= 0:
+            return False
+        return self._entry_dest(pip, color) >= 0
+
+    def enter_from_bar(self, pip: int, color: int) -> int:
+        if not self.can_enter(pip, color):
+            raise ValueError("No se puede entrar con ese pip/color")
+        dest = tables.ENTRY[color][pip]
+        self._enter(dest, color)
+        return dest
+
+    # ---------- home / bear-off ----------
+    def home_indices(self, color: int):
+        """Indices de home por color (para reglas de bear-off)."""
+        if color == self.WHITE:
+            return range(0, 6)
+        elif color == self.BLACK:
+            return range(18, 24)
+        raise ValueError("Color inválido")
+
+    # alias de compatibilidad (algunos códigos esperan "home_range")
+    def home_range(self, color: int):
+        return self.home_indices(color)
+
+    def all_in_home(self, color: int) -> bool:
+        """¿Todas las fichas del color están en su home (y no en barra)?"""
+        self.__check_color__(color)
+        return self._all_in_home(color)
+
+    def can_bear_off(self, origin: int, pip: int, color: int) -> bool:
+        """
+        Regla estándar (idéntica a `Board.can_bear_off`):
+        exacto si origin±pip sale justo del tablero; no-exacto si además
+        no quedan fichas propias en puntos más alejados del home.
+        """
+        self.__check_color__(color)
+        if not isinstance(pip, int) or pip <= 0:
+            raise ValueError("Pip inválido")
+        self.__check_index__(origin)
+        if self.__cells__[origin] * color <= 0:
+            return False
+        if not self._all_in_home(color):
+            return False
+        return self._can_bear_off(origin, pip, color)
+
+    def bear_off(self, origin: int, pip: int, color: int) -> None:
+        if not self.can_bear_off(origin, pip, color):
+            raise ValueError("No se puede hacer bear-off desde ese origen/pip")
+        self._bear_off(origin, color)
+
+    # ---------- API interna sin validaciones (generadores) ----------
+    def _point(self, idx: int) -> int:
+        return self.__cells__[idx]
+
+    def _state_key(self) -> tuple:
+        """Clave hashable de la posición (puntos y barras, más off)."""
+        return (self.__cells__.tobytes(), self.__white_off__, self.__black_off__)
+
+    def _bar(self, color: int) -> int:
+        return self.__cells__[24 if color == 1 else 25]
+
+    def _legal_dest(self, origin: int, pip: int, color: int) -> int:
+        """Destino de un movimiento normal legal o -1 (incluye regla de barra)."""
+        c = self.__cells__
+        if c[24 if color == 1 else 25] or c[origin] * color <= 0:
+            return -1
+        dest = tables.dest(origin, pip, color)
+        if dest is None or c[dest] * color <= -2:
+            return -1
+        return dest
+
+    def _entry_dest(self, pip: int, color: int) -> int:
+        """Punto de entrada legal desde barra o -1."""
+        c = self.__cells__
+        if not c[24 if color == 1 else 25]:
+            return -1
+        dest = tables.entry(pip, color)
+        if dest is None or c[dest] * color <= -2:
+            return -1
+        return dest
+
+    def _all_in_home(self, color: int) -> bool:
+        return (self.__white_outside__ if color == 1 else self.__black_outside__) == 0
+
+    def _can_bear_off(self, origin: int, pip: int, color: int) -> bool:
+        """Asume ficha propia en origin y todas en home."""
+        d = tables.BEAR_DIST[color][origin]
+        if pip < d:
+            return False
+        return pip == d or (self.__white_back__ if color == 1 else self.__black_back__) == origin
+
+    def _land(self, dest: int, color: int) -> bool:
+        c = self.__cells__
+        if c[dest] == -color:
+            self.__write__(dest, color)
+            self.__add_bar__(-color, 1)
+            return True
+        self.__write__(dest, c[dest] + color)
+        return False
+
+    def _move(self, origin: int, dest: int, color: int) -> bool:
+        """Aplica origin->dest sin validar. Devuelve True si golpeó un blot."""
+        self.__write__(origin, self.__cells__[origin] - color)
+        return self._land(dest, color)
+
+    def _enter(self, dest: int, color: int) -> bool:
+        """Entra desde barra en dest sin validar. Devuelve True si golpeó."""
+        self.__add_bar__(color, -1)
+        return self._land(dest, color)
+
+    def _bear_off(self, origin: int, color: int) -> None:
+        self.__write__(origin, self.__cells__[origin] - color)
+        self._inc_off(color, 1)
+
+    def _undo(self, kind: str, origin: int, dest, color: int, hit: bool) -> None:
+        """Revierte un paso ("move" | "enter" | "off"); ver `Board._undo`."""
+        c = self.__cells__
+        if kind == "off":
+            self.__write__(origin, c[origin] + color)
+            self._inc_off(color, -1)
+            return
+        if hit:
+            self.__write__(dest, -color)
+            self.__add_bar__(-color, -1)
+        else:
+            self.__write__(dest, c[dest] - color)
+        if kind == "enter":
+            self.__add_bar__(color, 1)
+        else:
+            self.__write__(origin, c[origin] + color)
+
+    def _single_moves(self, color: int, pips) -> list:
+        """
+        Movimientos normales/entradas legales como (origin, dest, pip), en el
+        mismo orden que `BackgammonGame.legal_moves` (pips ordenados y únicos).
+        """
+        c = self.__cells__
+        res = []
+        if c[24 if color == 1 else 25]:
+            entry = tables.ENTRY[color]
+            for pip in pips:
+                dest = entry[pip]
+                if dest is not None and c[dest] * color > -2:
+                    res.append((-1, dest, pip))
+            return res
+        dests = tables.DEST[color]
+        for origin in range(24):
+            if c[origin] * color <= 0:
+                continue
+            row = dests[origin]
+            for pip in pips:
+                dest = row[pip]
+                if dest is not None and c[dest] * color > -2:
+                    res.append((origin, dest, pip))
+        return res
+
+    def _bear_off_steps(self, color: int, pips) -> list:
+        """Bear-offs legales como (origin, None, pip); ver `Board._bear_off_steps`."""
+        if self.__cells__[24 if color == 1 else 25] or not self._all_in_home(color):
+            return []
+        c = self.__cells__
+        dist = tables.BEAR_DIST[color]
+        back = self.__white_back__ if color == 1 else self.__black_back__
+        res = []
+        for origin in (range(0, 6) if color == 1 else range(18, 24)):
+            if c[origin] * color <= 0:
+                continue
+            d = dist[origin]
+            for pip in pips:
+                if pip == d or (pip > d and origin == back):
+                    res.append((origin, None, pip))
+        return res
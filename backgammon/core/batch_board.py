@@ -0,0 +1,180 @@
+"""
+BatchBoard: N posiciones en un único arreglo NumPy (N, 26) int8.
+
+Misma convención que `ArrayBoard`: columnas 0..23 = puntos con signo
+(positivo = WHITE, negativo = BLACK), 24 = barra WHITE, 25 = barra BLACK.
+Las fichas retiradas (off) se derivan como 15 - tablero - barra.
+
+Las consultas devuelven arreglos de N elementos (o máscaras (N, 24)) para
+extraer features y filtrar legalidad sin una llamada Python por punto.
+"""
+import numpy as np
+
+from backgammon.core.board import Board
+
+NUM_SLOTS = 26
+WHITE_BAR = 24
+BLACK_BAR = 25
+CHECKERS = 15
+
+_IDX = np.arange(24)
+# pips por punto según color: WHITE en idx i debe recorrer i+1; BLACK 24-i
+_PIP_WEIGHTS = {Board.WHITE: _IDX + 1, Board.BLACK: 24 - _IDX}
+_HOME = {Board.WHITE: slice(0, 6), Board.BLACK: slice(18, 24)}
+_OUTSIDE = {Board.WHITE: slice(6, 24), Board.BLACK: slice(0, 18)}
+
+
+def _check_color(color: int) -> None:
+    if color not in (Board.WHITE, Board.BLACK):
+        raise ValueError("Color inválido")
+
+
+class BatchBoard:
+    """Lote de N tableros con consultas vectorizadas."""
+
+    def __init__(self, cells):
+        cells = np.asarray(cells, dtype=np.int8)
+        if cells.ndim != 2 or cells.shape[1] != NUM_SLOTS:
+            raise ValueError("Se espera un arreglo (N, 26)")
+        self.__cells__ = cells
+
+    # ---------- construcción / conversión ----------
+    @classmethod
+    def zeros(cls, n: int) -> "BatchBoard":
+        return cls(np.zeros((n, NUM_SLOTS), dtype=np.int8))
+
+    @classmethod
+    def from_boards(cls, boards) -> "BatchBoard":
+        rows = []
+        for b in boards:
+            rows.append([b.get_point(i) for i in range(24)]
+                        + [b.bar_count(Board.WHITE), b.bar_count(Board.BLACK)])
+        return cls(np.array(rows, dtype=np.int8).reshape(-1, NUM_SLOTS))
+
+    @classmethod
+    def from_dicts(cls, dicts) -> "BatchBoard":
+        """Desde el formato plano de `BackgammonGame.to_dict`."""
+        rows = []
+        for d in dicts:
+            rows.append(list(d.get("points", [0] * 24))
+                        + [d.get("white_bar", 0), d.get("black_bar", 0)])
+        return cls(np.array(rows, dtype=np.int8).reshape(-1, NUM_SLOTS))
+
+    def to_boards(self, board_cls=Board) -> list:
+        res = []
+        off_w = self.off_count(Board.WHITE)
+        off_b = self.off_count(Board.BLACK)
+        for k, row in enumerate(self.__cells__.tolist()):
+            b = board_cls()
+            for i, v in enumerate(row[:24]):
+                if v:
+                    b.set_point(i, v)
+            b.set_bar(Board.WHITE, row[WHITE_BAR])
+            b.set_bar(Board.BLACK, row[BLACK_BAR])
+            b.set_off(Board.WHITE, int(off_w[k]))
+            b.set_off(Board.BLACK, int(off_b[k]))
+            res.append(b)
+        return res
+
+    def to_dicts(self) -> list:
+        """Parte de posición de `to_dict` (puntos, barras y borne-off)."""
+        off_w = self.off_count(Board.WHITE).tolist()
+        off_b = self.off_count(Board.BLACK).tolist()
+        return [
+            {"points": row[:24], "white_bar": row[WHITE_BAR], "black_bar": row[BLACK_BAR],
+             "white_borne_off": off_w[k], "black_borne_off": off_b[k]}
+            for k, row in enumerate(self.__cells__.tolist())
+        ]
+
+    # ---------- acceso ----------
+    def __len__(self) -> int:
+        return self.__cells__.shape[0]
+
+    def cells(self):
+        """Arreglo (N, 26) subyacente (sin copia)."""
+        return self.__cells__
+
+    def points(self):
+        """Vista (N, 24) de los puntos con signo."""
+        return self.__cells__[:, :24]
+
+    def bar_count(self, color: int):
+        _check_color(color)
+        return self.__cells__[:, WHITE_BAR if color == Board.WHITE else BLACK_BAR].astype(np.int16)
+
+    def __own__(self, color: int):
+        """Fichas propias por punto (N, 24), >= 0."""
+        return np.maximum(self.points().astype(np.int16) * color, 0)
+
+    # ---------- consultas vectorizadas ----------
+    def count_total(self, color: int):
+        _check_color(color)
+        return self.__own__(color).sum(axis=1)
+
+    def off_count(self, color: int):
+        return CHECKERS - self.count_total(color) - self.bar_count(color)
+
+    def pip_count(self, color: int):
+        _check_color(color)
+        return self.__own__(color) @ _PIP_WEIGHTS[color] + 25 * self.bar_count(color)
+
+    def all_in_home(self, color: int):
+        _check_color(color)
+        outside = self.__own__(color)[:, _OUTSIDE[color]].sum(axis=1)
+        return (outside + self.bar_count(color)) == 0
+
+    def is_blocked(self, idx: int, mover_color: int):
+        """(N,) bool: el punto idx tiene 2+ fichas rivales."""
+        _check_color(mover_color)
+        if not (0 <= idx < 24):
+            raise ValueError("Índice fuera de rango")
+        return self.__cells__[:, idx].astype(np.int16) * mover_color <= -2
+
+    def blocked_mask(self, mover_color: int):
+        """(N, 24) bool: puntos bloqueados para el color."""
+        _check_color(mover_color)
+        return self.points().astype(np.int16) * mover_color <= -2
+
+    def move_mask(self, pip: int, color: int):
+        """
+        (N, 24) bool por origen: movimiento normal legal con `pip`
+        (ficha propia, destino en tablero no bloqueado y sin fichas en barra).
+        """
+        _check_color(color)
+        n = len(self)
+        own = self.__own__(color) > 0
+        open_ = ~self.blocked_mask(color)
+        dest_ok = np.zeros((n, 24), dtype=bool)
+        if 0 < pip < 24:
+            if color == Board.WHITE:
+                dest_ok[:, pip:] = open_[:, :24 - pip]
+            else:
+                dest_ok[:, :24 - pip] = open_[:, pip:]
+        return own & dest_ok & (self.bar_count(color) == 0)[:, None]
+
+    def enter_mask(self, pip: int, color: int):
+        """(N,) bool: puede entrar desde la barra con `pip`."""
+        _check_color(color)
+        dest = 24 - pip if color == Board.WHITE else pip - 1
+        if not (0 <= dest < 24):
+            return np.zeros(len(self), dtype=bool)
+        return (self.bar_count(color) > 0) & ~self.is_blocked(dest, color)
+
+    def bear_off_mask(self, pip: int, color: int):
+        """(N, 24) bool por origen: bear-off legal con `pip` (exacto o desde el más atrasado)."""
+        _check_color(color)
+        own = self.__own__(color) > 0
+        mask = np.zeros_like(own)
+        home = _HOME[color]
+        home_own = own[:, home]
+        if color == Board.WHITE:
+            # distancia a la salida: idx + 1; más atrasado = mayor índice con ficha
+            dist = np.arange(1, 7)
+            occupied_above = np.flip(np.cumsum(np.flip(home_own, axis=1), axis=1), axis=1) - home_own
+        else:
+            dist = np.arange(6, 0, -1)
+            occupied_above = np.cumsum(home_own, axis=1) - home_own
+        exact = dist == pip
+        inexact = (dist < pip) & (occupied_above == 0)
+        mask[:, home] = home_own & (exact | inexact)
+        return mask & self.all_in_home(color)[:, None]
@@ -1,3 +1,7 @@
+from backgammon.core import position_id, tables
+from backgammon.core.zobrist import BAR_KEYS, MAX_COUNT, OFF_KEYS, POINT_KEYS, board_hash
+
+
 class Board:
     """
     Tablero de Backgammon:
@@ -19,6 +23,119 @@ class Board:
         # Nombres "off" modernos; algunos tests/compat podrían buscar "borne_off"
         self.__white_off__ = 0
         self.__black_off__ = 0
+        self.__reset_counters__()
+
+    # ---------- contadores incrementales ----------
+    def __reset_counters__(self) -> None:
+        """
+        Recalcula desde cero los contadores que move/enter/bear_off/set_point
+        mantienen al día: fichas en tablero, pip count, fichas fuera de home
+        (incluye barra), punto más atrasado por color y hash Zobrist.
+        """
+        p = self.__points__
+        self.__white_total__ = sum(v for v in p if v > 0)
+        self.__black_total__ = sum(-v for v in p if v < 0)
+        self.__white_pips__ = sum(v * (i + 1) for i, v in enumerate(p) if v > 0) + 25 * self.__white_bar__
+        self.__black_pips__ = sum(-v * (24 - i) for i, v in enumerate(p) if v < 0) + 25 * self.__black_bar__
+        self.__white_outside__ = sum(v for v in p[6:] if v > 0) + self.__white_bar__
+        self.__black_outside__ = sum(-v for v in p[:18] if v < 0) + self.__black_bar__
+        # más atrasado en tablero: WHITE = mayor índice (-1 si no hay), BLACK = menor (24 si no hay)
+        self.__white_back__ = max((i for i, v in enumerate(p) if v > 0), default=-1)
+        self.__black_back__ = min((i for i, v in enumerate(p) if v < 0), default=24)
+        self.__zobrist__ = board_hash(p, self.__white_bar__, self.__black_bar__,
+                                      self.__white_off__, self.__black_off__)
+
+    def __write__(self, idx: int, new: int) -> None:
+        """Escribe un punto (sin validar) actualizando los contadores."""
+        p = self.__points__
+        old = p[idx]
+        p[idx] = new
+        keys = POINT_KEYS[idx]
+        self.__zobrist__ ^= keys[old + MAX_COUNT] ^ keys[new + MAX_COUNT]
+        if old > 0:
+            self.__white_total__ -= old
+            self.__white_pips__ -= old * (idx + 1)
+            if idx >= 6:
+                self.__white_outside__ -= old
+        elif old < 0:
+            self.__black_total__ += old
+            self.__black_pips__ += old * (24 - idx)
+            if idx < 18:
+                self.__black_outside__ += old
+        if new > 0:
+            self.__white_total__ += new
+            self.__white_pips__ += new * (idx + 1)
+            if idx >= 6:
+                self.__white_outside__ += new
+            if idx > self.__white_back__:
+                self.__white_back__ = idx
+        elif new < 0:
+            self.__black_total__ -= new
+            self.__black_pips__ -= new * (24 - idx)
+            if idx < 18:
+                self.__black_outside__ -= new
+            if idx < self.__black_back__:
+                self.__black_back__ = idx
+        # si se vació el punto más atrasado, buscar el siguiente hacia el home
+        if old > 0 and new <= 0 and idx == self.__white_back__:
+            i = idx - 1
+            while i >= 0 and p[i] <= 0:
+                i -= 1
+            self.__white_back__ = i
+        elif old < 0 and new >= 0 and idx == self.__black_back__:
+            i = idx + 1
+            while i < 24 and p[i] >= 0:
+                i += 1
+            self.__black_back__ = i
+
+    def __add_bar__(self, color: int, n: int) -> None:
+        if color == self.WHITE:
+            keys = BAR_KEYS[0]
+            self.__zobrist__ ^= keys[self.__white_bar__] ^ keys[self.__white_bar__ + n]
+            self.__white_bar__ += n
+            self.__white_pips__ += 25 * n
+            self.__white_outside__ += n
+        else:
+            keys = BAR_KEYS[1]
+            self.__zobrist__ ^= keys[self.__black_bar__] ^ keys[self.__black_bar__ + n]
+            self.__black_bar__ += n
+            self.__black_pips__ += 25 * n
+            self.__black_outside__ += n
+
+    def pip_count(self, color: int) -> int:
+        """Pips que le faltan al color para retirar todo (barra = 25)."""
+        if color == self.WHITE:
+            return self.__white_pips__
+        elif color == self.BLACK:
+            return self.__black_pips__
+        raise ValueError("Color inválido")
+
+    def outside_home_count(self, color: int) -> int:
+        """Fichas del color fuera de su home (incluye barra)."""
+        if color == self.WHITE:
+            return self.__white_outside__
+        elif color == self.BLACK:
+            return self.__black_outside__
+        raise ValueError("Color inválido")
+
+    def zobrist_hash(self) -> int:
+        """Hash Zobrist de 64 bits de la posición (puntos, barras y off)."""
+        return self.__zobrist__
+
+    def farthest_back(self, color: int):
+        """
+        Índice del punto más alejado del home con fichas del color.
+        Barra: 24 para WHITE, -1 para BLACK. None si no quedan fichas.
+        """
+        if color == self.WHITE:
+            if self.__white_bar__:
+                return 24
+            return self.__white_back__ if self.__white_back__ >= 0 else None
+        elif color == self.BLACK:
+            if self.__black_bar__:
+                return -1
+            return self.__black_back__ if self.__black_back__ < 24 else None
+        raise ValueError("Color inválido")
 
     # ---------- utilidades básicas ----------
     def num_points(self) -> int:
@@ -30,13 +147,43 @@ class Board:
         if not (0 <= idx < self.NUM_POINTS):
             raise ValueError("Índice fuera de rango")
 
+    def copy(self) -> "Board":
+        b = Board()
+        b.__points__ = list(self.__points__)
+        b.__white_bar__ = self.__white_bar__
+        b.__black_bar__ = self.__black_bar__
+        b.__white_off__ = self.__white_off__
+        b.__black_off__ = self.__black_off__
+        b.__white_total__ = self.__white_total__
+        b.__black_total__ = self.__black_total__
+        b.__white_pips__ = self.__white_pips__
+        b.__black_pips__ = self.__black_pips__
+        b.__white_outside__ = self.__white_outside__
+        b.__black_outside__ = self.__black_outside__
+        b.__white_back__ = self.__white_back__
+        b.__black_back__ = self.__black_back__
+        b.__zobrist__ = self.__zobrist__
+        return b
+
+    # ---------- position ID ----------
+    def to_position_id(self, color: int = WHITE) -> str:
+        """Position ID de 14 caracteres (estilo GNUbg) desde el lado de `color`."""
+        return position_id.board_to_id(self, color)
+
+    @classmethod
+    def from_position_id(cls, pid: str, color: int = WHITE) -> "Board":
+        return position_id.load_into(cls(), pid, color)
+
     def get_point(self, idx: int) -> int:
         self.__check_index__(idx)
         return self.__points__[idx]
 
     def set_point(self, idx: int, value: int) -> None:
         self.__check_index__(idx)
-        self.__points__[idx] = int(value)
+        value = int(value)
+        if not (-MAX_COUNT <= value <= MAX_COUNT):
+            raise ValueError("Cantidad de fichas fuera de rango")
+        self.__write__(idx, value)
 
     def owner_at(self, idx: int) -> int:
         self.__check_index__(idx)
@@ -52,9 +199,9 @@ class Board:
     def count_total(self, color: int) -> int:
         """Total de fichas del color en tablero (excluye barra y off)."""
         if color == self.WHITE:
-            return sum(v for v in self.__points__ if v > 0)
+            return self.__white_total__
         elif color == self.BLACK:
-            return sum(-v for v in self.__points__ if v < 0)
+            return self.__black_total__
         raise ValueError("Color inválido")
 
     # ---------- barra ----------
@@ -65,25 +212,26 @@ class Board:
             return self.__black_bar__
         raise ValueError("Color inválido")
 
+    def set_bar(self, color: int, n: int) -> None:
+        if n < 0:
+            raise ValueError("Cantidad inválida")
+        self.__add_bar__(color, int(n) - self.bar_count(color))
+
     def _inc_bar(self, color: int) -> None:
-        if color == self.WHITE:
-            self.__white_bar__ += 1
-        elif color == self.BLACK:
-            self.__black_bar__ += 1
-        else:
+        if color not in (self.WHITE, self.BLACK):
             raise ValueError("Color inválido")
+        self.__add_bar__(color, 1)
 
     def _dec_bar(self, color: int) -> None:
         if color == self.WHITE:
             if self.__white_bar__ <= 0:
                 raise ValueError("Barra blanca vacía")
-            self.__white_bar__ -= 1
         elif color == self.BLACK:
             if self.__black_bar__ <= 0:
                 raise ValueError("Barra negra vacía")
-            self.__black_bar__ -= 1
         else:
             raise ValueError("Color inválido")
+        self.__add_bar__(color, -1)
 
     # ---------- borne-off / off ----------
     def off_count(self, color: int) -> int:
@@ -97,10 +245,19 @@ class Board:
     def borne_off_count(self, color: int) -> int:
         return self.off_count(color)
 
+    def set_off(self, color: int, n: int) -> None:
+        if n < 0:
+            raise ValueError("Cantidad inválida")
+        self._inc_off(color, int(n) - self.off_count(color))
+
     def _inc_off(self, color: int, n: int = 1) -> None:
         if color == self.WHITE:
+            keys = OFF_KEYS[0]
+            self.__zobrist__ ^= keys[self.__white_off__] ^ keys[self.__white_off__ + n]
             self.__white_off__ += n
         elif color == self.BLACK:
+            keys = OFF_KEYS[1]
+            self.__zobrist__ ^= keys[self.__black_off__] ^ keys[self.__black_off__ + n]
             self.__black_off__ += n
         else:
             raise ValueError("Color inválido")
@@ -117,6 +274,7 @@ class Board:
         self.__black_bar__ = 0
         self.__white_off__ = 0
         self.__black_off__ = 0
+        self.__reset_counters__()
 
     # ---------- reglas de bloqueo ----------
     def is_blocked(self, idx: int, mover_color: int) -> bool:
@@ -137,8 +295,8 @@ class Board:
             raise ValueError("Pip inválido")
         if mover_color not in (self.WHITE, self.BLACK):
             raise ValueError("Color inválido")
-        dest = origin - pip if mover_color == self.WHITE else origin + pip
-        if not (0 <= dest < self.NUM_POINTS):
+        dest = tables.dest(origin, pip, mover_color)
+        if dest is tables.OFF:
             raise ValueError("Destino fuera de tablero")
         return dest
 
@@ -150,13 +308,13 @@ class Board:
         # Debe haber ficha propia en origin
         if self.owner_at(origin) != mover_color or self.count_at(origin) == 0:
             return False
-        try:
-            dest = self.dest_from(origin, pip, mover_color)
-        except Exception:
+        if not isinstance(pip, int) or pip <= 0:
             return False
-        if self.is_blocked(dest, mover_color):
+        dest = tables.dest(origin, pip, mover_color)
+        if dest is tables.OFF:
             return False
-        return True  # vacío, propio o blot rival (1)
+        # vacío, propio o blot rival (1); bloqueado con 2+ rivales
+        return self.__points__[dest] * mover_color > -2
 
     def move(self, origin: int, pip: int, mover_color: int) -> int:
         if not self.can_move(origin, pip, mover_color):
@@ -164,29 +322,22 @@ class Board:
         dest = self.dest_from(origin, pip, mover_color)
 
         # Quitar del origen
-        v = self.__points__[origin]
-        if mover_color == self.WHITE:
-            self.__points__[origin] = v - 1
-        else:
-            self.__points__[origin] = v + 1
+        self.__write__(origin, self.__points__[origin] - mover_color)
 
         # Gestionar destino (hit si blot rival)
-        dv = self.__points__[dest]
-        if mover_color == self.WHITE:
-            if dv == -1:
-                self.__points__[dest] = 1
-                self._inc_bar(self.BLACK)
-            else:
-                self.__points__[dest] = dv + 1
-        else:
-            if dv == 1:
-                self.__points__[dest] = -1
-                self._inc_bar(self.WHITE)
-            else:
-                self.__points__[dest] = dv - 1
-
+        self.__land__(dest, mover_color)
         return dest
 
+    def __land__(self, dest: int, color: int) -> bool:
+        """Coloca una ficha del color en dest; si hay blot rival lo manda a barra."""
+        dv = self.__points__[dest]
+        if dv == -color:
+            self.__write__(dest, color)
+            self.__add_bar__(-color, 1)
+            return True
+        self.__write__(dest, dv + color)
+        return False
+
     # ---------- entrada desde barra ----------
     def entry_index(self, pip: int, color: int) -> int:
         """
@@ -196,13 +347,10 @@ class Board:
         """
         if not isinstance(pip, int) or pip <= 0:
             raise ValueError("Pip inválido")
-        if color == self.WHITE:
-            dest = 24 - pip
-        elif color == self.BLACK:
-            dest = pip - 1
-        else:
+        if color not in (self.WHITE, self.BLACK):
             raise ValueError("Color inválido")
-        if not (0 <= dest < self.NUM_POINTS):
+        dest = tables.entry(pip, color)
+        if dest is tables.OFF:
             raise ValueError("Destino fuera de tablero")
         return dest
 
@@ -211,35 +359,21 @@ class Board:
             raise ValueError("Color inválido")
         if self.bar_count(color) <= 0:
             return False
-        try:
-            dest = self.entry_index(pip, color)
-        except Exception:
+        if not isinstance(pip, int) or pip <= 0:
             return False
-        if self.is_blocked(dest, color):
+        dest = tables.entry(pip, color)
+        if dest is tables.OFF:
             return False
-        return True
+        return self.__points__[dest] * color > -2
 
     def enter_from_bar(self, pip: int, color: int) -> int:
         if not self.can_enter(pip, color):
             raise ValueError("No se puede entrar con ese pip/color")
         dest = self.entry_index(pip, color)
-        dv = self.__points__[dest]
 
         # sale de barra
         self._dec_bar(color)
-
-        if color == self.WHITE:
-            if dv == -1:
-                self.__points__[dest] = 1
-                self._inc_bar(self.BLACK)
-            else:
-                self.__points__[dest] = dv + 1
-        else:
-            if dv == 1:
-                self.__points__[dest] = -1
-                self._inc_bar(self.WHITE)
-            else:
-                self.__points__[dest] = dv - 1
+        self.__land__(dest, color)
         return dest
 
     # ---------- home / bear-off ----------
@@ -257,21 +391,8 @@ class Board:
 
     def all_in_home(self, color: int) -> bool:
         """¿Todas las fichas del color están en su home (y no en barra)?"""
-        if self.bar_count(color) > 0:
-            return False
-        total = self.count_total(color)
-        if total == 0:
-            # Si no hay fichas en tablero, o están todas borne-off, también vale
-            return True
-        rng = self.home_indices(color)
-        home_total = 0
-        for i in rng:
-            v = self.get_point(i)
-            if color == self.WHITE and v > 0:
-                home_total += v
-            elif color == self.BLACK and v < 0:
-                home_total += -v
-        return home_total == total
+        # sin fichas en tablero (o todas borne-off) también vale
+        return self.outside_home_count(color) == 0
 
     def can_bear_off(self, origin: int, pip: int, color: int) -> bool:
         """
@@ -291,37 +412,94 @@ class Board:
         if not self.all_in_home(color):
             return False
 
-        try:
-            # si el destino cae fuera del tablero en dirección de salida -> exacto
-            _ = self.dest_from(origin, pip, color)
-            # si no cae fuera, es que quedaría en tablero. Para bear-off exacto,
-            # únicamente se podría si ese destino fuera "más allá" (pero aquí no lo es)
+        # si el destino queda en tablero no es bear-off
+        if tables.dest(origin, pip, color) is not tables.OFF:
             return False
-        except ValueError:
-            #significa "cae fuera", puede ser off exacto o no-exacto
-            pass
 
-        # no-exacto: permitido si no hay fichas en puntos más alejados
-        if color == self.WHITE:
-            # WHITE sale por debajo de 0; puntos "más alejados" son los de mayor índice dentro de home
-            # Si saco desde 'origin', no debe haber fichas en indices > origin dentro de [0..5]
-            higher_has = any(self.owner_at(i) == self.WHITE and self.count_at(i) > 0 for i in range(origin + 1, 6))
-            return not higher_has
-        else:
-            # BLACK sale por encima de 23; puntos "más alejados" son los de menor índice dentro de home
-            # No debe haber fichas en indices < origin dentro de [18..23]
-            lower_has = any(self.owner_at(i) == self.BLACK and self.count_at(i) > 0 for i in range(18, origin))
-            return not lower_has
+        # exacto: sale justo del tablero, siempre permitido
+        if pip == tables.BEAR_DIST[color][origin]:
+            return True
+
+        # no-exacto: permitido si origin es el punto más atrasado del color
+        # (WHITE: no hay fichas en índices > origin; BLACK: ninguna en índices < origin)
+        return self.farthest_back(color) == origin
 
     def bear_off(self, origin: int, pip: int, color: int) -> None:
         if not self.can_bear_off(origin, pip, color):
             raise ValueError("No se puede hacer bear-off desde ese origen/pip")
         # quitar del origin
-        v = self.get_point(origin)
-        if color == self.WHITE:
-            self.set_point(origin, v - 1)
-            self._inc_off(self.WHITE, 1)
+        self.__write__(origin, self.__points__[origin] - color)
+        self._inc_off(color, 1)
+
+    # ---------- API interna sin validaciones (generadores) ----------
+    def _state_key(self) -> tuple:
+        """Clave hashable de la posición (puntos, barras y off)."""
+        return (tuple(self.__points__), self.__white_bar__, self.__black_bar__,
+                self.__white_off__, self.__black_off__)
+
+    def _undo(self, kind: str, origin: int, dest, color: int, hit: bool) -> None:
+        """
+        Revierte un paso ya aplicado ("move" | "enter" | "off") sin copiar el
+        tablero; `hit` indica si el paso golpeó un blot rival.
+        """
+        p = self.__points__
+        if kind == "off":
+            self.__write__(origin, p[origin] + color)
+            self._inc_off(color, -1)
+            return
+        if hit:
+            self.__write__(dest, -color)
+            self.__add_bar__(-color, -1)
         else:
-            self.set_point(origin, v + 1)
-            self._inc_off(self.BLACK, 1)
+            self.__write__(dest, p[dest] - color)
+        if kind == "enter":
+            self.__add_bar__(color, 1)
+        else:
+            self.__write__(origin, p[origin] + color)
 
+    def _single_moves(self, color: int, pips) -> list:
+        """
+        Movimientos normales/entradas legales como (origin, dest, pip) sin
+        validar argumentos; `pips` debe venir ordenado y sin repetidos.
+        """
+        p = self.__points__
+        res = []
+        bar = self.__white_bar__ if color == self.WHITE else self.__black_bar__
+        if bar:
+            entry = tables.ENTRY[color]
+            for pip in pips:
+                dest = entry[pip]
+                if dest is not None and p[dest] * color > -2:
+                    res.append((-1, dest, pip))
+            return res
+        dests = tables.DEST[color]
+        for origin in range(self.NUM_POINTS):
+            if p[origin] * color <= 0:
+                continue
+            row = dests[origin]
+            for pip in pips:
+                dest = row[pip]
+                if dest is not None and p[dest] * color > -2:
+                    res.append((origin, dest, pip))
+        return res
+
+    def _bear_off_steps(self, color: int, pips) -> list:
+        """
+        Bear-offs legales como (origin, None, pip), mismo orden que
+        `BackgammonGame.legal_bear_off_moves`; `pips` ordenado y sin repetidos.
+        """
+        bar = self.__white_bar__ if color == self.WHITE else self.__black_bar__
+        if bar or self.outside_home_count(color):
+            return []
+        p = self.__points__
+        dist = tables.BEAR_DIST[color]
+        back = self.farthest_back(color)
+        res = []
+        for origin in self.home_indices(color):
+            if p[origin] * color <= 0:
+                continue
+            d = dist[origin]
+            for pip in pips:
+                if pip == d or (pip > d and origin == back):
+                    res.append((origin, None, pip))
+        return res
@@ -0,0 +1,79 @@
+"""
+Caché LRU acotada con contadores de aciertos/fallos.
+
+La usa `BackgammonGame` para memoizar movimientos legales por
+(hash de posición + color, pips restantes): como el hash Zobrist cambia con
+cada `apply_move`/`set_point`, una entrada vieja nunca vuelve a consultarse
+(no hace falta invalidar a mano) y la política LRU la termina desalojando.
+"""
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Diccionario acotado: al superar `maxsize` se descarta la entrada menos usada."""
+
+    def __init__(self, maxsize: int = 1024):
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize debe ser un entero positivo")
+        self.__maxsize__ = maxsize
+        self.__data__ = OrderedDict()
+        self.__hits__ = 0
+        self.__misses__ = 0
+
+    def get(self, key, default=None):
+        value = self.__data__.get(key, _MISSING)
+        if value is _MISSING:
+            self.__misses__ += 1
+            return default
+        self.__data__.move_to_end(key)
+        self.__hits__ += 1
+        return value
+
+    def put(self, key, value) -> None:
+        data = self.__data__
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.__maxsize__:
+            data.popitem(last=False)
+
+    def __contains__(self, key) -> bool:
+        return key in self.__data__
+
+    def __len__(self) -> int:
+        return len(self.__data__)
+
+    def maxsize(self) -> int:
+        return self.__maxsize__
+
+    def resize(self, maxsize: int) -> None:
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize debe ser un entero positivo")
+        self.__maxsize__ = maxsize
+        while len(self.__data__) > maxsize:
+            self.__data__.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vacía las entradas (los contadores se conservan)."""
+        self.__data__.clear()
+
+    def hits(self) -> int:
+        return self.__hits__
+
+    def misses(self) -> int:
+        return self.__misses__
+
+    def reset_stats(self) -> None:
+        self.__hits__ = 0
+        self.__misses__ = 0
+
+    def stats(self) -> dict:
+        total = self.__hits__ + self.__misses__
+        return {
+            "size": len(self.__data__),
+            "maxsize": self.__maxsize__,
+            "hits": self.__hits__,
+            "misses": self.__misses__,
+            "hit_rate": self.__hits__ / total if total else 0.0,
+        }
@@ -1,14 +1,115 @@
 import random
 
+# las 36 tiradas ordenadas (a, b); se reutilizan las mismas tuplas en cada buffer
+ALL_ROLLS = tuple((a, b) for a in range(1, 7) for b in range(1, 7))
+
+
+def roll_pips(roll: tuple[int, int]) -> tuple:
+    """Pips que habilita una tirada (los dobles valen cuatro veces)."""
+    a, b = roll
+    return (a, a, a, a) if a == b else (a, b)
+
+
+# las 21 tiradas distintas como (roll, pips, probabilidad): 15 no dobles (a > b)
+# a 2/36 y 6 dobles a 1/36; las probabilidades suman 1
+ROLLS = tuple(
+    ((a, b), roll_pips((a, b)), (1 if a == b else 2) / 36)
+    for a in range(1, 7) for b in range(1, a + 1)
+)
+
+
 class Dice:
-    """Representa los dados usados en Backgammon."""
-    def __init__(self):
+    """
+    Representa los dados usados en Backgammon.
+
+    Cada instancia es un flujo de tiradas independiente: usa su propio
+    `random.Random` (o un `numpy.random.Generator` pasado en `rng`) y saca
+    las tiradas de a bloques de `buffer_size`, pre-generadas de una vez.
+    Con la misma semilla se obtiene siempre la misma secuencia, así que un
+    flujo con semilla se describe con `state()` (semilla + tiradas usadas).
+    """
+    BUFFER_SIZE = 4096
+
+    def __init__(self, seed: int | None = None, rng=None, buffer_size: int = BUFFER_SIZE):
+        if seed is not None and rng is not None:
+            raise ValueError("Usar seed o rng, no ambos")
+        if not isinstance(buffer_size, int) or buffer_size <= 0:
+            raise ValueError("buffer_size debe ser un entero positivo")
+        if rng is None:
+            rng = random.Random(seed)
+        elif not (hasattr(rng, "integers") or hasattr(rng, "choices")):
+            raise TypeError("rng debe ser random.Random o numpy.random.Generator")
+        self.__rng__ = rng
+        self.__seed__ = seed
+        self.__drawn__ = 0           # tiradas entregadas (para `state`)
+        self.__buffer_size__ = buffer_size
+        self.__buffer__ = []
+        self.__pos__ = 0
         self.__last_roll__ = None
 
+    def __refill__(self) -> None:
+        n = self.__buffer_size__
+        rng = self.__rng__
+        if hasattr(rng, "integers"):  # numpy.random.Generator
+            self.__buffer__ = [ALL_ROLLS[i] for i in rng.integers(0, 36, size=n).tolist()]
+        else:
+            self.__buffer__ = rng.choices(ALL_ROLLS, k=n)
+        self.__pos__ = 0
+
     def roll(self) -> tuple[int, int]:
-        a = random.randint(1, 6)
-        b = random.randint(1, 6)
-        self.__last_roll__ = (a, b)
+        if self.__pos__ >= len(self.__buffer__):
+            self.__refill__()
+        self.__last_roll__ = self.__buffer__[self.__pos__]
+        self.__pos__ += 1
+        self.__drawn__ += 1
+        return self.__last_roll__
+
+    def rolls(self, n: int) -> list:
+        """Las próximas n tiradas del flujo (misma secuencia que n llamadas a `roll`)."""
+        if n < 0:
+            raise ValueError("n debe ser >= 0")
+        res = []
+        while len(res) < n:
+            if self.__pos__ >= len(self.__buffer__):
+                self.__refill__()
+            take = min(n - len(res), len(self.__buffer__) - self.__pos__)
+            res.extend(self.__buffer__[self.__pos__:self.__pos__ + take])
+            self.__pos__ += take
+        if res:
+            self.__last_roll__ = res[-1]
+        self.__drawn__ += n
+        return res
+
+    def spawn(self, n: int) -> list:
+        """n flujos hijos independientes y reproducibles (uno por partida o worker)."""
+        rng = self.__rng__
+        if hasattr(rng, "spawn"):  # numpy.random.Generator
+            return [Dice(rng=child, buffer_size=self.__buffer_size__) for child in rng.spawn(n)]
+        self.__seed__ = None  # el generador avanzó fuera de las tiradas: semilla + usadas ya no lo describe
+        return [Dice(seed=rng.getrandbits(64), buffer_size=self.__buffer_size__) for _ in range(n)]
+
+    def state(self) -> dict | None:
+        """{"seed", "drawn"} para recrear el flujo con `from_state`; None si no tiene semilla."""
+        if self.__seed__ is None:
+            return None
+        return {"seed": self.__seed__, "drawn": self.__drawn__}
+
+    @staticmethod
+    def from_state(state: dict | None, buffer_size: int = BUFFER_SIZE) -> "Dice":
+        """Flujo en el mismo punto que el de `state()` (o uno nuevo sin semilla si es None)."""
+        if state is None:
+            return Dice(buffer_size=buffer_size)
+        seed, drawn = state.get("seed"), state.get("drawn")
+        if not isinstance(seed, int) or not isinstance(drawn, int) or drawn < 0:
+            raise ValueError("Estado de dados inválido: se espera {'seed': int, 'drawn': int >= 0}")
+        dice = Dice(seed, buffer_size=buffer_size)
+        dice.rolls(drawn)  # la secuencia no depende del tamaño de bloque
+        return dice
+
+    def buffer_size(self) -> int:
+        return self.__buffer_size__
+
+    def last_roll(self):
         return self.__last_roll__
 
     def is_double(self) -> bool:
@@ -16,4 +117,3 @@ class Dice:
             return False
         a, b = self.__last_roll__
         return a == b
-
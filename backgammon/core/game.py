@@ -1,14 +1,26 @@
+from backgammon.core import position_id
 from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
 from backgammon.core.player import Player
-from backgammon.core.dice import Dice
+from backgammon.core.dice import ROLLS, Dice, roll_pips
+from backgammon.core.zobrist import SIDE_KEY, pips_key
 
 class BackgammonGame:
     """Clase principal del juego Backgammon (robusta a variantes de Board)."""
-    def __init__(self):
-        self.__board__ = Board()
+    MOVE_CACHE_SIZE = 1024
+
+    def __init__(self, board=None, move_cache: LRUCache | None = None,
+                 seed: int | None = None, dice: Dice | None = None):
+        # board opcional: permite inyectar variantes (p. ej. ArrayBoard para motores)
+        self.__board__ = board if board is not None else Board()
+        # caché de movimientos legales; se puede compartir entre partidas
+        self.__move_cache__ = move_cache if move_cache is not None else LRUCache(self.MOVE_CACHE_SIZE)
         self.__players__ = []
         self.__current_player_index__ = 0
-        self.__dice__ = Dice()
+        # flujo de tiradas propio: con `seed` la partida es reproducible
+        if dice is not None and seed is not None:
+            raise ValueError("Usar seed o dice, no ambos")
+        self.__dice__ = dice if dice is not None else Dice(seed)
         self.__last_roll__ = None
         self.__pips__ = tuple()
         # [(origin, dest|None, color_int, pip, kind)]  kind: "move" | "enter" | "off"
@@ -32,14 +44,16 @@ class BackgammonGame:
     def players(self):
         return tuple(self.__players__)
 
+    def dice(self) -> Dice:
+        return self.__dice__
+
     def setup_board(self) -> None:
         self.__board__.setup_initial()
 
     # ---------- Turnos / dados / pips ----------
     def start_turn(self, roll: tuple[int, int] | None = None) -> tuple[int, int]:
         self.__last_roll__ = roll if roll is not None else self.__dice__.roll()
-        a, b = self.__last_roll__
-        self.__pips__ = (a, a, a, a) if a == b else (a, b)
+        self.__pips__ = roll_pips(self.__last_roll__)
         self.__turn_history__.clear()
         return self.__last_roll__
 
@@ -160,14 +174,42 @@ class BackgammonGame:
         # Defaults seguros
         return list(range(0, 6)) if color == Board.WHITE else list(range(18, 24))
 
+    # ---------- Caché de movimientos ----------
+    def move_cache(self) -> LRUCache:
+        return self.__move_cache__
+
+    def __cache_key__(self, kind: str, pips: tuple) -> tuple:
+        """(tipo, hash de posición con color al turno, pips): cambia con cada movimiento."""
+        key = self._board_key(self.__board__)
+        if not isinstance(key, int):
+            key = hash(key)
+        if self._current_color_int() == Board.BLACK:
+            key ^= SIDE_KEY
+        return (kind, key, pips)
+
+    def __cached__(self, kind: str, pips: tuple, compute):
+        ck = self.__cache_key__(kind, pips)
+        res = self.__move_cache__.get(ck)
+        if res is None:
+            res = tuple(compute())
+            self.__move_cache__.put(ck, res)
+        return list(res)
+
     def legal_moves(self):
         """Movimientos normales y entradas desde barra. (El bear-off se lista aparte)."""
+        return self.__cached__("moves", tuple(sorted(set(self.__pips__))), self._compute_legal_moves)
+
+    def _compute_legal_moves(self):
         color = self._current_color_int()
         res = []
         pips = sorted(set(self.__pips__))
         if not pips:
             return res
 
+        # Camino rápido: el tablero sabe generar sus movimientos sin validaciones
+        if hasattr(self.__board__, "_single_moves"):
+            return self.__board__._single_moves(color, pips)
+
         if self._has_pieces_on_bar(color):
             for pip in pips:
                 if self.can_enter_from_bar(pip):
@@ -194,11 +236,17 @@ class BackgammonGame:
 
     def legal_bear_off_moves(self):
         """Lista movimientos de bear-off como (origin, pip)."""
+        return self.__cached__("off", tuple(sorted(set(self.__pips__))), self._compute_bear_off_moves)
+
+    def _compute_bear_off_moves(self):
         color = self._current_color_int()
         res = []
         pips = sorted(set(self.__pips__))
         if not pips or self._has_pieces_on_bar(color):
             return res
+        # Camino rápido con tablas de distancias (sin excepciones)
+        if hasattr(self.__board__, "_bear_off_steps"):
+            return [(o, pip) for (o, _, pip) in self.__board__._bear_off_steps(color, pips)]
         if not self.__board__.all_in_home(color):
             return res
         for origin in self._home_indices(color):
@@ -212,6 +260,164 @@ class BackgammonGame:
     def has_any_move(self) -> bool:
         return bool(self.legal_moves() or self.legal_bear_off_moves())
 
+    def position_key(self) -> int:
+        """
+        Clave de 64 bits para cachés/tablas de transposición: hash Zobrist del
+        tablero combinado con el color que mueve y los pips restantes.
+        """
+        key = self._board_key(self.__board__)
+        if not isinstance(key, int):
+            key = hash(key)
+        if self._current_color_int() == Board.BLACK:
+            key ^= SIDE_KEY
+        return key ^ pips_key(self.__pips__)
+
+    # ---------- Jugadas completas (turno entero) ----------
+    @staticmethod
+    def _board_steps(board, color: int, pips: tuple) -> list:
+        """Pasos legales (origin, dest|None, pip) sobre `board`; dest None = bear-off."""
+        upips = sorted(set(pips))
+        if hasattr(board, "_single_moves"):
+            steps = board._single_moves(color, upips)
+        else:
+            steps = []
+            for origin in range(board.num_points()):
+                for pip in upips:
+                    if board.can_move(origin, pip, color):
+                        steps.append((origin, board.dest_from(origin, pip, color), pip))
+        if hasattr(board, "_bear_off_steps"):
+            steps.extend(board._bear_off_steps(color, upips))
+        elif board.bar_count(color) == 0 and board.all_in_home(color):
+            for origin in board.home_indices(color):
+                if board.owner_at(origin) != color:
+                    continue
+                for pip in upips:
+                    if board.can_bear_off(origin, pip, color):
+                        steps.append((origin, None, pip))
+        return steps
+
+    @staticmethod
+    def _board_apply(board, color: int, origin: int, dest, pip: int) -> tuple:
+        """Aplica un paso y devuelve los argumentos de `board._undo`."""
+        if origin == -1:
+            hit = board.get_point(dest) == -color
+            board.enter_from_bar(pip, color)
+            return ("enter", origin, dest, color, hit)
+        if dest is None:
+            board.bear_off(origin, pip, color)
+            return ("off", origin, dest, color, False)
+        hit = board.get_point(dest) == -color
+        board.move(origin, pip, color)
+        return ("move", origin, dest, color, hit)
+
+    @staticmethod
+    def _board_key(board):
+        if hasattr(board, "zobrist_hash"):
+            return board.zobrist_hash()
+        if hasattr(board, "_state_key"):
+            return board._state_key()
+        return (tuple(board.get_point(i) for i in range(board.num_points())),
+                board.bar_count(Board.WHITE), board.bar_count(Board.BLACK),
+                board.off_count(Board.WHITE), board.off_count(Board.BLACK))
+
+    def legal_plays(self, roll: tuple[int, int] | None = None) -> list:
+        """
+        Jugadas completas para una tirada: lista de tuplas de pasos (origin, pip),
+        aplicables en orden con `apply_move` (origin -1 = entrada desde barra).
+
+        - Sólo se devuelven jugadas que usan la mayor cantidad posible de dados.
+        - Si de una tirada no doble sólo puede jugarse un dado, debe ser el mayor.
+        - Jugadas que llegan a la misma posición final se deduplican (queda la
+          primera encontrada), y los estados intermedios repetidos no se vuelven
+          a expandir: en dobles el costo crece con los resultados distintos.
+        Sin movimientos posibles devuelve [()].
+        Si roll es None usa los pips restantes del turno actual.
+        """
+        pips = roll_pips(roll) if roll is not None else tuple(self.__pips__)
+        return self.__cached__("plays", pips, lambda: self._compute_legal_plays(pips))
+
+    def plays_by_roll(self):
+        """
+        Recorre las 21 tiradas distintas (`dice.ROLLS`) para la posición y el
+        color al turno, sin tocar la tirada ni los pips del turno actual.
+        Genera (roll, probabilidad, jugadas) con las jugadas de `legal_plays(roll)`.
+
+        Trabajo compartido entre tiradas: los pasos de un dado desde la posición
+        actual se generan una sola vez por pip (6 en lugar de 21 generaciones) y
+        los resultados pasan por la caché de movimientos, así que un
+        `legal_plays()` posterior con la tirada real es un hit.
+        Entre iteraciones el tablero puede usarse con make/unmake, pero debe
+        quedar restaurado antes de pedir la tirada siguiente.
+        """
+        color = self._current_color_int()
+        board = self.__board__
+        root = {}
+        for pip in range(1, 7):
+            single = self._board_steps(board, color, (pip,))
+            root[pip] = ([s for s in single if s[1] is not None], [s for s in single if s[1] is None])
+        for (roll, pips, prob) in ROLLS:
+            plays = self.__cached__("plays", pips, lambda: self._compute_legal_plays(pips, root))
+            yield roll, prob, plays
+
+    @staticmethod
+    def __merge_steps__(root: dict, rem: tuple) -> list:
+        """Pasos de `rem` desde los de un solo dado, en el orden de `_board_steps`."""
+        upips = sorted(set(rem))
+        if len(upips) == 1:
+            moves, offs = root[upips[0]]
+            return moves + offs
+        key = lambda s: (s[0], s[2])
+        moves = sorted((s for pip in upips for s in root[pip][0]), key=key)
+        offs = sorted((s for pip in upips for s in root[pip][1]), key=key)
+        return moves + offs
+
+    def _compute_legal_plays(self, pips: tuple, root_steps: dict | None = None) -> list:
+        """`root_steps`: pasos de un dado ya generados para la posición actual (pip -> (normales, bear-off))."""
+        color = self._current_color_int()
+
+        finals = []       # [(len, key, play)]
+        visited = set()   # (key, pips restantes ordenados)
+
+        def expand(board, rem, play):
+            if not rem:
+                steps = []
+            elif not play and root_steps is not None:
+                steps = self.__merge_steps__(root_steps, rem)
+            else:
+                steps = self._board_steps(board, color, rem)
+            if not steps:
+                finals.append((len(play), self._board_key(board), play))
+                return
+            for (origin, dest, pip) in steps:
+                undo = self._board_apply(board, color, origin, dest, pip)
+                left = list(rem)
+                left.remove(pip)
+                left = tuple(left)
+                mark = (self._board_key(board), tuple(sorted(left)))
+                if mark not in visited:
+                    visited.add(mark)
+                    expand(board, left, play + ((origin, pip),))
+                board._undo(*undo)
+
+        # make/unmake sobre el propio tablero: no se copia en ningún nivel
+        expand(self.__board__, pips, ())
+
+        max_len = max(n for (n, _, _) in finals)
+        cands = [(k, p) for (n, k, p) in finals if n == max_len]
+        if max_len == 1 and len(pips) == 2 and pips[0] != pips[1]:
+            high = max(pips)
+            with_high = [(k, p) for (k, p) in cands if p[0][1] == high]
+            if with_high:
+                cands = with_high
+
+        res = []
+        seen = set()
+        for (k, p) in cands:
+            if k not in seen:
+                seen.add(k)
+                res.append(p)
+        return res
+
     def can_play_move(self, origin: int, pip: int) -> bool:
         # guardia: si no hay turno activo, no se puede jugar
         if self.__last_roll__ is None:
@@ -228,33 +434,85 @@ class BackgammonGame:
 
     def apply_move(self, origin: int, pip: int) -> int | None:
         """Aplica movimiento normal, entrada desde barra o bear-off. Devuelve destino o None si bear-off."""
+        return self.make_move(origin, pip)[2]
+
+    # ---------- Make / unmake (deshacer sin copiar el tablero) ----------
+    def make_move(self, origin: int, pip: int) -> tuple:
+        """
+        Igual que `apply_move`, pero devuelve un registro compacto para `unmake`:
+        (kind, origin, dest|None, pip, color, hit, pip_index)
+        kind: "move" | "enter" | "off"; hit: si golpeó un blot rival;
+        pip_index: posición que ocupaba el pip en `pips()`.
+        """
         color = self._current_color_int()
 
         if pip not in self.__pips__:
             raise ValueError("Pip no disponible en este turno")
+        pip_index = self.__pips__.index(pip)
+        board = self.__board__
 
         # barra obliga entrada
         if self._has_pieces_on_bar(color):
             if origin != -1:
                 raise ValueError("Debes reingresar desde la barra antes de mover otras fichas")
+            hit = board.can_enter(pip, color) and board.get_point(board.entry_index(pip, color)) == -color
             dest = self.enter_from_bar(pip)
-            return dest
+            return ("enter", -1, dest, pip, color, hit, pip_index)
 
         # bear-off si aplica
-        if self.__board__.all_in_home(color) and self.__board__.can_bear_off(origin, pip, color):
+        if board.all_in_home(color) and board.can_bear_off(origin, pip, color):
             self.bear_off(origin, pip)
-            return None
+            return ("off", origin, None, pip, color, False, pip_index)
 
         # movimiento normal
-        if not self.__board__.can_move(origin, pip, color):
+        if not board.can_move(origin, pip, color):
             raise ValueError("Movimiento inválido para el estado actual del tablero")
 
-        dest = self.__board__.move(origin, pip, color)
+        hit = board.get_point(board.dest_from(origin, pip, color)) == -color
+        dest = board.move(origin, pip, color)
         pips = list(self.__pips__)
         pips.remove(pip)
         self.__pips__ = tuple(pips)
         self.__turn_history__.append((origin, dest, color, pip, "move"))
-        return dest
+        return ("move", origin, dest, pip, color, hit, pip_index)
+
+    def make_start_turn(self, roll: tuple[int, int] | None = None) -> tuple:
+        """`start_turn` que devuelve un registro ("start", ...) para `unmake`."""
+        record = ("start", self.__last_roll__, self.__pips__, tuple(self.__turn_history__))
+        self.start_turn(roll)
+        return record
+
+    def make_end_turn(self, force: bool = False) -> tuple:
+        """
+        `end_turn` que devuelve un registro ("end", ...) para `unmake`.
+        Con force=True descarta los pips que queden (jugada completa ya aplicada).
+        """
+        if not force and not self.is_turn_over():
+            raise ValueError("Aún quedan pips por jugar")
+        record = ("end", self.__current_player_index__, self.__last_roll__,
+                  self.__pips__, tuple(self.__turn_history__))
+        self.__pips__ = tuple()
+        self.end_turn()
+        return record
+
+    def unmake(self, record: tuple) -> None:
+        """Deshace exactamente un registro de make_move/make_start_turn/make_end_turn."""
+        kind = record[0]
+        if kind == "start":
+            _, self.__last_roll__, self.__pips__, hist = record
+            self.__turn_history__ = list(hist)
+            return
+        if kind == "end":
+            _, self.__current_player_index__, self.__last_roll__, self.__pips__, hist = record
+            self.__turn_history__ = list(hist)
+            return
+        _, origin, dest, pip, color, hit, pip_index = record
+        self.__board__._undo(kind, origin, dest, color, hit)
+        pips = list(self.__pips__)
+        pips.insert(pip_index, pip)
+        self.__pips__ = tuple(pips)
+        if self.__turn_history__:
+            self.__turn_history__.pop()
 
     def to_dict(self) -> dict:
         # Obtener contadores de barra y borne-off de forma robusta
@@ -284,9 +542,27 @@ class BackgammonGame:
             "pips": list(self.__pips__),
         }
 
+    # ---------- Position ID ----------
+    def to_position_id(self) -> str:
+        """Position ID (14 caracteres) del tablero visto desde el color al turno."""
+        return self.__board__.to_position_id(self._current_color_int())
+
     @staticmethod
-    def from_dict(data: dict) -> "BackgammonGame":
-        g = BackgammonGame()
+    def from_position_id(pid: str, color: str = "white", board=None) -> "BackgammonGame":
+        """Partida White/Black con la posición del ID y `color` al turno (sin tirada)."""
+        if color not in ("white", "black"):
+            raise ValueError("Color inválido: se espera 'white' o 'black'")
+        g = BackgammonGame(board)
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        g.__current_player_index__ = 0 if color == "white" else 1
+        position_id.load_into(g.__board__, pid, Board.WHITE if color == "white" else Board.BLACK)
+        return g
+
+    @staticmethod
+    def from_dict(data: dict, board=None, move_cache: LRUCache | None = None,
+                  dice: Dice | None = None) -> "BackgammonGame":
+        g = BackgammonGame(board, move_cache, dice=dice)
         g.__players__ = [Player(p["name"], p["color"]) for p in data.get("players", [])]
         g.__current_player_index__ = data.get("current_player_index", 0)
 
@@ -304,6 +580,12 @@ class BackgammonGame:
         w_off = data.get("white_borne_off", max(0, 15 - white_on_board - w_bar))
         b_off = data.get("black_borne_off", max(0, 15 - black_on_board - b_bar))
 
+        if hasattr(g.__board__, "set_bar") and hasattr(g.__board__, "set_off"):
+            g.__board__.set_bar(Board.WHITE, w_bar)
+            g.__board__.set_bar(Board.BLACK, b_bar)
+            g.__board__.set_off(Board.WHITE, w_off)
+            g.__board__.set_off(Board.BLACK, b_off)
+
         # inyección pragmática de atributos privados más frecuentes en Board
         # barra
         if hasattr(g.__board__, "_Board__white_bar__"):
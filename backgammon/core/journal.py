@@ -0,0 +1,229 @@
+"""
+Autoguardado por journal (solo-agregar) y lector único de partidas guardadas.
+
+Un journal (`*.journal`) es un archivo NDJSON: la primera línea es un
+checkpoint con el estado completo (`to_dict`, JSON compacto) y cada acción
+posterior agrega un registro de pocos bytes:
+
+    {"t":"ck","state":{...}}        checkpoint
+    {"t":"start","roll":[3,1]}      tirada / inicio de turno
+    {"t":"move","o":7,"p":3}        movimiento ("enter" desde la barra, "off" bear-off)
+    {"t":"end"}                     fin de turno (también el automático)
+
+Cada `checkpoint_every` registros el archivo se compacta: se reescribe de
+forma atómica (temporal + rename) con un único checkpoint. Deshacer, resetear
+o cargar otra partida también compactan. Con `writer` (el `BackgroundWriter`
+de la UI) la compactación se codifica y escribe en segundo plano; el próximo
+registro espera a que termine. Los registros se escriben con `flush` y sin
+`fsync`: protegen de la caída del proceso, no del sistema.
+
+Un `Journal` nuevo no toca el archivo hasta su primer checkpoint o registro
+(el primer registro escribe un checkpoint con el estado ya actualizado): abrir
+una partida nueva no pisa el journal anterior mientras no se juegue. Para
+seguir una partida guardada se usa `resume()`.
+
+Al leer se reproduce la cola desde el último checkpoint con `make_move` /
+`start_turn` / `make_end_turn`, así también se recupera el historial del
+turno. Una última línea incompleta (caída a mitad de escritura) se ignora;
+`resume()` además la recorta del archivo antes de seguir agregando.
+
+`load_game` es el lector compartido por la CLI y la UI: acepta journals y
+los tres formatos JSON de estado (plano de `to_dict`, envuelto
+`{"board": {...}}` y el viejo de la UI `{"board": [...], "current_index": n}`).
+"""
+import json
+from pathlib import Path
+
+from backgammon.core.game import BackgammonGame
+
+SUFFIX = ".journal"
+CHECKPOINT_EVERY = 64
+_MOVE_KINDS = ("move", "enter", "off")
+
+
+def normalize_state(data: dict) -> dict:
+    """Cualquier formato de estado guardado -> dict de `to_dict` (el que entiende `from_dict`)."""
+    if not isinstance(data, dict):
+        raise ValueError("Estado inválido: se espera un objeto JSON")
+    board = data.get("board")
+    if isinstance(board, dict):          # envuelto {"board": {...}}
+        return board
+    if isinstance(board, list):          # formato viejo de la UI
+        if len(board) != 24:
+            raise ValueError("Estado inválido: 'board' debe tener 24 puntos")
+        state = {k: v for k, v in data.items() if k not in ("board", "current_index")}
+        state["points"] = board
+        state["current_player_index"] = data.get("current_index", 0)
+        return state
+    return data
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode_checkpoint(state: dict) -> bytes:
+    return (_dumps({"t": "ck", "state": state}) + "\n").encode("utf-8")
+
+
+class Journal:
+    """Registro solo-agregar de las acciones de una partida, con checkpoints compactados."""
+
+    def __init__(self, path, checkpoint_every: int = CHECKPOINT_EVERY, writer=None):
+        if not isinstance(checkpoint_every, int) or checkpoint_every <= 0:
+            raise ValueError("checkpoint_every debe ser un entero positivo")
+        self.__path__ = Path(path)
+        self.__every__ = checkpoint_every
+        self.__writer__ = writer     # submit(path, encode, payload, label) / wait()
+        self.__file__ = None
+        self.__based__ = False       # hay un checkpoint propio (o retomado) sobre el que agregar
+        self.__pending__ = False     # compactación encolada en el writer
+        self.__since__ = 0           # registros desde el último checkpoint
+
+    def path(self) -> Path:
+        return self.__path__
+
+    def records_since_checkpoint(self) -> int:
+        return self.__since__
+
+    def resume(self) -> BackgammonGame:
+        """Reconstruye la partida del archivo y sigue agregando sobre él (recorta una cola cortada
+        y completa el salto de línea de un último registro entero)."""
+        self.__flush_pending__()
+        self.__close_file__()
+        game, valid, since = _replay(self.__path__)
+        with open(self.__path__, "r+b") as f:
+            if valid < self.__path__.stat().st_size:
+                f.truncate(valid)
+            if valid:
+                f.seek(valid - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        self.__based__ = True
+        self.__since__ = since
+        return game
+
+    # ---------- escritura ----------
+    def checkpoint(self, game: BackgammonGame) -> None:
+        """Compacta: reemplaza el archivo por un único checkpoint con el estado actual."""
+        self.__close_file__()
+        self.__based__ = True
+        self.__since__ = 0
+        state = game.to_dict()
+        if self.__writer__ is not None:
+            # la cola llena no se saltea: otra compactación encolada pisaría esta después
+            while not self.__writer__.submit(self.__path__, _encode_checkpoint, state, "Autoguardado"):
+                self.__writer__.wait()
+            self.__pending__ = True
+            return
+        self.__path__.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.__path__.with_name(self.__path__.name + ".tmp")
+        tmp.write_bytes(_encode_checkpoint(state))
+        tmp.replace(self.__path__)
+
+    def started(self, game: BackgammonGame) -> None:
+        """Después de `start_turn`: guarda la tirada (sea fija o de los dados)."""
+        self.__append__(game, {"t": "start", "roll": list(game.last_roll())})
+
+    def moved(self, game: BackgammonGame, record: tuple) -> None:
+        """Después de `make_move`: guarda (tipo, origen, pip) del registro devuelto."""
+        kind, origin, _, pip = record[:4]
+        self.__append__(game, {"t": kind, "o": origin, "p": pip})
+
+    def ended(self, game: BackgammonGame) -> None:
+        """Después de cerrar el turno (`end_turn` o `auto_end_turn`)."""
+        self.__append__(game, {"t": "end"})
+
+    def __append__(self, game: BackgammonGame, record: dict) -> None:
+        if not self.__based__:
+            self.checkpoint(game)   # sin base no hay nada que reproducir: el estado ya incluye la acción
+            return
+        self.__flush_pending__()
+        if self.__file__ is None:
+            self.__file__ = open(self.__path__, "a", encoding="utf-8")
+        self.__file__.write(_dumps(record) + "\n")
+        self.__file__.flush()
+        self.__since__ += 1
+        if self.__since__ >= self.__every__:
+            self.checkpoint(game)
+
+    def __flush_pending__(self) -> None:
+        if self.__pending__:
+            self.__writer__.wait()  # el archivo compactado tiene que estar en disco antes de agregarle
+            self.__pending__ = False
+
+    def __close_file__(self) -> None:
+        if self.__file__ is not None:
+            self.__file__.close()
+            self.__file__ = None
+
+    def close(self) -> None:
+        self.__close_file__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- lectura ----------
+def replay(path) -> BackgammonGame:
+    """Reconstruye la partida: último checkpoint + registros posteriores."""
+    return _replay(Path(path))[0]
+
+
+def _replay(path: Path) -> tuple:
+    """(partida, bytes válidos, registros tras el último checkpoint)."""
+    lines = path.read_bytes().split(b"\n")
+    records = []
+    valid = 0
+    for n, raw in enumerate(lines, 1):
+        if not raw.strip():
+            valid += len(raw) + (n < len(lines))
+            continue
+        try:
+            rec = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            if n == len(lines):     # última línea cortada por una caída: se descarta
+                break
+            raise ValueError(f"Journal corrupto en la línea {n}: {path}")
+        if not isinstance(rec, dict) or "t" not in rec:
+            raise ValueError(f"Registro inválido en la línea {n}: {path}")
+        # un JSON completo sin salto de línea final es un registro escrito entero: vale
+        # (`resume` agrega el salto que falta antes de seguir escribiendo)
+        valid += len(raw) + (n < len(lines))
+        records.append((n, rec))
+
+    last_ck = max((i for i, (_, rec) in enumerate(records) if rec["t"] == "ck"), default=None)
+    if last_ck is None:
+        raise ValueError(f"Journal sin checkpoint: {path}")
+    game = BackgammonGame.from_dict(normalize_state(records[last_ck][1]["state"]))
+    for n, rec in records[last_ck + 1:]:
+        try:
+            kind = rec["t"]
+            if kind == "start":
+                game.start_turn(tuple(rec["roll"]))
+            elif kind in _MOVE_KINDS:
+                game.make_move(rec["o"], rec["p"])
+            elif kind == "end":
+                game.make_end_turn(force=True)
+            else:
+                raise ValueError(f"tipo desconocido {kind!r}")
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Journal inconsistente en la línea {n}: {e}") from e
+    return game, valid, len(records) - last_ck - 1
+
+
+def load_game(path) -> BackgammonGame:
+    """Lector único de partidas guardadas: journal o JSON de estado (cualquier formato)."""
+    p = Path(path)
+    if not p.exists():
+        raise ValueError(f"Archivo a cargar no existe: {path}")
+    if p.suffix == SUFFIX:
+        return replay(p)
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON inválido en {path}: {e}") from e
+    return BackgammonGame.from_dict(normalize_state(data))
@@ -0,0 +1,114 @@
+"""
+Position ID binario al estilo de GNU Backgammon (80 bits, 14 caracteres base64).
+
+Para cada lado, empezando por el color al turno, se recorren sus puntos desde
+su punto 1 hasta el 24 y luego su barra: por cada slot se emiten tantos bits 1
+como fichas y un bit 0 de separador. Con 15 fichas por lado son como máximo
+30 + 50 = 80 bits, empaquetados little-endian en 10 bytes y codificados en
+base64 sin relleno. Las fichas retiradas se deducen (15 - tablero - barra).
+
+El color al turno no forma parte del ID: el mismo tablero visto desde el otro
+lado produce otro ID.
+
+Punto k (1..24) del color: WHITE -> idx k-1; BLACK -> idx 24-k.
+"""
+import base64
+import binascii
+
+WHITE = 1
+BLACK = -1
+CHECKERS = 15
+SLOTS = 25          # 24 puntos + barra
+NUM_BYTES = 10
+ID_LENGTH = 14
+
+
+def _idx(color: int, point: int) -> int:
+    """Índice de tablero del punto `point` (0..23 desde el lado de `color`)."""
+    return point if color == WHITE else 23 - point
+
+
+def encode(points, white_bar: int, black_bar: int, color: int = WHITE) -> str:
+    """Codifica puntos con signo (24) y barras; `color` = lado al turno."""
+    if color not in (WHITE, BLACK):
+        raise ValueError("Color inválido")
+    bars = {WHITE: white_bar, BLACK: black_bar}
+    key = 0
+    bit = 0
+    for side in (color, -color):
+        total = 0
+        for slot in range(SLOTS):
+            if slot < 24:
+                n = points[_idx(side, slot)] * side
+                n = n if n > 0 else 0
+            else:
+                n = bars[side]
+            total += n
+            key |= ((1 << n) - 1) << bit
+            bit += n + 1
+        if total > CHECKERS:
+            raise ValueError("Más de 15 fichas por lado")
+    return base64.b64encode(key.to_bytes(NUM_BYTES, "little")).decode("ascii").rstrip("=")
+
+
+def decode(pid: str, color: int = WHITE) -> tuple:
+    """
+    Decodifica un ID -> (points, white_bar, black_bar, white_off, black_off).
+    Lanza ValueError si el texto no es un ID válido.
+    """
+    if color not in (WHITE, BLACK):
+        raise ValueError("Color inválido")
+    if not isinstance(pid, str) or len(pid) != ID_LENGTH:
+        raise ValueError("Position ID inválido: se esperan 14 caracteres")
+    try:
+        raw = base64.b64decode(pid + "==", validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Position ID inválido: base64 incorrecto")
+    key = int.from_bytes(raw, "little")
+
+    points = [0] * 24
+    bars = {}
+    offs = {}
+    bit = 0
+    for side in (color, -color):
+        total = 0
+        for slot in range(SLOTS):
+            n = 0
+            while bit < NUM_BYTES * 8 and (key >> bit) & 1:
+                n += 1
+                bit += 1
+            if bit >= NUM_BYTES * 8:
+                raise ValueError("Position ID inválido: faltan separadores")
+            bit += 1
+            total += n
+            if slot < 24:
+                if n:
+                    idx = _idx(side, slot)
+                    if points[idx]:
+                        raise ValueError("Position ID inválido: punto ocupado por ambos colores")
+                    points[idx] = n * side
+            else:
+                bars[side] = n
+        if total > CHECKERS:
+            raise ValueError("Position ID inválido: más de 15 fichas por lado")
+        offs[side] = CHECKERS - total
+    if key >> bit:
+        raise ValueError("Position ID inválido: bits sobrantes")
+    return points, bars[WHITE], bars[BLACK], offs[WHITE], offs[BLACK]
+
+
+def board_to_id(board, color: int = WHITE) -> str:
+    return encode([board.get_point(i) for i in range(24)],
+                  board.bar_count(WHITE), board.bar_count(BLACK), color)
+
+
+def load_into(board, pid: str, color: int = WHITE):
+    """Vuelca un ID sobre `board` (Board o ArrayBoard vacío) y lo devuelve."""
+    points, wbar, bbar, woff, boff = decode(pid, color)
+    for i, v in enumerate(points):
+        board.set_point(i, v)
+    board.set_bar(WHITE, wbar)
+    board.set_bar(BLACK, bbar)
+    board.set_off(WHITE, woff)
+    board.set_off(BLACK, boff)
+    return board
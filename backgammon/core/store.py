@@ -0,0 +1,205 @@
+"""
+Almacén de sesiones de partida: calientes en memoria, frías en SQLite.
+
+`GameStore` guarda objetos `BackgammonGame` vivos en orden LRU. Al superar
+`max_entries` o el presupuesto `max_bytes` desaloja los menos usados a una
+tabla SQLite como JSON compacto de `to_dict()` (~300 bytes contra decenas de
+KB de un objeto vivo con su buffer de dados) y en el próximo `get` los
+rehidrata con `from_dict` de forma transparente.
+
+El tamaño en memoria de cada partida es una estimación (`estimate_bytes`):
+una base fija medida con tracemalloc, el buffer de tiradas de su `Dice`, el
+historial del turno y, si la partida tiene una caché de movimientos propia,
+sus entradas. Las partidas rehidratadas por el `factory` por defecto usan
+una caché compartida por todo el almacén (`move_cache`, fuera de
+`max_bytes`) en lugar de una `LRUCache` de 1024 entradas cada una. Como una
+partida crece mientras se usa, su estimación se recalcula en cada `get`.
+Del flujo de dados se guarda `Dice.state()` (semilla + tiradas usadas, en la
+clave "dice"): una partida con semilla sigue la misma secuencia aunque se
+haya desalojado. Sin semilla, la rehidratada tira desde un `Dice` nuevo.
+
+Con `path` = ":memory:" (por defecto) las partidas frías quedan en una base
+SQLite en memoria (sólo se compactan); con un archivo, cada tanda de
+desalojos se confirma (`commit`) al escribirse, así sobreviven a que maten
+el proceso, y `close()` vuelca además las calientes: un `GameStore` nuevo
+sobre el mismo archivo las recupera.
+"""
+import json
+import sqlite3
+from collections import OrderedDict
+
+from backgammon.core.cache import LRUCache
+from backgammon.core.dice import Dice
+from backgammon.core.game import BackgammonGame
+
+MAX_ENTRIES = 10000
+SHARED_CACHE_SIZE = 65536
+GAME_BASE_BYTES = 4096   # partida vacía (tablero, jugadores, historial), medido con tracemalloc
+_POINTER_BYTES = 8       # por tirada en el buffer de `Dice` (las tuplas se comparten)
+_HISTORY_BYTES = 80      # por paso en el historial del turno
+# por entrada de `legal_moves`/`legal_bear_off_moves` (clave + movimientos), medido con tracemalloc;
+# las de `legal_plays` pesan más (~3x), pero el almacén sólo sirve partidas de sesión
+_CACHE_ENTRY_BYTES = 288
+
+
+def estimate_bytes(game: BackgammonGame, shared_cache: LRUCache | None = None) -> int:
+    """Estimación de la memoria de una partida viva (sin contar `shared_cache` si la usa)."""
+    size = (GAME_BASE_BYTES + _POINTER_BYTES * game.dice().buffer_size()
+            + _HISTORY_BYTES * len(game.turn_history()))
+    cache = game.move_cache()
+    if cache is not shared_cache:
+        size += _CACHE_ENTRY_BYTES * len(cache)
+    return size
+
+
+def _encode(game: BackgammonGame) -> str:
+    data = game.to_dict()
+    dice = game.dice().state()
+    if dice is not None:
+        data["dice"] = dice
+    return json.dumps(data, separators=(",", ":"))
+
+
+def rehydrate(data: dict, move_cache: LRUCache | None = None) -> BackgammonGame:
+    """Partida de `to_dict` con su flujo de dados (si tenía semilla); base del `factory` por defecto."""
+    return BackgammonGame.from_dict(data, move_cache=move_cache, dice=Dice.from_state(data.get("dice")))
+
+
+class GameStore:
+    """Partidas por id: LRU en memoria con desalojo a SQLite y rehidratación al acceder."""
+
+    def __init__(self, path: str = ":memory:", max_entries: int = MAX_ENTRIES,
+                 max_bytes: int | None = None, factory=None, move_cache: LRUCache | None = None):
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("max_entries debe ser un entero positivo")
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes <= 0):
+            raise ValueError("max_bytes debe ser un entero positivo")
+        self.__max_entries__ = max_entries
+        self.__max_bytes__ = max_bytes
+        # caché de movimientos de las partidas que rehidrata el almacén (el server pasa la suya)
+        self.__move_cache__ = move_cache if move_cache is not None else LRUCache(SHARED_CACHE_SIZE)
+        self.__factory__ = factory if factory is not None else self.__rehydrate__
+        # cada id está en memoria o en la tabla, nunca en ambas
+        self.__live__ = OrderedDict()   # id -> (game, bytes estimados)
+        self.__bytes__ = 0
+        self.__hits__ = 0
+        self.__misses__ = 0
+        self.__evictions__ = 0
+        self.__rehydrations__ = 0
+        # sólo es un desborde de memoria: sin fsync por escritura
+        self.__db__ = sqlite3.connect(path)
+        self.__db__.execute("PRAGMA synchronous=OFF")
+        self.__db__.execute("CREATE TABLE IF NOT EXISTS games (id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        self.__cold__ = self.__db__.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def __rehydrate__(self, data: dict) -> BackgammonGame:
+        return rehydrate(data, self.__move_cache__)
+
+    def move_cache(self) -> LRUCache:
+        """Caché de movimientos compartida por las partidas rehidratadas."""
+        return self.__move_cache__
+
+    # ---------- acceso ----------
+    def get(self, gid: str, default=None):
+        """Partida viva (rehidratada desde disco si hace falta) o `default`."""
+        entry = self.__live__.pop(gid, None)
+        if entry is not None:
+            # la partida creció desde que entró (caché propia, historial): se vuelve a estimar
+            self.__bytes__ -= entry[1]
+            self.__hits__ += 1
+            self.__insert__(gid, entry[0])
+            return entry[0]
+        row = self.__db__.execute("SELECT data FROM games WHERE id = ?", (gid,)).fetchone()
+        if row is None:
+            self.__misses__ += 1
+            return default
+        game = self.__factory__(json.loads(row[0]))
+        self.__db__.execute("DELETE FROM games WHERE id = ?", (gid,))
+        self.__cold__ -= 1
+        self.__rehydrations__ += 1
+        self.__insert__(gid, game)
+        return game
+
+    def put(self, gid: str, game: BackgammonGame) -> None:
+        """Agrega o reemplaza una partida (queda como la más reciente)."""
+        old = self.__live__.pop(gid, None)
+        if old is not None:
+            self.__bytes__ -= old[1]
+        else:
+            self.__cold__ -= self.__db__.execute("DELETE FROM games WHERE id = ?", (gid,)).rowcount
+        self.__insert__(gid, game)
+
+    def delete(self, gid: str) -> bool:
+        """Quita la partida de memoria y de disco; False si no existía."""
+        old = self.__live__.pop(gid, None)
+        if old is not None:
+            self.__bytes__ -= old[1]
+        removed = self.__db__.execute("DELETE FROM games WHERE id = ?", (gid,)).rowcount
+        if removed:
+            self.__db__.commit()
+        self.__cold__ -= removed
+        return old is not None or removed > 0
+
+    def __contains__(self, gid) -> bool:
+        if gid in self.__live__:
+            return True
+        return self.__db__.execute("SELECT 1 FROM games WHERE id = ?", (gid,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return len(self.__live__) + self.__cold__
+
+    def hot(self) -> int:
+        return len(self.__live__)
+
+    def cold(self) -> int:
+        return self.__cold__
+
+    # ---------- desalojo ----------
+    def __insert__(self, gid: str, game: BackgammonGame) -> None:
+        size = estimate_bytes(game, self.__move_cache__)
+        self.__live__[gid] = (game, size)
+        self.__bytes__ += size
+        over = []
+        while len(self.__live__) > 1 and (
+                len(self.__live__) > self.__max_entries__
+                or (self.__max_bytes__ is not None and self.__bytes__ > self.__max_bytes__)):
+            old_id, (old, old_size) = self.__live__.popitem(last=False)
+            self.__bytes__ -= old_size
+            over.append((old_id, _encode(old)))
+        if over:
+            self.__db__.executemany("INSERT OR REPLACE INTO games (id, data) VALUES (?, ?)", over)
+            self.__db__.commit()  # con synchronous=OFF es barato; sin esto un kill pierde las desalojadas
+            self.__cold__ += len(over)
+            self.__evictions__ += len(over)
+
+    def close(self) -> None:
+        """Vuelca también las partidas calientes y cierra la base."""
+        self.__db__.executemany("INSERT OR REPLACE INTO games (id, data) VALUES (?, ?)",
+                                [(gid, _encode(g)) for gid, (g, _) in self.__live__.items()])
+        self.__db__.commit()
+        self.__cold__ += len(self.__live__)
+        self.__live__.clear()
+        self.__bytes__ = 0
+        self.__db__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- contadores ----------
+    def memory_bytes(self) -> int:
+        """Memoria estimada de las partidas calientes."""
+        return self.__bytes__
+
+    def stats(self) -> dict:
+        return {
+            "hot": self.hot(),
+            "cold": self.cold(),
+            "memory_bytes": self.__bytes__,
+            "hits": self.__hits__,
+            "misses": self.__misses__,
+            "evictions": self.__evictions__,
+            "rehydrations": self.__rehydrations__,
+        }
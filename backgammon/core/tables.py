@@ -0,0 +1,50 @@
+"""
+Tablas precalculadas de destinos por color y pip.
+
+Se indexan directamente con el color (WHITE = 1, BLACK = -1): cada tabla es
+una tupla de 3 elementos donde [1] es la de WHITE y [-1] (= [2]) la de BLACK.
+
+- DEST[color][origin][pip]: destino de un movimiento normal u OFF si sale del tablero
+- ENTRY[color][pip]: punto de entrada desde la barra u OFF
+- BEAR_DIST[color][origin]: pips que faltan para retirar la ficha (exacto)
+
+Los pips van de 0 a MAX_PIP (pip 0 -> OFF): cualquier pip mayor sale del
+tablero desde cualquier origen, así que no hace falta más de 24 columnas.
+"""
+OFF = None
+MAX_PIP = 24
+_WHITE = 1
+_BLACK = -1
+
+
+def _dest(origin: int, pip: int, color: int):
+    if pip <= 0:
+        return OFF
+    dest = origin - pip * color
+    return dest if 0 <= dest < 24 else OFF
+
+
+def _entry(pip: int, color: int):
+    if pip <= 0:
+        return OFF
+    dest = 24 - pip if color == _WHITE else pip - 1
+    return dest if 0 <= dest < 24 else OFF
+
+
+def _by_color(build):
+    return (None, build(_WHITE), build(_BLACK))
+
+
+DEST = _by_color(lambda c: tuple(tuple(_dest(o, pip, c) for pip in range(MAX_PIP + 1)) for o in range(24)))
+ENTRY = _by_color(lambda c: tuple(_entry(pip, c) for pip in range(MAX_PIP + 1)))
+BEAR_DIST = _by_color(lambda c: tuple(o + 1 if c == _WHITE else 24 - o for o in range(24)))
+
+
+def dest(origin: int, pip: int, color: int):
+    """DEST con pips > MAX_PIP incluidos (siempre OFF)."""
+    return DEST[color][origin][pip] if pip <= MAX_PIP else OFF
+
+
+def entry(pip: int, color: int):
+    """ENTRY con pips > MAX_PIP incluidos (siempre OFF)."""
+    return ENTRY[color][pip] if pip <= MAX_PIP else OFF
@@ -0,0 +1,55 @@
+"""
+Claves Zobrist de 64 bits para posiciones de Backgammon.
+
+Cada componente del estado tiene una clave aleatoria fija y el hash de una
+posición es el XOR de las claves de sus componentes, por lo que un cambio
+en un punto se actualiza con dos XOR (sale el valor viejo, entra el nuevo).
+
+- POINT_KEYS[idx][v + 127]: punto idx con valor con signo v (-127..127; v=0 -> 0)
+- BAR_KEYS[slot][n] / OFF_KEYS[slot][n]: n fichas en barra / off (slot 0 = WHITE, 1 = BLACK)
+- SIDE_KEY: se aplica cuando mueve BLACK
+- PIP_KEYS[pip][k]: pip (1..6) presente k veces entre los pips restantes
+"""
+import random
+
+MAX_COUNT = 127
+_SEED = 0x5EED_BAC6_A440
+
+_rnd = random.Random(_SEED)
+
+
+def _key() -> int:
+    return _rnd.getrandbits(64)
+
+
+POINT_KEYS = tuple(
+    tuple(0 if v == 0 else _key() for v in range(-MAX_COUNT, MAX_COUNT + 1))
+    for _ in range(24)
+)
+BAR_KEYS = tuple(tuple(0 if n == 0 else _key() for n in range(MAX_COUNT + 1)) for _ in range(2))
+OFF_KEYS = tuple(tuple(0 if n == 0 else _key() for n in range(MAX_COUNT + 1)) for _ in range(2))
+SIDE_KEY = _key()
+PIP_KEYS = tuple(tuple(0 if k == 0 else _key() for k in range(5)) for _ in range(7))
+
+del _rnd
+
+
+def slot(color: int) -> int:
+    """Índice de tabla por color: WHITE (=1) -> 0, BLACK (=-1) -> 1."""
+    return 0 if color == 1 else 1
+
+
+def board_hash(points, white_bar: int, black_bar: int, white_off: int, black_off: int) -> int:
+    """Hash completo (desde cero) de una posición."""
+    h = 0
+    for idx, v in enumerate(points):
+        h ^= POINT_KEYS[idx][v + MAX_COUNT]
+    return h ^ BAR_KEYS[0][white_bar] ^ BAR_KEYS[1][black_bar] ^ OFF_KEYS[0][white_off] ^ OFF_KEYS[1][black_off]
+
+
+def pips_key(pips) -> int:
+    """Clave de los pips restantes (independiente del orden)."""
+    h = 0
+    for pip in set(pips):
+        h ^= PIP_KEYS[pip][pips.count(pip)]
+    return h
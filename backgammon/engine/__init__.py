@@ -0,0 +1 @@
+# Paquete de motores de evaluación (bear-off, búsqueda, red neuronal)
@@ -0,0 +1,242 @@
+"""
+Base de datos one-sided de bear-off.
+
+Enumera todas las distribuciones de hasta 15 fichas en los 6 puntos del home
+(C(21, 6) = 54.264 posiciones) y guarda, para cada una, el número esperado de
+tiradas para retirar todo y la distribución P(terminar en exactamente k tiradas),
+jugando siempre la opción que minimiza el esperado.
+
+Posición = tupla de 6 conteos (c1..c6), c_k = fichas a k pips de salir.
+Desde un `Board` se obtiene con `home_counts(board, color)` usando
+`Board.home_indices`.
+
+Índice perfecto: las posiciones con n fichas ocupan [C(n+5, 6), C(n+6, 6)),
+y dentro de cada n se numeran por el sistema combinatorio de las 5 "barras"
+que separan los conteos. Así una base con menos fichas es prefijo de la completa.
+
+Archivo binario (little-endian): cabecera `<4sHHI` (magic, versión,
+max_checkers, cantidad) y luego un registro por índice: float32 esperado +
+MAX_ROLLS uint16 de probabilidad (escala 65535). Se abre con mmap: lectura
+O(1) sin copiar ni parsear el archivo.
+
+Uso: python -m backgammon.engine.bearoff --out saves/bearoff.db [--checkers 15]
+"""
+import argparse
+import mmap
+import struct
+import time
+from array import array
+from math import comb
+from pathlib import Path
+
+from backgammon.core.board import Board
+
+POINTS = 6
+MAX_CHECKERS = 15
+MAX_ROLLS = 32
+MAGIC = b"BGBO"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+RECORD = struct.Struct(f"<f{MAX_ROLLS}H")
+SCALE = 65535
+
+# 21 tiradas distintas con su peso (sobre 36)
+_ROLLS = tuple((a, b, 1 if a == b else 2) for a in range(1, 7) for b in range(a, 7))
+
+
+def num_positions(max_checkers: int = MAX_CHECKERS) -> int:
+    return comb(max_checkers + POINTS, POINTS)
+
+
+def position_index(counts) -> int:
+    """Índice perfecto de una distribución (c1..c6)."""
+    n = 0
+    idx = 0
+    bar = -1
+    for j in range(POINTS - 1):
+        n += counts[j]
+        bar += counts[j] + 1
+        idx += comb(bar, j + 1)
+    n += counts[POINTS - 1]
+    return comb(n + POINTS - 1, POINTS) + idx
+
+
+def home_counts(board, color: int) -> tuple:
+    """Conteos (c1..c6) del home del color; exige que no haya fichas fuera del home."""
+    if not board.all_in_home(color):
+        raise ValueError("El color tiene fichas fuera del home")
+    counts = [0] * POINTS
+    for i in board.home_indices(color):
+        dist = i + 1 if color == Board.WHITE else Board.NUM_POINTS - i
+        counts[dist - 1] = max(0, board.get_point(i) * color)
+    return tuple(counts)
+
+
+def _positions(max_checkers: int):
+    """Todas las posiciones con <= max_checkers fichas."""
+    def rec(prefix, left, k):
+        if k == POINTS - 1:
+            for c in range(left + 1):
+                yield prefix + (c,)
+            return
+        for c in range(left + 1):
+            yield from rec(prefix + (c,), left - c, k + 1)
+    yield from rec((), max_checkers, 0)
+
+
+def _step(pos: tuple, die: int) -> set:
+    """Posiciones tras mover una ficha con `die` (bear-off puro)."""
+    res = set()
+    high = max((p for p in range(POINTS) if pos[p]), default=-1)
+    for p in range(POINTS):
+        if not pos[p]:
+            continue
+        dist = p + 1
+        if dist < die and p != high:
+            continue  # retiro inexacto sólo desde el punto más alto
+        nxt = list(pos)
+        nxt[p] -= 1
+        if dist > die:
+            nxt[p - die] += 1
+        res.add(tuple(nxt))
+    return res
+
+
+def generate(max_checkers: int = MAX_CHECKERS):
+    """
+    Calcula (expected, dist) indexados por `position_index`:
+    expected: array('d'); dist: array('d') plano de MAX_ROLLS por posición.
+    """
+    if not (0 <= max_checkers <= MAX_CHECKERS):
+        raise ValueError("max_checkers debe estar entre 0 y 15")
+    n = num_positions(max_checkers)
+    expected = array("d", bytes(8 * n))
+    dist = array("d", bytes(8 * n * MAX_ROLLS))
+    # best[die][k][idx] = índice de la mejor posición final tras k movimientos de `die`
+    best = [[None] + [array("l", bytes(8 * n)) for _ in range(4)] for _ in range(7)]
+
+    positions = sorted(_positions(max_checkers), key=lambda c: sum((p + 1) * c[p] for p in range(POINTS)))
+    for pos in positions:
+        idx = position_index(pos)
+        if not any(pos):
+            dist[0] = 1.0
+            for die in range(1, 7):
+                for k in range(1, 5):
+                    best[die][k][idx] = idx
+            continue
+
+        steps = {die: [position_index(q) for q in _step(pos, die)] for die in range(1, 7)}
+        # mejores finales tras k movimientos del mismo dado (sucesores ya calculados)
+        for die in range(1, 7):
+            for k in range(1, 5):
+                if k == 1:
+                    best[die][1][idx] = min(steps[die], key=expected.__getitem__)
+                else:
+                    prev = best[die][k - 1]
+                    best[die][k][idx] = min((prev[q] for q in steps[die]), key=expected.__getitem__)
+
+        e = 1.0
+        acc = [0.0] * MAX_ROLLS
+        for (a, b, w) in _ROLLS:
+            if a == b:
+                fin = min((best[a][3][q] for q in steps[a]), key=expected.__getitem__)
+            else:
+                cands = [best[b][1][q] for q in steps[a]] + [best[a][1][q] for q in steps[b]]
+                fin = min(cands, key=expected.__getitem__)
+            p = w / 36.0
+            e += p * expected[fin]
+            base = fin * MAX_ROLLS
+            for k in range(MAX_ROLLS - 1):
+                acc[k + 1] += p * dist[base + k]
+            acc[MAX_ROLLS - 1] += p * dist[base + MAX_ROLLS - 1]  # cola truncada
+        expected[idx] = e
+        dist[idx * MAX_ROLLS:(idx + 1) * MAX_ROLLS] = array("d", acc)
+    return expected, dist
+
+
+def write_database(path, max_checkers: int = MAX_CHECKERS) -> int:
+    """Genera y escribe la base; devuelve la cantidad de posiciones."""
+    expected, dist = generate(max_checkers)
+    n = len(expected)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    buf = bytearray(HEADER.size + RECORD.size * n)
+    HEADER.pack_into(buf, 0, MAGIC, VERSION, max_checkers, n)
+    for idx in range(n):
+        probs = [min(SCALE, int(round(x * SCALE))) for x in dist[idx * MAX_ROLLS:(idx + 1) * MAX_ROLLS]]
+        RECORD.pack_into(buf, HEADER.size + idx * RECORD.size, expected[idx], *probs)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(buf)
+    tmp.replace(path)
+    return n
+
+
+class BearoffDatabase:
+    """Lectura O(1) vía mmap de un archivo generado por `write_database`."""
+
+    def __init__(self, path):
+        self.__file__ = open(path, "rb")
+        try:
+            self.__mm__ = mmap.mmap(self.__file__.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file__.close()
+            raise ValueError("Archivo de bear-off vacío")
+        magic, version, max_checkers, n = HEADER.unpack_from(self.__mm__, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("Archivo de bear-off inválido")
+        if len(self.__mm__) != HEADER.size + RECORD.size * n:
+            self.close()
+            raise ValueError("Archivo de bear-off truncado")
+        self.__max_checkers__ = max_checkers
+        self.__count__ = n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, "__mm__", None) is not None:
+            self.__mm__.close()
+            self.__mm__ = None
+        self.__file__.close()
+
+    def max_checkers(self) -> int:
+        return self.__max_checkers__
+
+    def __len__(self) -> int:
+        return self.__count__
+
+    def __offset__(self, counts) -> int:
+        if len(counts) != POINTS or any(c < 0 for c in counts):
+            raise ValueError("Se esperan 6 conteos no negativos")
+        if sum(counts) > self.__max_checkers__:
+            raise ValueError("Más fichas que las cubiertas por la base")
+        return HEADER.size + position_index(counts) * RECORD.size
+
+    def expected_rolls(self, counts) -> float:
+        return struct.unpack_from("<f", self.__mm__, self.__offset__(counts))[0]
+
+    def distribution(self, counts) -> list:
+        """P(terminar en exactamente k tiradas), k = 0..MAX_ROLLS-1."""
+        rec = RECORD.unpack_from(self.__mm__, self.__offset__(counts))
+        return [x / SCALE for x in rec[1:]]
+
+    def expected_rolls_board(self, board, color: int) -> float:
+        return self.expected_rolls(home_counts(board, color))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="backgammon-bearoff")
+    parser.add_argument("--out", default="saves/bearoff.db", help="Ruta del archivo a generar")
+    parser.add_argument("--checkers", type=int, default=MAX_CHECKERS, help="Máximo de fichas (<= 15)")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    n = write_database(args.out, args.checkers)
+    print(f"Posiciones: {n} | Archivo: {args.out} | Tiempo: {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Evaluador por red neuronal estilo TD-Gammon, en NumPy puro (requiere NumPy).
+
+Codificación de Tesauro (198 entradas) por lotes sobre `BatchBoard`:
+- Por color y por punto (24 x 2 x 4 = 192): unidades v>=1, v>=2, v>=3 y
+  (v-3)/2 si v>3. WHITE recorre sus puntos 1..24 (idx 0..23) y BLACK los
+  suyos (idx 23..0).
+- Barra n/2 y retiradas n/15 por color (4).
+- Color al turno: (1, 0) si mueve WHITE, (0, 1) si mueve BLACK (2).
+
+MLP de una capa oculta sigmoide y 5 salidas sigmoides, para el color al
+turno: P(ganar), P(ganar gammon), P(ganar backgammon), P(perder gammon),
+P(perder backgammon). Los pesos se guardan/cargan como `.npz`
+(claves w1, b1, w2, b2).
+
+`NNEvaluator` sirve como evaluador de `engine.search` (también por lotes con
+`evaluate_many`) y `MicroBatcher` agrupa pedidos sueltos en una sola pasada.
+"""
+import numpy as np
+
+from backgammon.core.batch_board import BLACK_BAR, CHECKERS, WHITE_BAR, BatchBoard
+from backgammon.core.board import Board
+
+NUM_INPUTS = 198
+NUM_OUTPUTS = 5
+HIDDEN = 80
+WIN, WIN_GAMMON, WIN_BACKGAMMON, LOSE_GAMMON, LOSE_BACKGAMMON = range(NUM_OUTPUTS)
+
+
+# ---------- codificación ----------
+def _units(counts):
+    """(N, 24) fichas >= 0 -> (N, 96) unidades de Tesauro."""
+    c = counts.astype(np.float32)
+    u = np.empty(counts.shape + (4,), dtype=np.float32)
+    u[..., 0] = c >= 1
+    u[..., 1] = c >= 2
+    u[..., 2] = c >= 3
+    u[..., 3] = np.maximum(c - 3, 0) / 2
+    return u.reshape(counts.shape[0], 96)
+
+
+def encode_cells(cells, to_move):
+    """
+    Codifica (N, 26) celdas de `BatchBoard` -> (N, 198) float32.
+    `to_move`: color al turno, escalar o arreglo de N.
+    """
+    cells = np.asarray(cells)
+    if cells.ndim != 2 or cells.shape[1] != 26:
+        raise ValueError("Se espera un arreglo (N, 26)")
+    n = cells.shape[0]
+    to_move = np.broadcast_to(np.asarray(to_move), (n,))
+    if not np.isin(to_move, (Board.WHITE, Board.BLACK)).all():
+        raise ValueError("Color inválido")
+    pts = cells[:, :24].astype(np.int16)
+    white = np.maximum(pts, 0)
+    black = np.maximum(-pts, 0)[:, ::-1]
+    wbar = cells[:, WHITE_BAR].astype(np.float32)
+    bbar = cells[:, BLACK_BAR].astype(np.float32)
+    woff = CHECKERS - white.sum(axis=1) - wbar
+    boff = CHECKERS - black.sum(axis=1) - bbar
+
+    x = np.empty((n, NUM_INPUTS), dtype=np.float32)
+    x[:, 0:96] = _units(white)
+    x[:, 96:192] = _units(black)
+    x[:, 192] = wbar / 2
+    x[:, 193] = bbar / 2
+    x[:, 194] = woff / CHECKERS
+    x[:, 195] = boff / CHECKERS
+    x[:, 196] = to_move == Board.WHITE
+    x[:, 197] = to_move == Board.BLACK
+    return x
+
+
+def encode(boards, to_move):
+    """Codifica una lista de tableros (o un `BatchBoard`) con el color al turno."""
+    batch = boards if isinstance(boards, BatchBoard) else BatchBoard.from_boards(boards)
+    return encode_cells(batch.cells(), to_move)
+
+
+def board_row(board) -> list:
+    """Fila (26,) de `BatchBoard` para un tablero."""
+    return [board.get_point(i) for i in range(24)] + [board.bar_count(Board.WHITE), board.bar_count(Board.BLACK)]
+
+
+def equity(probs):
+    """Equity cúbica-neutral (money) en [-3, 3] desde las 5 salidas."""
+    p = np.asarray(probs)
+    return (2 * p[..., WIN] - 1 + p[..., WIN_GAMMON] - p[..., LOSE_GAMMON]
+            + p[..., WIN_BACKGAMMON] - p[..., LOSE_BACKGAMMON])
+
+
+# ---------- red ----------
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class MLP:
+    """Perceptrón 198 -> hidden -> 5 con activaciones sigmoides."""
+
+    def __init__(self, w1, b1, w2, b2):
+        w1, b1, w2, b2 = (np.asarray(a, dtype=np.float32) for a in (w1, b1, w2, b2))
+        if w1.ndim != 2 or w1.shape[0] != NUM_INPUTS:
+            raise ValueError(f"w1 debe ser ({NUM_INPUTS}, hidden)")
+        hidden = w1.shape[1]
+        if b1.shape != (hidden,) or w2.shape != (hidden, NUM_OUTPUTS) or b2.shape != (NUM_OUTPUTS,):
+            raise ValueError("Dimensiones de pesos inconsistentes")
+        self.w1, self.b1, self.w2, self.b2 = w1, b1, w2, b2
+
+    @classmethod
+    def random(cls, hidden: int = HIDDEN, seed: int | None = None, scale: float = 0.1) -> "MLP":
+        rng = np.random.default_rng(seed)
+        return cls(rng.normal(0, scale, (NUM_INPUTS, hidden)), np.zeros(hidden),
+                   rng.normal(0, scale, (hidden, NUM_OUTPUTS)), np.zeros(NUM_OUTPUTS))
+
+    @classmethod
+    def load(cls, path) -> "MLP":
+        with np.load(path) as data:
+            missing = {"w1", "b1", "w2", "b2"} - set(data.files)
+            if missing:
+                raise ValueError(f"Faltan pesos en {path}: {', '.join(sorted(missing))}")
+            return cls(data["w1"], data["b1"], data["w2"], data["b2"])
+
+    def save(self, path) -> None:
+        np.savez(path, w1=self.w1, b1=self.b1, w2=self.w2, b2=self.b2)
+
+    def hidden_size(self) -> int:
+        return self.w1.shape[1]
+
+    def forward(self, x):
+        """(N, 198) -> (N, 5) probabilidades (gammon <= ganar, backgammon <= gammon)."""
+        h = _sigmoid(np.asarray(x, dtype=np.float32) @ self.w1 + self.b1)
+        out = _sigmoid(h @ self.w2 + self.b2)
+        # coherencia: P(bg) <= P(gammon) <= P(ganar) (y lo mismo para perder)
+        out[:, WIN_GAMMON] = np.minimum(out[:, WIN_GAMMON], out[:, WIN])
+        out[:, WIN_BACKGAMMON] = np.minimum(out[:, WIN_BACKGAMMON], out[:, WIN_GAMMON])
+        out[:, LOSE_GAMMON] = np.minimum(out[:, LOSE_GAMMON], 1 - out[:, WIN])
+        out[:, LOSE_BACKGAMMON] = np.minimum(out[:, LOSE_BACKGAMMON], out[:, LOSE_GAMMON])
+        return out
+
+
+class NNEvaluator:
+    """
+    Evaluador de `engine.search` sobre un `MLP`.
+
+    `evaluator(board, color)` se usa tras la jugada de `color` (mueve el
+    rival): codifica con el rival al turno y devuelve 2 * P(ganar color) - 1,
+    acotado a [-1, 1] como exige la poda de `search`.
+    """
+
+    def __init__(self, model: MLP):
+        self.model = model
+
+    @classmethod
+    def load(cls, path) -> "NNEvaluator":
+        return cls(MLP.load(path))
+
+    def probabilities(self, boards, to_move):
+        """(N, 5) salidas para una lista de tableros o un `BatchBoard`."""
+        return self.model.forward(encode(boards, to_move))
+
+    def evaluate_rows(self, rows, colors):
+        """Valores en [-1, 1] para filas (N, 26) evaluadas tras la jugada de `colors`."""
+        colors = np.asarray(colors)
+        p_win_mover = self.model.forward(encode_cells(rows, -colors))[:, WIN]
+        return 1.0 - 2.0 * p_win_mover
+
+    def evaluate_many(self, boards, colors) -> list:
+        rows = np.array([board_row(b) for b in boards], dtype=np.int8).reshape(-1, 26)
+        return self.evaluate_rows(rows, colors).tolist()
+
+    def __call__(self, board, color: int) -> float:
+        if board.off_count(color) >= CHECKERS:
+            return 1.0
+        if board.off_count(-color) >= CHECKERS:
+            return -1.0
+        return self.evaluate_many([board], [color])[0]
+
+
+class MicroBatcher:
+    """
+    Junta evaluaciones sueltas y las resuelve en una sola pasada de la red.
+
+        t = batcher.submit(board, color)   # copia la posición, no evalúa
+        ...
+        batcher.result(t)                  # evalúa todo lo pendiente (una vez)
+
+    Se evalúa automáticamente al llegar a `max_batch` pendientes.
+    """
+
+    def __init__(self, evaluator: NNEvaluator, max_batch: int = 256):
+        if max_batch <= 0:
+            raise ValueError("max_batch debe ser positivo")
+        self.__evaluator__ = evaluator
+        self.__max_batch__ = max_batch
+        self.__rows__ = []
+        self.__colors__ = []
+        self.__results__ = {}
+        self.__next__ = 0
+        self.__batches__ = 0
+
+    def submit(self, board, color: int) -> int:
+        ticket = self.__next__
+        self.__next__ += 1
+        self.__rows__.append(board_row(board))
+        self.__colors__.append(color)
+        if len(self.__rows__) >= self.__max_batch__:
+            self.flush()
+        return ticket
+
+    def flush(self) -> None:
+        if not self.__rows__:
+            return
+        first = self.__next__ - len(self.__rows__)
+        values = self.__evaluator__.evaluate_rows(np.array(self.__rows__, dtype=np.int8), self.__colors__)
+        for i, v in enumerate(values.tolist()):
+            self.__results__[first + i] = v
+        self.__rows__.clear()
+        self.__colors__.clear()
+        self.__batches__ += 1
+
+    def result(self, ticket: int) -> float:
+        """Valor de `ticket`; cada ticket se cobra una sola vez."""
+        if ticket not in self.__results__ and self.__next__ - len(self.__rows__) <= ticket < self.__next__:
+            self.flush()
+        if ticket not in self.__results__:
+            raise KeyError(f"Ticket ya consumido o desconocido: {ticket}")
+        return self.__results__.pop(ticket)
+
+    def batches(self) -> int:
+        """Pasadas de la red realizadas."""
+        return self.__batches__
@@ -0,0 +1,289 @@
+"""
+Búsqueda expectiminimax de 0/1/2-ply sobre `BackgammonGame`.
+
+Un ply = tirada del rival + su mejor respuesta:
+- 0-ply: evaluación estática tras cada jugada propia.
+- 1-ply: promedio sobre las 21 tiradas del rival (`dice.ROLLS`) de su mejor
+  respuesta evaluada estáticamente.
+- 2-ply: un nivel más (tirada propia + respuesta).
+
+Formulación negamax: los nodos de azar devuelven el valor para quien tira.
+Los evaluadores son funciones (board, color) -> valor en [EVAL_MIN, EVAL_MAX]
+desde el punto de vista de `color`, llamadas tras la jugada de `color`. Si
+además tienen `evaluate_many(boards, colors)` (p. ej. `engine.nn.NNEvaluator`),
+las hojas de cada nodo de azar se evalúan en un único lote.
+
+Poda en nodos de azar (Ballard):
+- Star1: con las tiradas ya sumadas y el resto acotado por [EVAL_MIN, EVAL_MAX]
+  se corta en cuanto el nodo no puede entrar en la ventana (alpha, beta).
+- Star2: antes se sondea la primera jugada (la mejor por orden estático) de
+  cada tirada; esos valores son cotas inferiores de cada tirada y permiten
+  cortar por arriba sin expandir el resto.
+
+Tabla de transposición (`LRUCache`) por hash Zobrist del tablero + color al
+turno y profundidad, con valores exactos o cotas. Las jugadas se ordenan por
+evaluación estática cuando debajo queda búsqueda.
+
+`Searcher.search` profundiza iterativamente hasta `ply` y reporta por ply
+nodos, hits de la tabla y tiempo.
+"""
+import math
+import time
+
+from backgammon.core import tables
+from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
+from backgammon.core.game import BackgammonGame
+from backgammon.core.zobrist import SIDE_KEY
+
+EVAL_MIN = -1.0
+EVAL_MAX = 1.0
+MAX_PLY = 2
+TT_SIZE = 200_000
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+# ---------- evaluadores ----------
+def pip_evaluator(board, color: int) -> float:
+    """Carrera: ventaja de pips comprimida a (-1, 1); ±1 si la partida terminó."""
+    if board.off_count(color) >= 15:
+        return EVAL_MAX
+    if board.off_count(-color) >= 15:
+        return EVAL_MIN
+    return math.tanh((board.pip_count(-color) - board.pip_count(color)) / 40.0)
+
+
+EVALUATORS = {
+    "pips": pip_evaluator,
+}
+
+
+def get_evaluator(name: str):
+    if name not in EVALUATORS:
+        raise ValueError(f"Evaluador desconocido: {name} (opciones: {', '.join(sorted(EVALUATORS))})")
+    return EVALUATORS[name]
+
+
+# ---------- jugadas sobre el tablero ----------
+def _apply_play(board, color: int, play) -> list:
+    """Aplica una jugada (pasos (origin, pip)) y devuelve los registros para deshacerla."""
+    undos = []
+    for (origin, pip) in play:
+        if origin == -1:
+            dest = tables.ENTRY[color][pip]
+        else:
+            dest = tables.DEST[color][origin][pip]
+        undos.append(BackgammonGame._board_apply(board, color, origin, dest, pip))
+    return undos
+
+
+def _undo_play(board, undos) -> None:
+    for u in reversed(undos):
+        board._undo(*u)
+
+
+class Searcher:
+    """Motor expectiminimax con tabla de transposición persistente entre llamadas."""
+
+    def __init__(self, evaluator=pip_evaluator, tt_size: int = TT_SIZE, move_cache: LRUCache | None = None):
+        if not callable(evaluator):
+            raise ValueError("evaluator debe ser una función (board, color) -> float")
+        self.__evaluator__ = evaluator
+        self.__tt__ = LRUCache(tt_size)
+        self.__move_cache__ = move_cache if move_cache is not None else LRUCache(65536)
+        self.__nodes__ = 0
+        self.__tt_hits__ = 0
+
+    def tt(self) -> LRUCache:
+        return self.__tt__
+
+    # ---------- API ----------
+    def search(self, game: BackgammonGame, ply: int = 1, roll: tuple[int, int] | None = None,
+               time_limit: float | None = None) -> dict:
+        """
+        Mejor jugada para el color al turno con la tirada `roll` (o los pips
+        restantes del turno). Profundiza 0..ply; con `time_limit` (segundos) no
+        empieza un ply nuevo si ya se superó. El tablero queda como estaba.
+
+        Devuelve {play, value, ply, nodes, tt_hits, elapsed, per_ply: [...]},
+        con per_ply = [{ply, play, value, nodes, tt_hits, elapsed}, ...].
+        """
+        if not isinstance(ply, int) or not (0 <= ply <= MAX_PLY):
+            raise ValueError(f"ply debe estar entre 0 y {MAX_PLY}")
+        if roll is None and not game.pips():
+            raise ValueError("No hay tirada: pasar roll o iniciar el turno")
+        plays = game.legal_plays(roll)
+        color = game._current_color_int()
+        view = self.__view__(game.board(), color)
+
+        t_start = time.perf_counter()
+        per_ply = []
+        values = {}
+        for depth in range(ply + 1):
+            if time_limit is not None and per_ply and time.perf_counter() - t_start > time_limit:
+                break
+            self.__nodes__ = 0
+            self.__tt_hits__ = 0
+            t0 = time.perf_counter()
+            # orden: resultado del ply anterior (profundización iterativa)
+            order = sorted(plays, key=lambda p: -values.get(p, 0.0)) if values else plays
+            best, best_value = order[0], None
+            for play in order:
+                alpha = EVAL_MIN if best_value is None else best_value
+                value = self.__after_play__(view, color, play, depth, alpha, EVAL_MAX)
+                values[play] = value
+                if best_value is None or value > best_value:
+                    best, best_value = play, value
+            per_ply.append({
+                "ply": depth, "play": best, "value": best_value,
+                "nodes": self.__nodes__, "tt_hits": self.__tt_hits__,
+                "elapsed": time.perf_counter() - t0,
+            })
+        last = per_ply[-1]
+        return {
+            "play": last["play"], "value": last["value"], "ply": last["ply"],
+            "nodes": sum(p["nodes"] for p in per_ply),
+            "tt_hits": sum(p["tt_hits"] for p in per_ply),
+            "elapsed": time.perf_counter() - t_start,
+            "per_ply": per_ply,
+        }
+
+    def evaluate(self, game: BackgammonGame, ply: int = 1) -> float:
+        """Valor esperado (antes de tirar) para el color al turno."""
+        if not isinstance(ply, int) or not (0 <= ply <= MAX_PLY):
+            raise ValueError(f"ply debe estar entre 0 y {MAX_PLY}")
+        color = game._current_color_int()
+        view = self.__view__(game.board(), color)
+        self.__nodes__ = 0
+        self.__tt_hits__ = 0
+        if ply == 0:
+            return self.__evaluator__(game.board(), color)
+        return self.__chance__(view, ply, EVAL_MIN, EVAL_MAX)
+
+    # ---------- internos ----------
+    def __view__(self, board, color: int) -> BackgammonGame:
+        """Juego auxiliar sobre el mismo tablero para generar jugadas de ambos colores."""
+        view = BackgammonGame(board, move_cache=self.__move_cache__)
+        view.add_player("White", "white")
+        view.add_player("Black", "black")
+        if color == Board.BLACK:
+            view.next_turn()
+        return view
+
+    def __after_play__(self, view, color: int, play, depth: int, alpha: float, beta: float) -> float:
+        """Valor para `color` de aplicar `play` y que tire el rival con `depth` plies."""
+        board = view.board()
+        undos = _apply_play(board, color, play)
+        try:
+            if board.off_count(color) >= 15:
+                return EVAL_MAX
+            if depth == 0:
+                self.__nodes__ += 1
+                return self.__evaluator__(board, color)
+            view.next_turn()
+            try:
+                return -self.__chance__(view, depth, -beta, -alpha)
+            finally:
+                view.next_turn()
+        finally:
+            _undo_play(board, undos)
+
+    def __ordered__(self, view, color: int, plays: list) -> list:
+        """Jugadas ordenadas por evaluación estática (mejor primero)."""
+        board = view.board()
+        scored = []
+        for play in plays:
+            undos = _apply_play(board, color, play)
+            scored.append((self.__evaluator__(board, color), play))
+            _undo_play(board, undos)
+        scored.sort(key=lambda t: -t[0])
+        return [p for (_, p) in scored]
+
+    def __chance__(self, view, depth: int, alpha: float, beta: float) -> float:
+        """Nodo de azar: valor esperado para quien tira, con poda Star1/Star2."""
+        board = view.board()
+        color = view._current_color_int()
+        key = BackgammonGame._board_key(board)
+        if color == Board.BLACK:
+            key ^= SIDE_KEY
+        entry = self.__tt__.get((key, depth))
+        if entry is not None:
+            value, flag = entry
+            if flag == _EXACT or (flag == _LOWER and value >= beta) or (flag == _UPPER and value <= alpha):
+                self.__tt_hits__ += 1
+                return value
+        self.__nodes__ += 1
+
+        if depth == 1 and hasattr(self.__evaluator__, "evaluate_many"):
+            total = self.__batched_leaves__(view, color, view.plays_by_roll())
+            self.__tt__.put((key, depth), (total, _EXACT))
+            return total
+
+        rolls = []
+        for (_roll, prob, plays) in view.plays_by_roll():
+            if depth > 1 and len(plays) > 1:
+                plays = self.__ordered__(view, color, plays)
+            rolls.append((prob, plays))
+
+        # Star2: sondeo de la primera jugada de cada tirada (cota inferior por tirada)
+        probes = []
+        for (prob, plays) in rolls:
+            probes.append(self.__after_play__(view, color, plays[0], depth - 1, EVAL_MIN, EVAL_MAX))
+        lower = sum(p * v for ((p, _), v) in zip(rolls, probes))
+        if lower >= beta:
+            self.__tt__.put((key, depth), (lower, _LOWER))
+            return lower
+
+        # Star1: barrido completo acotando lo que falta
+        total = 0.0
+        rest_prob = 1.0
+        rest_lower = lower
+        for i, (prob, plays) in enumerate(rolls):
+            rest_prob -= prob
+            rest_lower -= prob * probes[i]
+            lo = (alpha - total - rest_prob * EVAL_MAX) / prob
+            hi = (beta - total - rest_lower) / prob
+            best = probes[i]
+            if best < hi:
+                for play in plays[1:]:
+                    v = self.__after_play__(view, color, play, depth - 1, max(lo, best), hi)
+                    if v > best:
+                        best = v
+                        if best >= hi:
+                            break
+            total += prob * best
+            if total + rest_prob * EVAL_MAX <= alpha:
+                bound = total + rest_prob * EVAL_MAX
+                self.__tt__.put((key, depth), (bound, _UPPER))
+                return bound
+            if total + rest_lower >= beta:
+                bound = total + rest_lower
+                self.__tt__.put((key, depth), (bound, _LOWER))
+                return bound
+        self.__tt__.put((key, depth), (total, _EXACT))
+        return total
+
+    def __batched_leaves__(self, view, color: int, rolls) -> float:
+        """Nodo de azar con hojas estáticas: todas las jugadas de las 21 tiradas en un lote."""
+        board = view.board()
+        boards, spans, wins = [], [], set()
+        for (_roll, prob, plays) in rolls:
+            start = len(boards)
+            for play in plays:
+                undos = _apply_play(board, color, play)
+                if board.off_count(color) >= 15:
+                    wins.add(len(boards))
+                boards.append(board.copy())
+                _undo_play(board, undos)
+            spans.append((prob, start, len(boards)))
+        values = self.__evaluator__.evaluate_many(boards, [color] * len(boards))
+        for i in wins:
+            values[i] = EVAL_MAX
+        self.__nodes__ += len(boards)
+        return sum(prob * max(values[a:b]) for (prob, a, b) in spans)
+
+
+def best_play(game: BackgammonGame, ply: int = 1, evaluator=pip_evaluator) -> tuple:
+    """Atajo: mejor jugada del turno actual con un `Searcher` nuevo."""
+    return Searcher(evaluator).search(game, ply)["play"]
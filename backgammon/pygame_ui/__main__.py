@@ -1,4 +1,17 @@
-def main():
+import sys
+
+# Sin eventos ni nada que redibujar, los loops se bloquean en pygame.event.wait
+# hasta este timeout (ms) en lugar de girar a 60 FPS.
+IDLE_WAIT_MS = 500
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] == "render":
+        # render headless a PNG (no abre ventana)
+        from backgammon.pygame_ui import export
+        return export.main(argv[1:])
+
     # Import lazy para no romper CI si no está pygame
     try:
         import pygame
@@ -6,116 +19,44 @@ def main():
         print("Pygame no está instalado. Instalá con: pip install pygame")
         return
 
-    from backgammon.core.board import Board
     from backgammon.core.game import BackgammonGame
+    from backgammon.pygame_ui.render import (W, H, LAST_MOVE_CLR, RIVAL_TURN_CLR, BoardRenderer,
+                                             owner_label, current_color_int, status_lines)
+    from backgammon.pygame_ui.export import encode_png
+    from backgammon.pygame_ui.writer import BackgroundWriter
+    from backgammon.core.journal import Journal, load_game as load_saved
     import time, json
     from pathlib import Path
 
-    # --- Config ---
-    W, H = 800, 600
-    MARGIN = 40
-    TRI_H = 120
-    PANEL_W = 260
-    BG = (240, 240, 240)
-    BG_PANEL = (230, 234, 244)
-    SEP = (200, 200, 210)
-    TOP_CLR = (50, 90, 160)
-    BOT_CLR = (160, 90, 50)
-    TXT = (20, 20, 20)
-    HILIGHT = (240, 200, 60)
-    SELECT = (120, 200, 120)
-    LEGAL = (60, 190, 140)
-    OUTLINE = (30, 30, 30)
-
-    CHECKER_WHITE = (250, 250, 250)
-    CHECKER_BLACK = (30, 30, 30)
-    CHECKER_EDGE  = (10, 10, 10)
-    R = 10
-    GAP = 2
-    BADGE_R = 10
-
-    BOARD_LEFT = MARGIN
-    BOARD_RIGHT = W - MARGIN - PANEL_W
-    BOARD_W = BOARD_RIGHT - BOARD_LEFT
-
-    # Colores para trails
-    LAST_MOVE_CLR   = (20, 160, 120)   # última jugada mía (verde)
-    RIVAL_TURN_CLR  = (160, 80, 200)   # jugadas del turno anterior (violeta)
-
-    # --- Helpers geom ---
-    def tri_polygon_top(i, col_w):
-        x0 = BOARD_LEFT + i * col_w
-        x1 = x0 + col_w
-        return [(x0, MARGIN), (x1, MARGIN), ((x0 + x1) / 2, MARGIN + TRI_H)]
-
-    def tri_polygon_bottom(i, col_w):
-        x0 = BOARD_LEFT + i * col_w
-        x1 = x0 + col_w
-        return [(x0, H - MARGIN), (x1, H - MARGIN),
-                ((x0 + x1) / 2, H - MARGIN - TRI_H)]
-
-    def tri_center(idx, col_w):
-        cx = BOARD_LEFT + (idx % 12) * col_w + col_w / 2
-        cy = (MARGIN + TRI_H / 2) if idx <= 11 else (H - MARGIN - TRI_H / 2)
-        return (int(cx), int(cy))
-
-    def hover_index(mx, my, col_w):
-        if not (BOARD_LEFT <= mx <= BOARD_RIGHT):
-            return None
-        if MARGIN <= my <= MARGIN + TRI_H:
-            i = int((mx - BOARD_LEFT) // col_w)
-            return i if 0 <= i < 12 else None
-        if (H - MARGIN - TRI_H) <= my <= (H - MARGIN):
-            i = int((mx - BOARD_LEFT) // col_w)
-            return 12 + i if 0 <= i < 12 else None
-        return None
-
-    # --- Helpers de juego/UI ---
-    def owner_label(owner):
-        return "White" if owner == Board.WHITE else ("Black" if owner == Board.BLACK else "Empty")
-
-    def current_color_int(game):
-        p = game.current_player()
-        # Soporta Player con getters o atributo interno
-        if hasattr(p, "get_color") and callable(p.get_color):
-            color = p.get_color()
-        else:
-            color = getattr(p, "_Player__color__", getattr(p, "color", None))
-        return Board.WHITE if color == "white" else Board.BLACK
-
-    def snapshot_points(b: Board):
-        return tuple(b.get_point(i) for i in range(24))
+    # guardado explícito (G / L / Cargar) y autoguardado por journal en archivos separados:
+    # una partida nueva nunca pisa el guardado de G
+    SAVEDIR = Path("saves")
+    SAVEFILE = SAVEDIR / "last.json"
+    AUTOSAVE = SAVEDIR / "last.journal"
+    AUTOSAVE_LABEL = "Autoguardado"  # etiqueta de las compactaciones que el journal encola en el writer
 
-    def restore_points(b: Board, snap):
-        for i, v in enumerate(snap):
-            b.set_point(i, v)
+    # codificación en el hilo de escritura (el hilo principal sólo copia superficie / arma el dict)
+    def encode_surface(surface) -> bytes:
+        return encode_png(pygame.image.tobytes(surface, "RGB"), *surface.get_size())
 
-    def snapshot_game(game, board):
-        return (snapshot_points(board), game.pips(), game.last_roll())
+    def encode_json(data: dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
-    def restore_game(game, board, snap):
-        pts, pips, last_roll = snap
-        restore_points(board, pts)
-        game._BackgammonGame__pips__ = tuple(pips)
-        game._BackgammonGame__last_roll__ = last_roll
+    def wait_events(busy: bool):
+        """Eventos pendientes; si no hay y no queda nada por dibujar, bloquea hasta el próximo (o el timeout)."""
+        events = pygame.event.get()
+        if events or busy:
+            return events
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        return [] if event.type == pygame.NOEVENT else [event, *pygame.event.get()]
 
-    def compute_legal_dests_with_pips(b: Board, origin: int, color: int, pips):
-        res = []
-        for pip in sorted(set(pips)):
-            try:
-                dest = b.dest_from(origin, pip, color)
-                if b.can_move(origin, pip, color):
-                    res.append((dest, pip))
-            except Exception:
-                continue
-        return res
+    def compute_legal_dests_with_pips(game: BackgammonGame, origin: int):
+        # filtra los movimientos legales del juego (cacheados por posición y pips)
+        return [(d, pip) for (o, d, pip) in game.legal_moves() if o == origin]
 
     # ---------- escena de juego (reusa tu loop existente) ----------
-    def run_game_loop(screen, clock, font, font_small, font_badge, preloaded_game: "BackgammonGame|None" = None):
-        nonlocal LAST_MOVE_CLR, RIVAL_TURN_CLR, LEGAL, OUTLINE
-        nonlocal BOARD_W, BOARD_LEFT, MARGIN, TRI_H, PANEL_W, BG, BG_PANEL, SEP, TOP_CLR, BOT_CLR, TXT
-        nonlocal R, GAP, BADGE_R, BOARD_RIGHT, W, H
-
+    def run_game_loop(screen, clock, renderer: BoardRenderer, writer: BackgroundWriter,
+                      preloaded_game: "BackgammonGame|None" = None, journal: "Journal|None" = None):
         # Juego real (opcionalmente pre-cargado)
         if preloaded_game is not None:
             game = preloaded_game
@@ -125,8 +66,11 @@ def main():
             game.add_player("Black", "black")
             game.setup_board()
         board = game.board()
-
-        col_w = BOARD_W / 12
+        layout = renderer.layout(screen.get_size())
+        # cada acción aplicada agrega un registro; deshacer/resetear/cargar compactan en el writer.
+        # Un journal nuevo recién escribe con la primera acción: entrar y salir no pisa el anterior.
+        if journal is None:
+            journal = Journal(AUTOSAVE, writer=writer)
 
         # Estado UI
         origin_idx = None
@@ -135,8 +79,7 @@ def main():
         last_move = None      # (origin, dest, color, pip)
 
         # Historial/turnos
-        history = []                 # snapshots para U
-        turn_start_snap = None
+        history = []                 # registros de make_move para U / C (sin copiar tablero)
         turn_moves_text = []         # ["7->4 (pip 3)", ...]
         turn_moves_struct = []       # [(o,d,color,pip), ...]
         last_completed_turn_struct = []  # jugadas del turno anterior (del rival)
@@ -146,50 +89,57 @@ def main():
 
         def start_turn_and_reset_ui(roll_tuple=None):
             nonlocal origin_idx, selected_idx, legal_dests, last_move
-            nonlocal history, turn_start_snap, turn_moves_text, turn_moves_struct, message
+            nonlocal history, turn_moves_text, turn_moves_struct, message
             if roll_tuple:
                 game.start_turn(roll_tuple)
             else:
                 game.start_turn()
+            journal.started(game)
             origin_idx = selected_idx = None
             legal_dests = []
             last_move = None
             history.clear()
             turn_moves_text.clear()
             turn_moves_struct.clear()
-            turn_start_snap = snapshot_game(game, board)
             message = f"Dados: {game.last_roll()} | Pips: {game.pips()}"
 
         # Guardar / Cargar
-        SAVEDIR = Path("saves"); SAVEDIR.mkdir(exist_ok=True)
-        SAVEFILE = SAVEDIR / "last.json"
-
         def save_game():
-            data = game.to_dict()
-            with open(SAVEFILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            return str(SAVEFILE)
+            # el dict se arma acá; el JSON se codifica y escribe en el hilo de fondo
+            return writer.submit(SAVEFILE, encode_json, game.to_dict(), "Guardado")
 
         def load_game():
+            writer.wait()  # un guardado en curso termina antes de leer
             if not SAVEFILE.exists():
                 return None
-            with open(SAVEFILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return BackgammonGame.from_dict(data)
+            return load_saved(SAVEFILE)
+
+        # lectura de rendimiento: FPS y tiempo de trabajo por cuadro (sin la espera de clock.tick)
+        frame_ms = 0.0
+        readout = ""
+        readout_at = 0.0
+        full = True                  # el primer cuadro (y al volver del menú) se dibuja entero
+        writer.poll()                # resultados de una partida anterior ya no interesan
 
         running = True
         while running:
+            # modo idle: sin eventos no se redibuja (al despertar por timeout, draw sólo compara)
+            events = wait_events(busy=full)
+            t_frame = time.perf_counter()
             mx, my = pygame.mouse.get_pos()
-            idx_hover = hover_index(mx, my, col_w)
+            idx_hover = layout.hover_index(mx, my)
             cur_color = current_color_int(game)
             pips = game.pips()
 
             # Eventos
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     # volver al menú
                     running = False
 
+                elif event.type == pygame.WINDOWEXPOSED:
+                    full = True
+
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         if origin_idx is not None or selected_idx is not None:
@@ -219,6 +169,7 @@ def main():
                             # Guardamos las jugadas del turno actual como "turno anterior"
                             last_completed_turn_struct = list(turn_moves_struct)
                             game.end_turn()
+                            journal.ended(game)
                             # limpiar selección/estado de UI
                             origin_idx = selected_idx = None
                             legal_dests = []
@@ -235,6 +186,7 @@ def main():
                             # Si rota, el turno anterior pasa a ser lo que se jugó (si algo se jugó)
                             rotated = game.auto_end_turn()
                             if rotated:
+                                journal.ended(game)
                                 last_completed_turn_struct = list(turn_moves_struct)
                                 origin_idx = selected_idx = None
                                 legal_dests = []
@@ -248,8 +200,8 @@ def main():
 
                     elif event.key == pygame.K_u:
                         if history:
-                            snap = history.pop()
-                            restore_game(game, board, snap)
+                            game.unmake(history.pop())
+                            journal.checkpoint(game)
                             if turn_moves_text:
                                 turn_moves_text.pop()
                             if turn_moves_struct:
@@ -261,9 +213,10 @@ def main():
                             message = "No hay jugadas para deshacer"
 
                     elif event.key == pygame.K_c:
-                        if turn_start_snap is not None:
-                            restore_game(game, board, turn_start_snap)
-                            history.clear()
+                        if game.last_roll() is not None:
+                            while history:
+                                game.unmake(history.pop())
+                            journal.checkpoint(game)
                             turn_moves_text.clear()
                             turn_moves_struct.clear()
                             origin_idx = selected_idx = None
@@ -278,6 +231,7 @@ def main():
                         game.add_player("White", "white")
                         game.add_player("Black", "black")
                         game.setup_board()
+                        journal.checkpoint(game)
                         board = game.board()
                         origin_idx = selected_idx = None
                         legal_dests = []
@@ -289,22 +243,30 @@ def main():
                         message = "Tablero reseteado (tirar con ESPACIO/F)"
 
                     elif event.key == pygame.K_s:
-                        Path("screens").mkdir(parents=True, exist_ok=True)
                         fn = f"screens/snap-{time.strftime('%Y%m%d-%H%M%S')}.png"
-                        pygame.image.save(screen, fn)
-                        message = f"Captura guardada: {fn}"
+                        if writer.submit(fn, encode_surface, screen.copy(), "Captura guardada"):
+                            message = f"Guardando captura: {fn}..."
+                        else:
+                            message = "Escrituras pendientes: reintentar"
 
                     # Guardar / Cargar
                     elif event.key == pygame.K_g:
-                        fn = save_game()
-                        message = f"Guardado: {fn}"
+                        if save_game():
+                            message = f"Guardando: {SAVEFILE}..."
+                        else:
+                            message = "Escrituras pendientes: reintentar"
 
                     elif event.key == pygame.K_l:
-                        new_g = load_game()
-                        if new_g is None:
-                            message = "No hay guardado para cargar"
+                        try:
+                            new_g = load_game()
+                        except ValueError as ex:
+                            new_g, message = None, str(ex)
                         else:
+                            if new_g is None:
+                                message = "No hay guardado para cargar"
+                        if new_g is not None:
                             game = new_g
+                            journal.checkpoint(game)
                             board = game.board()
                             origin_idx = selected_idx = None
                             legal_dests = []
@@ -350,7 +312,7 @@ def main():
                                         message = "Sin pips. Tirar dados con ESPACIO."
                                         legal_dests = []
                                     else:
-                                        legal_dests = compute_legal_dests_with_pips(board, origin_idx, cur_color, pips)
+                                        legal_dests = compute_legal_dests_with_pips(game, origin_idx)
                                         if not legal_dests:
                                             message = "Sin destinos legales para los pips actuales"
                                         else:
@@ -368,9 +330,11 @@ def main():
                                 message = "Error interno: pip no encontrado"
                                 continue
 
-                            # Snapshot para U
-                            history.append(snapshot_game(game, board))
-                            real_dest = game.apply_move(origin_idx, pip)
+                            # Registro para U / C
+                            rec = game.make_move(origin_idx, pip)
+                            history.append(rec)
+                            journal.moved(game, rec)
+                            real_dest = rec[2]
                             last_move = (origin_idx, real_dest, cur_color, pip)
                             turn_moves_text.append(f"{origin_idx}->{real_dest} (pip {pip})")
                             turn_moves_struct.append((origin_idx, real_dest, cur_color, pip))
@@ -380,155 +344,47 @@ def main():
                             selected_idx = None
                             legal_dests = []
 
-            # ---- Dibujo ----
-            screen.fill(BG)
-            col_w = BOARD_W / 12
-
-            # Triángulos superiores
-            for i in range(12):
-                poly = tri_polygon_top(i, col_w)
-                color = SELECT if i == origin_idx else (HILIGHT if i == idx_hover else TOP_CLR)
-                border_w = 3 if i == origin_idx else (2 if i == idx_hover else 0)
-                pygame.draw.polygon(screen, color, poly)
-                if border_w:
-                    pygame.draw.polygon(screen, OUTLINE, poly, width=border_w)
-
-            # Triángulos inferiores
-            for i in range(12):
-                idx = 12 + i
-                poly = tri_polygon_bottom(i, col_w)
-                color = SELECT if idx == origin_idx else (HILIGHT if idx == idx_hover else BOT_CLR)
-                border_w = 3 if idx == origin_idx else (2 if idx == idx_hover else 0)
-                pygame.draw.polygon(screen, color, poly)
-                if border_w:
-                    pygame.draw.polygon(screen, OUTLINE, poly, width=border_w)
-
-            # Destinos legales (borde + badge)
-            if origin_idx is not None and legal_dests:
-                for (d, pip) in legal_dests:
-                    poly = tri_polygon_top(d, col_w) if d <= 11 else tri_polygon_bottom(d - 12, col_w)
-                    pygame.draw.polygon(screen, LEGAL, poly, width=4)  # borde más marcado
-                    bx, by = tri_center(d, col_w)
-                    by = by - 16 if d <= 11 else by + 16
-                    pygame.draw.circle(screen, LEGAL, (bx, by), BADGE_R)
-                    txt = font_badge.render(str(pip), True, (255, 255, 255))
-                    screen.blit(txt, txt.get_rect(center=(bx, by)))
-
-            # Fichas
-            def draw_stack(i_idx, top_band: bool):
-                owner = board.owner_at(i_idx)
-                cnt = board.count_at(i_idx)
-                if cnt == 0:
-                    return
-                color_fill = CHECKER_WHITE if owner == Board.WHITE else CHECKER_BLACK
-                cx = BOARD_LEFT + (i_idx % 12) * col_w + col_w / 2
-                if top_band:
-                    for k in range(min(cnt, 5)):
-                        cy = MARGIN + R + k * (2 * R + GAP)
-                        pygame.draw.circle(screen, color_fill, (int(cx), int(cy)), R)
-                        pygame.draw.circle(screen, CHECKER_EDGE, (int(cx), int(cy)), R, width=1)
-                    if cnt > 5:
-                        extra = font_small.render(f"+{cnt-5}", True, TXT)
-                        screen.blit(extra, extra.get_rect(center=(cx, MARGIN + TRI_H - 10)))
-                else:
-                    for k in range(min(cnt, 5)):
-                        cy = H - MARGIN - R - k * (2 * R + GAP)
-                        pygame.draw.circle(screen, color_fill, (int(cx), int(cy)), R)
-                        pygame.draw.circle(screen, CHECKER_EDGE, (int(cx), int(cy)), R, width=1)
-                    if cnt > 5:
-                        extra = font_small.render(f"+{cnt-5}", True, TXT)
-                        screen.blit(extra, extra.get_rect(center=(cx, H - MARGIN - TRI_H + 10)))
-
-            for i in range(12):
-                draw_stack(i, True)
-            for i in range(12, 24):
-                draw_stack(i, False)
-
-            # Último movimiento propio (línea)
-            if last_move is not None:
-                o, d, _, _ = last_move
-                x0, y0 = tri_center(o, col_w)
-                x1, y1 = tri_center(d, col_w)
-                pygame.draw.line(screen, LAST_MOVE_CLR, (x0, y0), (x1, y1), width=4)
-
-            # Jugadas del turno anterior (rival), si están habilitadas
-            if show_rival_trail and last_completed_turn_struct:
-                for (o, d, _color, _pip) in last_completed_turn_struct:
-                    x0, y0 = tri_center(o, col_w)
-                    x1, y1 = tri_center(d, col_w)
-                    pygame.draw.line(screen, RIVAL_TURN_CLR, (x0, y0), (x1, y1), width=3)
-
-            # Panel lateral (único)
-            panel_x = W - MARGIN - PANEL_W
-            pygame.draw.rect(screen, BG_PANEL, pygame.Rect(panel_x, MARGIN, PANEL_W, H - 2 * MARGIN), border_radius=8)
-            pygame.draw.line(screen, SEP, (panel_x - 6, MARGIN), (panel_x - 6, H - MARGIN), 2)
-
-            fps = clock.get_fps()
-            screen.blit(font_small.render(f"{fps:.0f} FPS", True, TXT), (panel_x + PANEL_W - 40, MARGIN + 6))
-            screen.blit(font.render("Ayuda", True, TXT), (panel_x + 10, MARGIN + 4))
-
-            help_lines = [
-                "- ESPACIO: tirar dados  | F: tirada fija (3,4)",
-                "- Click: ORIGEN → DESTINO (usa pip)  |  Click der.: cancelar",
-                "- U: deshacer  |  C: cancelar turno",
-                "- E: fin de turno  |  A: auto-end si no hay jugadas",
-                "- V: ver/ocultar turno rival",
-                "- G: guardar  |  L: cargar",
-                "- R: reset  |  S: captura  |  ESC/Q: menú",
-            ]
-            y = MARGIN + 32
-            for line in help_lines:
-                surf = font_small.render(line, True, TXT)
-                screen.blit(surf, (panel_x + 10, y)); y += 18
-
-            # Totales y estado ampliado (incluye barra/off de ambos colores)
-            white_total = board.count_total(Board.WHITE)
-            black_total = board.count_total(Board.BLACK)
-
-            # Conteos de barra / off de forma robusta
-            white_bar = board.bar_count(Board.WHITE)
-            black_bar = board.bar_count(Board.BLACK)
-            if hasattr(board, "off_count"):
-                white_off = board.off_count(Board.WHITE)
-                black_off = board.off_count(Board.BLACK)
-            else:
-                # fallback a API de Game si Board no exportara off_count
-                white_off = game.borne_off_count(Board.WHITE)
-                black_off = game.borne_off_count(Board.BLACK)
-
-            cur_lbl = owner_label(current_color_int(game))
-            roll = game.last_roll()
-            pips_txt = str(game.pips())
-
-            # Bloque “Estado”
-            state_y = H - MARGIN - 174
-            screen.blit(font_small.render(f"Jugador: {cur_lbl}", True, TXT), (panel_x + 10, state_y)); state_y += 18
-            screen.blit(font_small.render(f"Dados:   {roll}",   True, TXT), (panel_x + 10, state_y)); state_y += 18
-            screen.blit(font_small.render(f"Pips:    {pips_txt}",True, TXT), (panel_x + 10, state_y)); state_y += 18
-            screen.blit(font_small.render(f"White: board {white_total}  | bar {white_bar}  | off {white_off}", True, TXT), (panel_x + 10, state_y)); state_y += 18
-            screen.blit(font_small.render(f"Black: board {black_total}  | bar {black_bar}  | off {black_off}", True, TXT), (panel_x + 10, state_y)); state_y += 18
-
-            # Mensaje de estado (una sola línea)
-            msg_txt = (message or "Listo")
-            if len(msg_txt) > 42:
-                msg_txt = msg_txt[:39] + "..."
-            screen.blit(font_small.render(msg_txt, True, TXT), (panel_x + 10, state_y)); state_y += 12
-
-            # Lista de movimientos del turno (máx. 6, más nuevo arriba)
-            list_title_y = state_y + 16
-            screen.blit(font_small.render("Turno (últimos 6):", True, TXT), (panel_x + 10, list_title_y))
-            y_list = list_title_y + 16
-            for mv in turn_moves_text[-6:][::-1]:
-                if y_list > H - MARGIN - 6:
-                    break
-                screen.blit(font_small.render(f"• {mv}", True, TXT), (panel_x + 14, y_list))
-                y_list += 16
+            # escrituras terminadas en segundo plano (WRITE_DONE despierta el loop)
+            for (label, path, error) in writer.poll():
+                if error is None and label == AUTOSAVE_LABEL:
+                    continue  # el autoguardado es silencioso (sólo se avisan los errores)
+                message = f"{label}: {path}" if error is None else f"Error al escribir {path}: {error}"
 
-            pygame.display.flip()
+            # ---- Dibujo (sólo lo que cambió) ----
+            trails = []
+            if last_move is not None:
+                trails.append((last_move[0], last_move[1], LAST_MOVE_CLR, 4))
+            if show_rival_trail:
+                trails.extend((o, d, RIVAL_TURN_CLR, 3) for (o, d, _color, _pip) in last_completed_turn_struct)
+            if events and t_frame - readout_at >= 0.5:
+                readout = f"{clock.get_fps():.0f} FPS | {frame_ms:.1f} ms"
+                readout_at = t_frame
+            rects = renderer.draw(screen, board, hover=idx_hover, origin=origin_idx,
+                                  legal=legal_dests if origin_idx is not None else (), trails=trails,
+                                  status=status_lines(game, message), moves=turn_moves_text[-6:][::-1],
+                                  readout=readout, full=full)
+            if full:
+                pygame.display.flip()
+                full = False
+            elif rects:
+                pygame.display.update(rects)
+            # media móvil del tiempo de cuadro
+            frame_ms = 0.9 * frame_ms + 0.1 * (time.perf_counter() - t_frame) * 1000
             clock.tick(60)
+        journal.close()
 
     # ---------- menú simple ----------
     pygame.init()
+    # el hilo de escritura avisa al loop (bloqueado en event.wait) cuando termina algo
+    WRITE_DONE = pygame.event.custom_type()
+
+    def wake():
+        try:
+            pygame.event.post(pygame.event.Event(WRITE_DONE))
+        except pygame.error:  # display ya cerrado
+            pass
+
+    writer = BackgroundWriter(notify=wake)
     try:
         screen = pygame.display.set_mode((W, H))
         pygame.display.set_caption("Backgammon - Menú")
@@ -536,6 +392,7 @@ def main():
         font = pygame.font.SysFont(None, 32)
         font_small = pygame.font.SysFont(None, 20)
         font_badge = pygame.font.SysFont(None, 14)
+        renderer = BoardRenderer(font, font_small, font_badge)
 
         class Button:
             def __init__(self, text, rect):
@@ -552,59 +409,86 @@ def main():
 
         title = "Backgammon — Menú"
         btn_play  = Button("Jugar partida nueva", (W//2 - 150, H//2 - 40, 300, 48))
-        btn_load  = Button("Cargar última partida", (W//2 - 150, H//2 + 20, 300, 48))
-        btn_exit  = Button("Salir", (W//2 - 150, H//2 + 80, 300, 48))
+        btn_resume = Button("Continuar autoguardado", (W//2 - 150, H//2 + 20, 300, 48))
+        btn_load  = Button("Cargar última partida", (W//2 - 150, H//2 + 80, 300, 48))
+        btn_exit  = Button("Salir", (W//2 - 150, H//2 + 140, 300, 48))
         info = "ESC para salir · ENTER para jugar"
         sprint_footer = "Sprint 5 — Consolidación y Entrega Técnica"
 
-        # Ruta de guardado para el botón Cargar
-        SAVEDIR = Path("saves")
-        SAVEFILE = SAVEDIR / "last.json"
-
         def try_load_game():
+            writer.wait()  # un guardado (G) en curso termina antes de leer
             if SAVEFILE.exists():
                 try:
-                    with open(SAVEFILE, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    return BackgammonGame.from_dict(data)
-                except Exception:
+                    return load_saved(SAVEFILE)
+                except ValueError:
                     return None
             return None
 
+        def try_resume():
+            """(partida, journal) del autoguardado; (None, None) si no hay o está dañado."""
+            writer.wait()  # la última compactación tiene que estar en disco
+            if not AUTOSAVE.exists():
+                return None, None
+            journal = Journal(AUTOSAVE, writer=writer)
+            try:
+                return journal.resume(), journal
+            except ValueError:
+                return None, None
+
+        menu_dirty = True            # redibujar el menú entero (al entrar y al volver del juego)
+        menu_hover = None
         in_menu = True
         while in_menu:
-            for event in pygame.event.get():
+            for event in wait_events(busy=menu_dirty):
                 if event.type == pygame.QUIT:
-                    pygame.quit(); return
+                    return
+                elif event.type == pygame.WINDOWEXPOSED:
+                    menu_dirty = True
                 elif event.type == pygame.KEYDOWN:
                     if event.key in (pygame.K_ESCAPE, pygame.K_q):
-                        pygame.quit(); return
+                        return
                     if event.key in (pygame.K_RETURN, pygame.K_SPACE):
                         # jugar directo
                         pygame.display.set_caption("Backgammon - Juego")
-                        run_game_loop(screen, clock, font, font_small, font_badge)
+                        run_game_loop(screen, clock, renderer, writer)
                         pygame.display.set_caption("Backgammon - Menú")
+                        menu_dirty = True
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if btn_play.hit(event.pos):
                         pygame.display.set_caption("Backgammon - Juego")
-                        run_game_loop(screen, clock, font, font_small, font_badge)
+                        run_game_loop(screen, clock, renderer, writer)
+                        pygame.display.set_caption("Backgammon - Menú")
+                        menu_dirty = True
+                    elif btn_resume.hit(event.pos):
+                        pre_g, pre_j = try_resume()
+                        pygame.display.set_caption("Backgammon - Juego")
+                        run_game_loop(screen, clock, renderer, writer, preloaded_game=pre_g, journal=pre_j)
                         pygame.display.set_caption("Backgammon - Menú")
+                        menu_dirty = True
                     elif btn_load.hit(event.pos):
                         pre_g = try_load_game()
                         pygame.display.set_caption("Backgammon - Juego")
-                        run_game_loop(screen, clock, font, font_small, font_badge, preloaded_game=pre_g)
+                        run_game_loop(screen, clock, renderer, writer, preloaded_game=pre_g)
                         pygame.display.set_caption("Backgammon - Menú")
+                        menu_dirty = True
                     elif btn_exit.hit(event.pos):
-                        pygame.quit(); return
+                        return
 
-            # draw menú
+            # draw menú (sólo si cambió el hover de algún botón o hay que redibujarlo entero)
+            mx, my = pygame.mouse.get_pos()
+            hover = (btn_play.hit((mx, my)), btn_resume.hit((mx, my)), btn_load.hit((mx, my)),
+                     btn_exit.hit((mx, my)))
+            if not menu_dirty and hover == menu_hover:
+                clock.tick(60)
+                continue
+            menu_dirty, menu_hover = False, hover
             screen.fill((238, 240, 248))
             t = font.render(title, True, (28, 32, 40))
             screen.blit(t, t.get_rect(center=(W//2, H//2 - 100)))
-            mx, my = pygame.mouse.get_pos()
-            btn_play.draw(screen, btn_play.hit((mx, my)))
-            btn_load.draw(screen, btn_load.hit((mx, my)))
-            btn_exit.draw(screen, btn_exit.hit((mx, my)))
+            btn_play.draw(screen, hover[0])
+            btn_resume.draw(screen, hover[1])
+            btn_load.draw(screen, hover[2])
+            btn_exit.draw(screen, hover[3])
             screen.blit(font_small.render(info, True, (60, 64, 80)),
                         (W//2 - font_small.size(info)[0]//2, H - 60))
 
@@ -615,6 +499,7 @@ def main():
             pygame.display.flip()
             clock.tick(60)
     finally:
+        writer.close()  # termina capturas/guardados pendientes
         pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,230 @@
+"""
+Render headless de posiciones y partidas a PNG (`python -m backgammon.pygame_ui render`).
+
+Usa el driver SDL `dummy` y el mismo `BoardRenderer` de la UI (sin el
+bloque de ayuda): cada proceso dibuja sobre una única superficie offscreen
+que reutiliza para todas sus imágenes, con el fondo estático, los sprites y
+los textos cacheados. El PNG se escribe con `zlib` nivel `PNG_LEVEL` sin
+filtros (~4x más rápido que `pygame.image.save`, que era el cuello de
+botella, a cambio de archivos ~10% más grandes).
+
+Fuentes:
+- Position IDs de 14 caracteres (`ID:black` para Black al turno),
+- partidas guardadas `.json` (cualquier formato de estado) o `.journal`,
+- archivos de texto con un ID por línea (`ID [white|black]`, `#` comenta),
+- `--selfplay N`: N partidas de `sim.play_game`, un cuadro por turno con
+  las jugadas del turno marcadas.
+
+Las posiciones se escriben como `OUT/00000.png`, ... y las partidas en
+`OUT/game-SEED/turn-0001.png`, ...; `OUT/index.tsv` relaciona cada salida
+con su fuente. Los trabajos se reparten en un pool de procesos
+(`--workers`) y al final se informa imágenes/seg.
+
+Uso:
+    python -m backgammon.pygame_ui render 4HPwATDgc/ABMA 4HPwATDgc/ABMA:black partida.json \\
+        --out renders --workers 4
+    python -m backgammon.pygame_ui render --selfplay 20 --seed 7 --out renders
+"""
+import argparse
+import os
+import struct
+import time
+import zlib
+
+from backgammon.core import position_id
+
+PNG_LEVEL = 3
+# estado por proceso: una superficie y un renderer que se reusan entre trabajos
+_WORKER = {}
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(rgb: bytes, width: int, height: int, level: int = PNG_LEVEL) -> bytes:
+    """PNG RGB de 8 bits a partir de filas crudas (sin filtro por fila)."""
+    if len(rgb) != width * height * 3:
+        raise ValueError("Tamaño de imagen inconsistente con width x height")
+    stride = width * 3
+    rows = b"".join(b"\x00" + rgb[y * stride:(y + 1) * stride] for y in range(height))
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+        _chunk(b"IDAT", zlib.compress(rows, level)),
+        _chunk(b"IEND", b""),
+    ])
+
+
+def parse_source(text: str, default_color: str = "white") -> tuple:
+    """'ID', 'ID:black' o 'ID black' -> (id, color). Lanza ValueError si el ID es inválido."""
+    pid, _, color = text.strip().replace(" ", ":", 1).partition(":")
+    color = color.strip() or default_color
+    if color not in ("white", "black"):
+        raise ValueError(f"Color inválido para {pid}: se espera 'white' o 'black'")
+    position_id.decode(pid)  # valida antes de repartir el trabajo
+    return pid, color
+
+
+def collect_jobs(sources, selfplay: int = 0, seed: int = 0,
+                 white: str = "random", black: str = "random") -> list:
+    """Trabajos (tipo, dato, salida, etiqueta) a partir de IDs, archivos y partidas de self-play."""
+    jobs = []
+
+    def add_position(kind, data, label):
+        jobs.append((kind, data, f"{len(jobs):05d}.png", label))
+
+    for src in sources:
+        if os.path.isfile(src):
+            if src.endswith((".json", ".journal")):
+                add_position("file", src, src)
+                continue
+            with open(src, encoding="utf-8") as f:
+                for n, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    try:
+                        add_position("id", parse_source(line), line)
+                    except ValueError as e:
+                        raise ValueError(f"{src}, línea {n}: {e}") from e
+        else:
+            add_position("id", parse_source(src), src)
+
+    if selfplay:
+        from backgammon import sim
+        sim.get_policy(white)
+        sim.get_policy(black)
+        for i in range(selfplay):
+            jobs.append(("game", (seed + i, white, black), f"game-{seed + i}", f"selfplay {white}/{black}"))
+    return jobs
+
+
+# ---------- dibujo (en cada worker) ----------
+def _init_worker():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    from backgammon.pygame_ui.render import BoardRenderer, W, H
+
+    pygame.font.init()
+    fonts = (pygame.font.SysFont(None, 32), pygame.font.SysFont(None, 20), pygame.font.SysFont(None, 14))
+    _WORKER["pygame"] = pygame
+    _WORKER["renderer"] = BoardRenderer(*fonts, help_lines=())
+    _WORKER["surface"] = pygame.Surface((W, H))
+
+
+def _turn_moves(game) -> tuple:
+    """(líneas de jugadas, segmentos a marcar) del turno en curso."""
+    from backgammon.pygame_ui.render import LAST_MOVE_CLR
+
+    lines, trails = [], []
+    for (o, d, _, pip, kind) in game.turn_history():
+        if kind == "enter":
+            lines.append(f"BAR->{d} (pip {pip})")
+        elif kind == "off":
+            lines.append(f"{o}->OFF (pip {pip})")
+        else:
+            lines.append(f"{o}->{d} (pip {pip})")
+            trails.append((o, d, LAST_MOVE_CLR, 4))
+    return lines[::-1], trails
+
+
+def _save_frame(game, path: str, message: str, with_moves: bool = False) -> None:
+    from backgammon.pygame_ui.render import status_lines
+
+    surface, renderer = _WORKER["surface"], _WORKER["renderer"]
+    moves, trails = _turn_moves(game) if with_moves else ((), ())
+    renderer.draw(surface, game.board(), trails=trails, status=status_lines(game, message),
+                  moves=moves, full=True)
+    rgb = _WORKER["pygame"].image.tobytes(surface, "RGB")
+    with open(path, "wb") as f:
+        f.write(encode_png(rgb, *surface.get_size()))
+
+
+def _render_job(args) -> int:
+    """Dibuja un trabajo y devuelve cuántas imágenes escribió."""
+    (kind, data, name, label), out_dir = args
+    if not _WORKER:
+        _init_worker()
+    from backgammon.core.game import BackgammonGame
+
+    path = os.path.join(out_dir, name)
+    if kind == "id":
+        pid, color = data
+        _save_frame(BackgammonGame.from_position_id(pid, color), path, f"{pid} ({color})")
+        return 1
+    if kind == "file":
+        from backgammon.core.journal import load_game
+        _save_frame(load_game(data), path, os.path.basename(data))
+        return 1
+
+    from backgammon import sim
+    game_seed, white, black = data
+    os.makedirs(path, exist_ok=True)
+    frames = []
+
+    def on_turn(game, turn):
+        _save_frame(game, os.path.join(path, f"turn-{turn:04d}.png"), f"Partida {game_seed} - turno {turn}",
+                    with_moves=True)
+        frames.append(turn)
+
+    sim.play_game(white, black, seed=game_seed, on_turn=on_turn)
+    return len(frames)
+
+
+def render_jobs(jobs: list, out_dir: str, workers: int = 1) -> dict:
+    """Dibuja todos los trabajos en `workers` procesos y resume imágenes/seg."""
+    if workers <= 0:
+        raise ValueError("--workers debe ser positivo")
+    if not jobs:
+        raise ValueError("No hay posiciones para dibujar (IDs, archivos o --selfplay)")
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "index.tsv"), "w", encoding="utf-8") as f:
+        for (kind, _, name, label) in jobs:
+            f.write(f"{name}\t{kind}\t{label}\n")
+
+    tasks = [(job, out_dir) for job in jobs]
+    if workers > 1:
+        from multiprocessing import Pool  # import diferido: sólo con varios workers
+
+    t0 = time.perf_counter()
+    if workers == 1:
+        images = sum(_render_job(t) for t in tasks)
+    else:
+        chunk = max(1, len(tasks) // (workers * 4))
+        with Pool(workers, initializer=_init_worker) as pool:
+            images = sum(pool.imap_unordered(_render_job, tasks, chunksize=chunk))
+    elapsed = time.perf_counter() - t0
+    return {
+        "jobs": len(jobs),
+        "images": images,
+        "workers": workers,
+        "out": out_dir,
+        "elapsed": elapsed,
+        "images_per_sec": images / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def format_summary(s: dict) -> str:
+    return (f"Imágenes: {s['images']} ({s['jobs']} trabajos) en {s['out']} | Workers: {s['workers']} | "
+            f"{s['elapsed']:.2f} s | {s['images_per_sec']:.1f} imágenes/seg")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backgammon.pygame_ui render")
+    parser.add_argument("sources", nargs="*", metavar="FUENTE",
+                        help="Position ID (ID o ID:black), partida .json/.journal o archivo con un ID por línea")
+    parser.add_argument("--out", default="renders", help="Directorio de salida (default: renders)")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo")
+    parser.add_argument("--selfplay", type=int, default=0, metavar="N",
+                        help="Además, N partidas de self-play con un cuadro por turno")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base de --selfplay")
+    parser.add_argument("--white", default="random", help="Política de White en --selfplay")
+    parser.add_argument("--black", default="random", help="Política de Black en --selfplay")
+    args = parser.parse_args(argv)
+    if args.selfplay < 0:
+        parser.error("--selfplay no puede ser negativo")
+
+    jobs = collect_jobs(args.sources, args.selfplay, args.seed, args.white, args.black)
+    print(format_summary(render_jobs(jobs, args.out, args.workers)))
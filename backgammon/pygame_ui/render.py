@@ -0,0 +1,354 @@
+"""
+Dibujo del tablero de la UI Pygame con superficies cacheadas y rectángulos sucios.
+
+`BoardRenderer` pre-renderiza una vez por tamaño de ventana el fondo estático
+(triángulos, panel, ayuda y títulos) y cachea los sprites de fichas, los
+badges de pips y los textos ya renderizados. En cada cuadro compara la escena
+con la anterior y redibuja sólo lo que cambió: la columna de cada punto cuyo
+contenido o resaltado cambió (todo el tablero si cambian las líneas de
+jugadas) y las filas del panel cuyo texto cambió. `draw` devuelve esos
+rectángulos para `pygame.display.update(rects)`; sin cambios devuelve [].
+"""
+import pygame
+
+from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
+
+# --- Config ---
+W, H = 800, 600
+MARGIN = 40
+TRI_H = 120
+PANEL_W = 260
+BG = (240, 240, 240)
+BG_PANEL = (230, 234, 244)
+SEP = (200, 200, 210)
+TOP_CLR = (50, 90, 160)
+BOT_CLR = (160, 90, 50)
+TXT = (20, 20, 20)
+HILIGHT = (240, 200, 60)
+SELECT = (120, 200, 120)
+LEGAL = (60, 190, 140)
+OUTLINE = (30, 30, 30)
+
+CHECKER_WHITE = (250, 250, 250)
+CHECKER_BLACK = (30, 30, 30)
+CHECKER_EDGE = (10, 10, 10)
+R = 10
+GAP = 2
+BADGE_R = 10
+MAX_STACK = 5      # fichas dibujadas por punto; el resto va como "+N"
+
+# Colores para trails
+LAST_MOVE_CLR = (20, 160, 120)    # última jugada mía (verde)
+RIVAL_TURN_CLR = (160, 80, 200)   # jugadas del turno anterior (violeta)
+
+HELP_LINES = (
+    "- ESPACIO: tirar dados  | F: tirada fija (3,4)",
+    "- Click: ORIGEN → DESTINO (usa pip)  |  Click der.: cancelar",
+    "- U: deshacer  |  C: cancelar turno",
+    "- E: fin de turno  |  A: auto-end si no hay jugadas",
+    "- V: ver/ocultar turno rival",
+    "- G: guardar  |  L: cargar",
+    "- R: reset  |  S: captura  |  ESC/Q: menú",
+)
+MAX_TURN_LINES = 6
+_SPILL = 4         # px que bordes y resaltados invaden de las columnas vecinas
+
+
+# --- Helpers de juego/UI ---
+def owner_label(owner):
+    return "White" if owner == Board.WHITE else ("Black" if owner == Board.BLACK else "Empty")
+
+
+def current_color_int(game):
+    p = game.current_player()
+    # Soporta Player con getters o atributo interno
+    if hasattr(p, "get_color") and callable(p.get_color):
+        color = p.get_color()
+    else:
+        color = getattr(p, "_Player__color__", getattr(p, "color", None))
+    return Board.WHITE if color == "white" else Board.BLACK
+
+
+def status_lines(game, message: str = "") -> list:
+    """Bloque "Estado" del panel: jugador, dados, pips, totales y mensaje (una línea)."""
+    board = game.board()
+    # Conteos de barra / off de forma robusta
+    if hasattr(board, "off_count"):
+        white_off = board.off_count(Board.WHITE)
+        black_off = board.off_count(Board.BLACK)
+    else:
+        # fallback a API de Game si Board no exportara off_count
+        white_off = game.borne_off_count(Board.WHITE)
+        black_off = game.borne_off_count(Board.BLACK)
+    msg_txt = message or "Listo"
+    if len(msg_txt) > 42:
+        msg_txt = msg_txt[:39] + "..."
+    return [
+        f"Jugador: {owner_label(current_color_int(game))}",
+        f"Dados:   {game.last_roll()}",
+        f"Pips:    {game.pips()}",
+        f"White: board {board.count_total(Board.WHITE)}  | bar {board.bar_count(Board.WHITE)}  | off {white_off}",
+        f"Black: board {board.count_total(Board.BLACK)}  | bar {board.bar_count(Board.BLACK)}  | off {black_off}",
+        msg_txt,
+    ]
+
+
+# --- Geometría ---
+class Layout:
+    """Geometría del tablero y del panel para un tamaño de ventana."""
+
+    def __init__(self, size=(W, H)):
+        self.w, self.h = size
+        self.board_left = MARGIN
+        self.board_right = self.w - MARGIN - PANEL_W
+        self.col_w = (self.board_right - self.board_left) / 12
+        self.panel_x = self.board_right
+
+    def tri_polygon(self, idx):
+        x0 = self.board_left + (idx % 12) * self.col_w
+        x1 = x0 + self.col_w
+        if idx <= 11:
+            return [(x0, MARGIN), (x1, MARGIN), ((x0 + x1) / 2, MARGIN + TRI_H)]
+        return [(x0, self.h - MARGIN), (x1, self.h - MARGIN), ((x0 + x1) / 2, self.h - MARGIN - TRI_H)]
+
+    def tri_center(self, idx):
+        cx = self.board_left + (idx % 12) * self.col_w + self.col_w / 2
+        cy = (MARGIN + TRI_H / 2) if idx <= 11 else (self.h - MARGIN - TRI_H / 2)
+        return (int(cx), int(cy))
+
+    def hover_index(self, mx, my):
+        if not (self.board_left <= mx <= self.board_right):
+            return None
+        i = int((mx - self.board_left) // self.col_w)
+        if not 0 <= i < 12:
+            return None
+        if MARGIN <= my <= MARGIN + TRI_H:
+            return i
+        if (self.h - MARGIN - TRI_H) <= my <= (self.h - MARGIN):
+            return 12 + i
+        return None
+
+    def board_area(self) -> pygame.Rect:
+        """Todo lo que queda a la izquierda del panel."""
+        return pygame.Rect(0, 0, self.panel_x, self.h)
+
+    def column_rect(self, idx) -> pygame.Rect:
+        """Banda de un punto (triángulo y fichas) más el borde que invade a sus vecinos."""
+        x0 = self.board_left + (idx % 12) * self.col_w
+        y0 = MARGIN if idx <= 11 else self.h - MARGIN - TRI_H
+        rect = pygame.Rect(int(x0), y0, int(self.col_w) + 2, TRI_H + 1).inflate(2 * _SPILL, 2 * _SPILL)
+        return rect.clip(self.board_area())
+
+    def readout_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.panel_x + PANEL_W - 140, MARGIN + 4, 132, 18)
+
+    def panel_slots(self) -> list:
+        """Posiciones (x, y) de las filas dinámicas: estado + mensaje, y luego las jugadas del turno."""
+        x = self.panel_x + 10
+        y = self.h - MARGIN - 174
+        slots = [(x, y + 18 * k) for k in range(6)]
+        y_list = y + 5 * 18 + 12 + 16 + 16
+        for _ in range(MAX_TURN_LINES):
+            if y_list > self.h - MARGIN - 6:
+                break
+            slots.append((x + 4, y_list))
+            y_list += 16
+        return slots
+
+    def list_title_pos(self):
+        return (self.panel_x + 10, self.h - MARGIN - 174 + 5 * 18 + 12 + 16)
+
+
+# --- Dibujo ---
+class BoardRenderer:
+    """Dibuja la escena de juego reusando superficies y devolviendo sólo los rectángulos que cambiaron."""
+
+    def __init__(self, font, font_small, font_badge, help_lines=HELP_LINES):
+        self.__fonts__ = {"title": font, "small": font_small, "badge": font_badge}
+        self.__help__ = tuple(help_lines)   # vacío: panel sin ayuda (export headless)
+        self.__backgrounds__ = {}           # tamaño de ventana -> Surface estática
+        self.__glyphs__ = LRUCache(512)     # (fuente, texto, color) -> Surface
+        self.__sprites__ = {}               # fichas y badges de pips
+        self.__layout__ = None
+        self.__size__ = None                # tamaño del último cuadro dibujado
+        self.__points__ = [None] * 24       # clave de cada punto en el último cuadro
+        self.__trails__ = None
+        self.__rows__ = {}                  # rect de fila -> texto dibujado
+        self.frames = 0
+        self.dirty_area = 0                 # px actualizados en el último cuadro
+
+    # ---------- caches ----------
+    def glyph(self, text: str, font: str = "small", color=TXT) -> pygame.Surface:
+        key = (font, text, color)
+        surf = self.__glyphs__.get(key)
+        if surf is None:
+            surf = self.__fonts__[font].render(text, True, color)
+            self.__glyphs__.put(key, surf)
+        return surf
+
+    def __checker__(self, owner) -> pygame.Surface:
+        sprite = self.__sprites__.get(("checker", owner))
+        if sprite is None:
+            sprite = pygame.Surface((2 * R + 1, 2 * R + 1), pygame.SRCALPHA)
+            fill = CHECKER_WHITE if owner == Board.WHITE else CHECKER_BLACK
+            pygame.draw.circle(sprite, fill, (R, R), R)
+            pygame.draw.circle(sprite, CHECKER_EDGE, (R, R), R, width=1)
+            self.__sprites__[("checker", owner)] = sprite
+        return sprite
+
+    def __badge__(self, pip) -> pygame.Surface:
+        sprite = self.__sprites__.get(("badge", pip))
+        if sprite is None:
+            sprite = pygame.Surface((2 * BADGE_R + 1, 2 * BADGE_R + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, LEGAL, (BADGE_R, BADGE_R), BADGE_R)
+            txt = self.glyph(str(pip), "badge", (255, 255, 255))
+            sprite.blit(txt, txt.get_rect(center=(BADGE_R, BADGE_R)))
+            self.__sprites__[("badge", pip)] = sprite
+        return sprite
+
+    def layout(self, size=(W, H)) -> Layout:
+        if self.__layout__ is None or (self.__layout__.w, self.__layout__.h) != tuple(size):
+            self.__layout__ = Layout(size)
+        return self.__layout__
+
+    def background(self, size=(W, H)) -> pygame.Surface:
+        """Fondo estático (tablero sin fichas, panel, ayuda), uno por tamaño de ventana."""
+        size = tuple(size)
+        bg = self.__backgrounds__.get(size)
+        if bg is not None:
+            return bg
+        lay = Layout(size)
+        bg = pygame.Surface(size).convert() if pygame.display.get_surface() else pygame.Surface(size)
+        bg.fill(BG)
+        for idx in range(24):
+            pygame.draw.polygon(bg, TOP_CLR if idx <= 11 else BOT_CLR, lay.tri_polygon(idx))
+        panel_x = lay.panel_x
+        pygame.draw.rect(bg, BG_PANEL, pygame.Rect(panel_x, MARGIN, PANEL_W, lay.h - 2 * MARGIN), border_radius=8)
+        pygame.draw.line(bg, SEP, (panel_x - 6, MARGIN), (panel_x - 6, lay.h - MARGIN), 2)
+        if self.__help__:
+            bg.blit(self.glyph("Ayuda", "title"), (panel_x + 10, MARGIN + 4))
+        y = MARGIN + 32
+        for line in self.__help__:
+            bg.blit(self.glyph(line), (panel_x + 10, y))
+            y += 18
+        bg.blit(self.glyph(f"Turno (últimos {MAX_TURN_LINES}):"), lay.list_title_pos())
+        self.__backgrounds__[size] = bg
+        return bg
+
+    # ---------- escena ----------
+    def draw(self, screen, board, hover=None, origin=None, legal=(), trails=(),
+             status=(), moves=(), readout="", full=False) -> list:
+        """
+        Dibuja la escena sobre `screen` y devuelve los rectángulos modificados.
+
+        `legal` son los destinos (dest, pip) del origen seleccionado; `trails`,
+        segmentos (origen, destino, color, ancho) en orden de dibujo; `status`,
+        las líneas de `status_lines`; `moves`, las jugadas del turno (la más
+        nueva primero); `readout`, el texto de FPS / tiempo de cuadro.
+        `full` fuerza a redibujar todo (p. ej. al volver del menú).
+        """
+        size = screen.get_size()
+        if size != self.__size__:
+            full = True
+            self.__size__ = size
+        lay = self.layout(size)
+        bg = self.background(size)
+        legal_pips = {d: pip for (d, pip) in legal}
+        keys = [(board.owner_at(i), board.count_at(i), i == origin, i == hover, legal_pips.get(i))
+                for i in range(24)]
+        trails = tuple(trails)
+        dirty = []
+
+        if full:
+            screen.blit(bg, (0, 0))
+            self.__draw_points__(screen, lay, board, range(24), keys, trails)
+            dirty.append(screen.get_rect())
+            self.__rows__ = {}
+        elif trails != self.__trails__:
+            area = lay.board_area()
+            self.__redraw__(screen, bg, area, lay, board, range(24), keys, trails)
+            dirty.append(area)
+        else:
+            for idx in range(24):
+                if keys[idx] == self.__points__[idx]:
+                    continue
+                rect = lay.column_rect(idx)
+                # los vecinos de la misma banda también asoman dentro del rectángulo
+                band = range(max(idx - 1, 0 if idx <= 11 else 12), min(idx + 2, 12 if idx <= 11 else 24))
+                self.__redraw__(screen, bg, rect, lay, board, band, keys, trails)
+                dirty.append(rect)
+        self.__points__ = keys
+        self.__trails__ = trails
+
+        # filas del panel: el texto puede pasarse del panel, como antes (hasta el borde de la ventana)
+        slots = lay.panel_slots()
+        texts = [*status, *(f"• {mv}" for mv in moves)][:len(slots)]
+        texts += [""] * (len(slots) - len(texts))
+        rows = [(pygame.Rect(x, y, lay.w - x, 16), text, False) for (x, y), text in zip(slots, texts)]
+        rows.append((lay.readout_rect(), readout, True))
+        for rect, text, right in rows:
+            key = (rect.x, rect.y)
+            if self.__rows__.get(key) == text:
+                continue
+            self.__rows__[key] = text
+            screen.set_clip(rect)
+            screen.blit(bg, rect, rect)
+            if text:
+                surf = self.glyph(text)
+                screen.blit(surf, (rect.right - surf.get_width(), rect.y + 2) if right else rect.topleft)
+            screen.set_clip(None)
+            if not full:
+                dirty.append(rect)
+
+        self.frames += 1
+        self.dirty_area = sum(r.w * r.h for r in dirty)
+        return dirty
+
+    def __redraw__(self, screen, bg, rect, lay, board, idxs, keys, trails):
+        screen.set_clip(rect)
+        screen.blit(bg, rect, rect)
+        self.__draw_points__(screen, lay, board, idxs, keys, trails)
+        screen.set_clip(None)
+
+    def __draw_points__(self, screen, lay, board, idxs, keys, trails):
+        # resaltado de origen / hover (los triángulos normales ya están en el fondo)
+        for idx in idxs:
+            _, _, is_origin, is_hover, _ = keys[idx]
+            if is_origin or is_hover:
+                poly = lay.tri_polygon(idx)
+                pygame.draw.polygon(screen, SELECT if is_origin else HILIGHT, poly)
+                pygame.draw.polygon(screen, OUTLINE, poly, width=3 if is_origin else 2)
+
+        # destinos legales (borde + badge)
+        for idx in idxs:
+            pip = keys[idx][4]
+            if pip is None:
+                continue
+            pygame.draw.polygon(screen, LEGAL, lay.tri_polygon(idx), width=4)  # borde más marcado
+            bx, by = lay.tri_center(idx)
+            by = by - 16 if idx <= 11 else by + 16
+            screen.blit(self.__badge__(pip), (bx - BADGE_R, by - BADGE_R))
+
+        # fichas
+        for idx in idxs:
+            owner, cnt = keys[idx][0], keys[idx][1]
+            if cnt == 0:
+                continue
+            sprite = self.__checker__(owner)
+            cx = lay.board_left + (idx % 12) * lay.col_w + lay.col_w / 2
+            step = 2 * R + GAP
+            for k in range(min(cnt, MAX_STACK)):
+                cy = MARGIN + R + k * step if idx <= 11 else lay.h - MARGIN - R - k * step
+                screen.blit(sprite, (int(cx) - R, int(cy) - R))
+            if cnt > MAX_STACK:
+                extra = self.glyph(f"+{cnt - MAX_STACK}")
+                ey = MARGIN + TRI_H - 10 if idx <= 11 else lay.h - MARGIN - TRI_H + 10
+                screen.blit(extra, extra.get_rect(center=(cx, ey)))
+
+        # última jugada propia y turno rival
+        for (o, d, color, width) in trails:
+            pygame.draw.line(screen, color, lay.tri_center(o), lay.tri_center(d), width=width)
+
+        # el separador del panel va encima del tablero
+        pygame.draw.line(screen, SEP, (lay.panel_x - 6, MARGIN), (lay.panel_x - 6, lay.h - MARGIN), 2)
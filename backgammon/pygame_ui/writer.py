@@ -0,0 +1,102 @@
+"""
+Escrituras a disco fuera del hilo de dibujo (capturas, guardados y
+compactaciones del autoguardado de la UI).
+
+El hilo principal prepara el dato barato de copiar (copia de la superficie,
+`game.to_dict()`) y lo encola junto con su función de codificación; un hilo
+de fondo lo codifica (PNG, JSON) y lo escribe de forma atómica (archivo
+temporal + `os.replace`), así un disco lento no congela los cuadros.
+
+La cola es acotada: si está llena, `submit` devuelve False en lugar de
+bloquear el loop. Los resultados se leen con `poll()`; `notify`, si se pasa,
+se llama desde el hilo de fondo al terminar cada escritura (la UI lo usa
+para despertar `pygame.event.wait`).
+"""
+import os
+import queue
+import threading
+from pathlib import Path
+
+MAX_PENDING = 4
+_STOP = object()
+
+
+def atomic_write(path, data: bytes) -> None:
+    """Escribe `data` en un temporal junto a `path` y lo renombra encima."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class BackgroundWriter:
+    """Un hilo de escritura alimentado por una cola acotada."""
+
+    def __init__(self, maxsize: int = MAX_PENDING, notify=None):
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize debe ser un entero positivo")
+        self.__jobs__ = queue.Queue(maxsize)
+        self.__done__ = queue.SimpleQueue()   # (etiqueta, ruta, error | None)
+        self.__notify__ = notify
+        self.__closed__ = False
+        self.__thread__ = threading.Thread(target=self.__run__, name="ui-writer", daemon=True)
+        self.__thread__.start()
+
+    def submit(self, path, encode, payload, label: str = "Guardado") -> bool:
+        """Encola `encode(payload) -> bytes` para escribir en `path`; False si la cola está llena."""
+        if self.__closed__:
+            raise ValueError("El writer está cerrado")
+        try:
+            self.__jobs__.put_nowait((str(path), encode, payload, label))
+        except queue.Full:
+            return False
+        return True
+
+    def poll(self) -> list:
+        """Escrituras terminadas desde la última llamada: [(etiqueta, ruta, error | None)]."""
+        done = []
+        while True:
+            try:
+                done.append(self.__done__.get_nowait())
+            except queue.Empty:
+                return done
+
+    def pending(self) -> int:
+        return self.__jobs__.unfinished_tasks
+
+    def wait(self) -> None:
+        """Bloquea hasta que no queden escrituras pendientes (p. ej. antes de cargar)."""
+        self.__jobs__.join()
+
+    def close(self) -> None:
+        """Termina las escrituras pendientes y detiene el hilo."""
+        if self.__closed__:
+            return
+        self.__closed__ = True
+        self.__jobs__.put(_STOP)
+        self.__thread__.join()
+
+    def __run__(self):
+        while True:
+            job = self.__jobs__.get()
+            if job is _STOP:
+                self.__jobs__.task_done()
+                return
+            path, encode, payload, label = job
+            try:
+                atomic_write(path, encode(payload))
+                error = None
+            except (OSError, ValueError, TypeError) as e:
+                error = str(e)
+            self.__done__.put((label, path, error))
+            self.__jobs__.task_done()
+            if self.__notify__ is not None:
+                self.__notify__()
@@ -0,0 +1,274 @@
+"""
+Servidor asyncio de partidas: muchas partidas en memoria en un solo proceso.
+
+Protocolo: JSON por línea (NDJSON) sobre TCP o socket Unix. Cada pedido es
+{"id": ..., "cmd": ..., "game": ..., ...} y cada respuesta
+{"id": ..., "ok": true, "result": {...}} o {"id": ..., "ok": false, "error": "..."};
+el "id" se devuelve tal cual, así un cliente puede encadenar pedidos sin
+esperar cada respuesta (se responden en orden por conexión).
+
+Comandos (todos salvo `new` y `stats` llevan "game"):
+- new [game, seed]            -> {game, current}
+- start_turn [roll: [a, b]]   -> {roll, pips}                (`BackgammonGame.start_turn`)
+- legal_moves                 -> {moves: [[o, d, pip]], bear_off: [[o, pip]]}
+- apply_move origin pip       -> {dest, pips, winner}        (`apply_move`; origin -1 = barra)
+- end_turn                    -> {current}                   (`end_turn`; sin jugadas posibles cierra igual)
+- to_dict                     -> estado completo             (`to_dict`)
+- close                       -> {closed}
+- stats                       -> {games, requests, connections, cache_hit_rate}
+
+Los comandos no esperan (`await`) a mitad de camino: cada uno busca su
+partida y la modifica de una vez dentro del bucle de eventos, así que los
+pedidos sobre una misma partida quedan serializados aunque lleguen por
+conexiones distintas, sin un lock por partida. Todas las partidas
+comparten una `LRUCache` de movimientos legales. Las partidas viven en un
+`GameStore`: las inactivas se desalojan a SQLite (`--store`) al superar
+`--max-games` o `--max-mb` y vuelven al próximo pedido (una partida creada
+con `seed` guarda semilla + tiradas usadas y sigue la misma secuencia de
+dados aunque se desaloje); cada partida usa un
+buffer de dados chico (`DICE_BUFFER`) para ocupar poco mientras está viva.
+
+Uso: python -m backgammon.server [--host H --port P | --unix PATH] [--store ARCHIVO]
+Carga: python -m benchmarks.bench_server --games 1000 10000
+"""
+import argparse
+import asyncio
+import itertools
+import json
+
+from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
+from backgammon.core.dice import Dice
+from backgammon.core.game import BackgammonGame
+from backgammon.core.store import MAX_ENTRIES, GameStore
+
+HOST = "127.0.0.1"
+PORT = 8765
+CACHE_SIZE = 65536
+MAX_LINE = 1 << 16
+DICE_BUFFER = 64
+_WRITE_HIGH_WATER = 1 << 16
+
+
+def _color_name(color: int) -> str:
+    return "white" if color == Board.WHITE else "black"
+
+
+def _int_arg(req: dict, key: str) -> int:
+    v = req.get(key)
+    if not isinstance(v, int) or isinstance(v, bool):
+        raise ValueError(f"'{key}' debe ser un entero")
+    return v
+
+
+class GameServer:
+    """Partidas en memoria + despacho de comandos; `serve` lo expone por la red."""
+
+    def __init__(self, move_cache: LRUCache | None = None, store_path: str = ":memory:",
+                 max_games: int = MAX_ENTRIES, max_bytes: int | None = None):
+        self.__move_cache__ = move_cache if move_cache is not None else LRUCache(CACHE_SIZE)
+        self.__store__ = GameStore(store_path, max_games, max_bytes, factory=self.rehydrate,
+                                   move_cache=self.__move_cache__)
+        self.__ids__ = itertools.count(1)
+        self.__requests__ = 0
+        self.__connections__ = 0
+        self.__commands__ = {
+            "start_turn": self.__start_turn__,
+            "legal_moves": self.__legal_moves__,
+            "apply_move": self.__apply_move__,
+            "end_turn": self.__end_turn__,
+            "to_dict": lambda game, req: game.to_dict(),
+        }
+
+    def games(self) -> int:
+        return len(self.__store__)
+
+    def store(self) -> GameStore:
+        return self.__store__
+
+    def game(self, gid: str) -> BackgammonGame:
+        game = self.__store__.get(gid) if isinstance(gid, str) else None
+        if game is None:
+            raise ValueError(f"Partida desconocida: {gid}")
+        return game
+
+    def rehydrate(self, data: dict) -> BackgammonGame:
+        """`factory` del `GameStore`: partida desde `to_dict` con la caché y el buffer del servidor."""
+        dice = Dice.from_state(data.get("dice"), buffer_size=DICE_BUFFER)  # misma secuencia si tenía `seed`
+        return BackgammonGame.from_dict(data, move_cache=self.__move_cache__, dice=dice)
+
+    # ---------- despacho ----------
+    async def handle(self, req: dict) -> dict:
+        """Ejecuta un pedido ya decodificado y arma la respuesta."""
+        self.__requests__ += 1
+        rid = req.get("id") if isinstance(req, dict) else None
+        try:
+            if not isinstance(req, dict):
+                raise ValueError("El pedido debe ser un objeto JSON")
+            cmd = req.get("cmd")
+            if cmd == "new":
+                result = self.__create__(req)
+            elif cmd == "stats":
+                result = self.stats()
+            elif cmd == "close":
+                result = self.__close__(req)
+            elif cmd in self.__commands__:
+                result = self.__commands__[cmd](self.game(req.get("game")), req)
+            else:
+                raise ValueError(f"Comando desconocido: {cmd}")
+        except (ValueError, TypeError, IndexError) as e:
+            return {"id": rid, "ok": False, "error": str(e)}
+        return {"id": rid, "ok": True, "result": result}
+
+    async def handle_line(self, line: bytes) -> bytes:
+        """Una línea NDJSON de pedido -> una línea de respuesta."""
+        try:
+            req = json.loads(line)
+        except ValueError:
+            resp = {"id": None, "ok": False, "error": "JSON inválido"}
+        else:
+            resp = await self.handle(req)
+        return (json.dumps(resp, separators=(",", ":")) + "\n").encode()
+
+    def stats(self) -> dict:
+        cache = self.__move_cache__
+        total = cache.hits() + cache.misses()
+        return {
+            "games": len(self.__store__),
+            "requests": self.__requests__,
+            "connections": self.__connections__,
+            "cache_hit_rate": cache.hits() / total if total else 0.0,
+            "store": self.__store__.stats(),
+        }
+
+    # ---------- comandos ----------
+    def __new_game__(self, seed) -> BackgammonGame:
+        g = BackgammonGame(move_cache=self.__move_cache__, dice=Dice(seed, buffer_size=DICE_BUFFER))
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        g.setup_board()
+        return g
+
+    def __create__(self, req: dict) -> dict:
+        seed = req.get("seed")
+        if seed is not None:
+            seed = _int_arg(req, "seed")
+        gid = req.get("game")
+        if gid is None:
+            gid = f"g{next(self.__ids__)}"
+            while gid in self.__store__:
+                gid = f"g{next(self.__ids__)}"
+        elif not isinstance(gid, str) or not gid:
+            raise ValueError("'game' debe ser un texto no vacío")
+        elif gid in self.__store__:
+            raise ValueError(f"La partida ya existe: {gid}")
+        game = self.__new_game__(seed)
+        self.__store__.put(gid, game)
+        return {"game": gid, "current": _color_name(game._current_color_int())}
+
+    def __close__(self, req: dict) -> dict:
+        gid = req.get("game")
+        self.game(gid)
+        self.__store__.delete(gid)
+        return {"closed": gid}
+
+    def __start_turn__(self, game: BackgammonGame, req: dict) -> dict:
+        roll = req.get("roll")
+        if roll is not None:
+            if (not isinstance(roll, list) or len(roll) != 2
+                    or not all(isinstance(d, int) and 1 <= d <= 6 for d in roll)):
+                raise ValueError("'roll' debe ser [a, b] con dados de 1 a 6")
+            roll = (roll[0], roll[1])
+        roll = game.start_turn(roll)
+        return {"roll": list(roll), "pips": list(game.pips())}
+
+    def __legal_moves__(self, game: BackgammonGame, req: dict) -> dict:
+        return {
+            "moves": [list(m) for m in game.legal_moves()],
+            "bear_off": [list(m) for m in game.legal_bear_off_moves()],
+        }
+
+    def __apply_move__(self, game: BackgammonGame, req: dict) -> dict:
+        if game.last_roll() is None:
+            raise ValueError("No hay turno en curso: usar start_turn")
+        color = game._current_color_int()
+        dest = game.apply_move(_int_arg(req, "origin"), _int_arg(req, "pip"))
+        return {
+            "dest": dest,
+            "pips": list(game.pips()),
+            "winner": _color_name(color) if game.has_won(color) else None,
+        }
+
+    def __end_turn__(self, game: BackgammonGame, req: dict) -> dict:
+        if game.is_turn_over():
+            game.end_turn()
+        elif not game.auto_end_turn():
+            raise ValueError("Aún quedan pips por jugar")
+        return {"current": _color_name(game._current_color_int())}
+
+    # ---------- red ----------
+    async def __client__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.__connections__ += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # línea más larga que MAX_LINE
+                    writer.write(b'{"id":null,"ok":false,"error":"Pedido demasiado largo"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                writer.write(await self.handle_line(line))
+                # con pedidos encadenados no se espera el vaciado en cada respuesta
+                if writer.transport.get_write_buffer_size() > _WRITE_HIGH_WATER:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__connections__ -= 1
+            writer.close()
+
+    async def serve(self, host: str = HOST, port: int = PORT, path: str | None = None):
+        """Abre el servidor (socket Unix si hay `path`) y lo devuelve sin bloquear."""
+        if path is not None:
+            return await asyncio.start_unix_server(self.__client__, path, limit=MAX_LINE)
+        return await asyncio.start_server(self.__client__, host, port, limit=MAX_LINE)
+
+
+async def _serve_forever(host: str, port: int, path: str | None, game_server: GameServer) -> None:
+    server = await game_server.serve(host, port, path)
+    where = path if path is not None else ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Servidor de partidas escuchando en {where}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        game_server.store().close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="backgammon-server")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--unix", default=None, metavar="PATH", help="Escuchar en un socket Unix en lugar de TCP")
+    parser.add_argument("--store", default=":memory:", metavar="ARCHIVO",
+                        help="SQLite para las partidas desalojadas (se conservan al cerrar)")
+    parser.add_argument("--max-games", type=int, default=MAX_ENTRIES, help="Partidas vivas en memoria")
+    parser.add_argument("--max-mb", type=int, default=None, help="Memoria estimada máxima de partidas vivas (MB)")
+    args = parser.parse_args(argv)
+    try:
+        game_server = GameServer(store_path=args.store, max_games=args.max_games,
+                                 max_bytes=args.max_mb * (1 << 20) if args.max_mb else None)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(_serve_forever(args.host, args.port, args.unix, game_server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
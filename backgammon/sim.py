@@ -0,0 +1,180 @@
+"""
+Simulador headless de partidas completas (self-play) sobre `BackgammonGame`.
+
+- Políticas enchufables: función (game, plays, rnd) -> play, elegida entre
+  las jugadas completas de `legal_plays()`.
+- Cada partida tiene su propio flujo de dados (`Dice`) sembrado desde su
+  semilla: la semilla determina la partida completa.
+- Las partidas de un mismo worker comparten una `LRUCache` de jugadas
+  legales (aperturas y posiciones repetidas no se recalculan); el resumen
+  informa su tasa de aciertos.
+- `simulate` reparte las partidas en un pool de procesos; cada partida usa
+  su propia semilla (seed base + número de partida), así el resultado no
+  depende de la cantidad de workers.
+
+Uso: python -m backgammon.cli simulate --games N --workers K --seed S
+"""
+import random
+import time
+
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
+from backgammon.core.game import BackgammonGame
+
+MAX_TURNS = 5000
+CACHE_SIZE = 65536
+
+
+# ---------- políticas ----------
+def random_policy(game: BackgammonGame, plays: list, rnd: random.Random):
+    """Cualquier jugada legal, al azar."""
+    return rnd.choice(plays)
+
+
+def greedy_pip_policy(game: BackgammonGame, plays: list, rnd: random.Random):
+    """Maximiza (pips del rival - pips propios) tras la jugada: avanza y golpea."""
+    color = game._current_color_int()
+    board = game.board()
+    best, best_score = None, None
+    for play in plays:
+        records = [game.make_move(o, pip) for (o, pip) in play]
+        score = board.pip_count(-color) - board.pip_count(color)
+        for rec in reversed(records):
+            game.unmake(rec)
+        if best_score is None or score > best_score:
+            best, best_score = play, score
+    return best
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_pip_policy,
+}
+
+
+def get_policy(name):
+    """Política por nombre (`POLICIES`); una función se devuelve tal cual."""
+    if callable(name):
+        return name
+    if name not in POLICIES:
+        raise ValueError(f"Política desconocida: {name} (opciones: {', '.join(sorted(POLICIES))})")
+    return POLICIES[name]
+
+
+# ---------- una partida ----------
+def new_game(board_cls=ArrayBoard, move_cache: LRUCache | None = None,
+             seed: int | None = None) -> BackgammonGame:
+    g = BackgammonGame(board_cls(), move_cache, seed=seed)
+    g.add_player("White", "white")
+    g.add_player("Black", "black")
+    g.setup_board()
+    return g
+
+
+def game_points(board, winner: int) -> int:
+    """1 = simple, 2 = gammon, 3 = backgammon (desde el punto de vista del ganador)."""
+    loser = -winner
+    if board.off_count(loser) > 0:
+        return 1
+    home = board.home_indices(winner)
+    if board.bar_count(loser) > 0 or any(board.get_point(i) * loser > 0 for i in home):
+        return 3
+    return 2
+
+
+def play_game(white="random", black="random", seed: int | None = None,
+              move_cache: LRUCache | None = None, on_turn=None) -> dict:
+    """
+    Juega una partida completa y devuelve {winner, points, turns, moves}.
+
+    `on_turn(game, turn)`, si se pasa, se llama tras aplicar la jugada de cada
+    turno (antes de rotarlo), p. ej. para exportar cuadros.
+    """
+    rnd = random.Random(seed)  # elecciones de las políticas
+    policies = {Board.WHITE: get_policy(white), Board.BLACK: get_policy(black)}
+    game = new_game(move_cache=move_cache, seed=rnd.getrandbits(64))
+    board = game.board()
+    moves = 0
+    for turn in range(1, MAX_TURNS + 1):
+        color = game._current_color_int()
+        game.start_turn()
+        play = policies[color](game, game.legal_plays(), rnd)
+        for (o, pip) in play:
+            game.apply_move(o, pip)
+        moves += len(play)
+        if on_turn is not None:
+            on_turn(game, turn)
+        if game.has_won(color):
+            return {"winner": color, "points": game_points(board, color), "turns": turn, "moves": moves}
+        game.make_end_turn(force=True)
+    return {"winner": 0, "points": 0, "turns": MAX_TURNS, "moves": moves}
+
+
+# ---------- muchas partidas ----------
+def _run_chunk(args) -> tuple:
+    """Partidas [first, first+count) con caché compartida -> (resultados, (hits, misses))."""
+    first, count, seed, white, black = args
+    cache = LRUCache(CACHE_SIZE)
+    results = [play_game(white, black, seed + i, cache) for i in range(first, first + count)]
+    return results, (cache.hits(), cache.misses())
+
+
+def simulate(games: int, workers: int = 1, seed: int = 0,
+             white: str = "random", black: str = "random") -> dict:
+    """Juega `games` partidas en `workers` procesos y resume throughput y resultados."""
+    if games <= 0:
+        raise ValueError("--games debe ser positivo")
+    if workers <= 0:
+        raise ValueError("--workers debe ser positivo")
+    get_policy(white)
+    get_policy(black)
+
+    chunk = max(1, games // (workers * 4))
+    tasks = [(i, min(chunk, games - i), seed, white, black) for i in range(0, games, chunk)]
+
+    if workers > 1:
+        from multiprocessing import Pool  # import diferido: sólo con varios workers
+
+    t0 = time.perf_counter()
+    if workers == 1:
+        parts = [_run_chunk(t) for t in tasks]
+    else:
+        with Pool(workers) as pool:
+            parts = pool.map(_run_chunk, tasks)
+    elapsed = time.perf_counter() - t0
+    results = [r for (part, _) in parts for r in part]
+    hits = sum(h for (_, (h, _m)) in parts)
+    misses = sum(m for (_, (_h, m)) in parts)
+
+    moves = sum(r["moves"] for r in results)
+    finished = [r for r in results if r["winner"] != 0]
+    n = len(finished) or 1
+    return {
+        "games": games,
+        "workers": workers,
+        "seed": seed,
+        "elapsed": elapsed,
+        "games_per_sec": games / elapsed if elapsed > 0 else 0.0,
+        "moves_per_sec": moves / elapsed if elapsed > 0 else 0.0,
+        "moves": moves,
+        "white_wins": sum(1 for r in finished if r["winner"] == Board.WHITE) / n,
+        "gammons": sum(1 for r in finished if r["points"] == 2) / n,
+        "backgammons": sum(1 for r in finished if r["points"] == 3) / n,
+        "unfinished": games - len(finished),
+        "cache_hits": hits,
+        "cache_misses": misses,
+        "cache_hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+    }
+
+
+def format_summary(s: dict) -> str:
+    return "\n".join([
+        f"Partidas: {s['games']} | Workers: {s['workers']} | Seed: {s['seed']}",
+        f"Tiempo: {s['elapsed']:.2f} s",
+        f"Partidas/seg: {s['games_per_sec']:.1f} | Movimientos/seg: {s['moves_per_sec']:.0f}",
+        f"Victorias White: {s['white_wins']:.1%} | Gammons: {s['gammons']:.1%} | "
+        f"Backgammons: {s['backgammons']:.1%}",
+        f"Caché de jugadas: {s['cache_hit_rate']:.1%} aciertos "
+        f"({s['cache_hits']} hits / {s['cache_misses']} misses)",
+    ])
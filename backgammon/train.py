@@ -0,0 +1,370 @@
+"""
+Entrenamiento por TD(λ) con self-play del evaluador `engine.nn` (requiere NumPy, sólo CPU).
+
+Esquema actor/learner por rondas:
+- Los workers (pool de procesos) juegan `--games-per-round` partidas con los
+  pesos actuales: en cada turno eligen la jugada cuya posición resultante la
+  red evalúa mejor (0-ply, todas las candidatas en un lote; con `--epsilon`
+  exploran al azar) y devuelven la trayectoria como filas de `BatchBoard`.
+- El learner calcula para cada trayectoria los retornos λ con los pesos de
+  la ronda (vista "hacia adelante" de TD(λ), equivalente offline a las
+  trazas de elegibilidad), da pasos de Adam sobre el error cuadrático de las
+  5 salidas y difunde los pesos nuevos en la ronda siguiente.
+- Cada partida usa la semilla `seed + n` (n = partidas ya entrenadas), así
+  una corrida reanudada sigue la misma secuencia.
+
+Las salidas de la red son para el color al turno: el objetivo de una
+posición es el valor de la siguiente visto desde el otro lado (`_flip`).
+
+Checkpoint `.npz` (escritura atómica): pesos (`w1, b1, w2, b2`, legibles por
+`MLP.load`), estado de Adam y contadores. Registro por ronda de
+partidas/seg y pérdida; cada `--eval-every` rondas, tasa de victorias
+contra la política fija `greedy` de `sim` (curva de aprendizaje), también
+como JSON lines en `--log`.
+
+Uso: python -m backgammon.train --games 10000 --workers 4 --checkpoint saves/td.npz [--resume]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+
+from backgammon import sim
+from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
+from backgammon.engine import nn
+
+LAMBDA = 0.7
+LEARNING_RATE = 1e-3
+BATCH = 256
+GAMES_PER_ROUND = 64
+EVAL_GAMES = 100
+
+_PARAMS = ("w1", "b1", "w2", "b2")
+
+
+# ---------- red: gradientes y optimizador ----------
+def _flip(p):
+    """Salidas para el color al turno -> las mismas vistas desde el rival."""
+    q = np.empty_like(p)
+    q[:, nn.WIN] = 1.0 - p[:, nn.WIN]
+    q[:, nn.WIN_GAMMON] = p[:, nn.LOSE_GAMMON]
+    q[:, nn.WIN_BACKGAMMON] = p[:, nn.LOSE_BACKGAMMON]
+    q[:, nn.LOSE_GAMMON] = p[:, nn.WIN_GAMMON]
+    q[:, nn.LOSE_BACKGAMMON] = p[:, nn.WIN_BACKGAMMON]
+    return q
+
+
+def gradients(model: nn.MLP, x, target) -> tuple:
+    """Gradientes de la pérdida (error cuadrático de las 5 salidas, promedio por posición) -> (grads, pérdida)."""
+    h = nn._sigmoid(x @ model.w1 + model.b1)
+    out = nn._sigmoid(h @ model.w2 + model.b2)
+    err = out - target
+    d2 = err * out * (1.0 - out) * (2.0 / len(x))
+    d1 = (d2 @ model.w2.T) * h * (1.0 - h)
+    grads = {"w1": x.T @ d1, "b1": d1.sum(axis=0), "w2": h.T @ d2, "b2": d2.sum(axis=0)}
+    return grads, float((err * err).sum(axis=1).mean())
+
+
+class Adam:
+    """Adam sobre los parámetros de un `MLP` (actualiza en el lugar)."""
+
+    def __init__(self, model: nn.MLP, lr: float = LEARNING_RATE, beta1: float = 0.9,
+                 beta2: float = 0.999, eps: float = 1e-8):
+        if lr <= 0:
+            raise ValueError("lr debe ser positivo")
+        self.lr, self.beta1, self.beta2, self.eps = lr, beta1, beta2, eps
+        self.steps = 0
+        self.m = {k: np.zeros_like(getattr(model, k)) for k in _PARAMS}
+        self.v = {k: np.zeros_like(getattr(model, k)) for k in _PARAMS}
+
+    def step(self, model: nn.MLP, grads: dict) -> None:
+        self.steps += 1
+        c1 = 1.0 - self.beta1 ** self.steps
+        c2 = 1.0 - self.beta2 ** self.steps
+        for k in _PARAMS:
+            g = grads[k]
+            self.m[k] = self.beta1 * self.m[k] + (1.0 - self.beta1) * g
+            self.v[k] = self.beta2 * self.v[k] + (1.0 - self.beta2) * g * g
+            param = getattr(model, k)
+            param -= (self.lr * (self.m[k] / c1) / (np.sqrt(self.v[k] / c2) + self.eps)).astype(param.dtype)
+
+
+# ---------- checkpoints ----------
+def save_checkpoint(path, model: nn.MLP, opt: Adam, games: int, rounds: int) -> None:
+    """Pesos + estado de Adam + contadores en un `.npz`, reemplazado atómicamente."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    arrays = {k: getattr(model, k) for k in _PARAMS}
+    for k in _PARAMS:
+        arrays["adam_m_" + k] = opt.m[k]
+        arrays["adam_v_" + k] = opt.v[k]
+    arrays["adam_steps"] = np.array(opt.steps)
+    arrays["adam_lr"] = np.array(opt.lr)
+    arrays["games"] = np.array(games)
+    arrays["rounds"] = np.array(rounds)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    tmp.replace(path)
+
+
+def load_checkpoint(path) -> tuple:
+    """Checkpoint de `save_checkpoint` -> (model, opt, games, rounds)."""
+    model = nn.MLP.load(path)
+    with np.load(path) as data:
+        needed = [f"adam_{s}_{k}" for s in ("m", "v") for k in _PARAMS] + ["adam_steps", "adam_lr", "games", "rounds"]
+        missing = [k for k in needed if k not in data.files]
+        if missing:
+            raise ValueError(f"Checkpoint incompleto {path}: faltan {', '.join(missing)}")
+        opt = Adam(model, float(data["adam_lr"]))
+        opt.steps = int(data["adam_steps"])
+        for k in _PARAMS:
+            opt.m[k] = data["adam_m_" + k].astype(np.float32)
+            opt.v[k] = data["adam_v_" + k].astype(np.float32)
+        return model, opt, int(data["games"]), int(data["rounds"])
+
+
+# ---------- actores ----------
+def nn_policy(evaluator: nn.NNEvaluator, epsilon: float = 0.0):
+    """Política de `sim`: la jugada con mejor evaluación 0-ply (candidatas en un lote)."""
+    def policy(game, plays, rnd):
+        if len(plays) == 1:
+            return plays[0]
+        if epsilon and rnd.random() < epsilon:
+            return rnd.choice(plays)
+        color = game._current_color_int()
+        board = game.board()
+        rows = []
+        for play in plays:
+            records = [game.make_move(o, pip) for (o, pip) in play]
+            rows.append(nn.board_row(board))
+            for rec in reversed(records):
+                game.unmake(rec)
+        values = evaluator.evaluate_rows(np.array(rows, dtype=np.int8), np.full(len(rows), color))
+        return plays[int(np.argmax(values))]
+    return policy
+
+
+def _outcome(points: int):
+    """Salidas exactas (fila de 5) para el perdedor, que queda al turno al terminar."""
+    z = np.zeros(nn.NUM_OUTPUTS, dtype=np.float32)
+    z[nn.LOSE_GAMMON] = points >= 2
+    z[nn.LOSE_BACKGAMMON] = points >= 3
+    return z
+
+
+def self_play_game(policy, seed: int, move_cache: LRUCache | None = None):
+    """
+    Una partida de self-play -> (filas (T+1, 26) int8, colores al turno (T+1,), puntos)
+    con las posiciones antes de cada tirada; None si no terminó en `sim.MAX_TURNS`.
+    """
+    rnd = random.Random(seed)
+    game = sim.new_game(move_cache=move_cache, seed=rnd.getrandbits(64))
+    board = game.board()
+    rows = [nn.board_row(board)]
+    to_move = [game._current_color_int()]
+    for _ in range(sim.MAX_TURNS):
+        color = game._current_color_int()
+        game.start_turn()
+        for (o, pip) in policy(game, game.legal_plays(), rnd):
+            game.apply_move(o, pip)
+        rows.append(nn.board_row(board))
+        to_move.append(-color)
+        if game.has_won(color):
+            return np.array(rows, dtype=np.int8), np.array(to_move, dtype=np.int8), sim.game_points(board, color)
+        game.make_end_turn(force=True)
+    return None
+
+
+def _run_selfplay(args) -> list:
+    """Partidas [first, first+count) con los pesos recibidos."""
+    weights, first, count, seed, epsilon = args
+    policy = nn_policy(nn.NNEvaluator(nn.MLP(*weights)), epsilon)
+    cache = LRUCache(sim.CACHE_SIZE)
+    return [self_play_game(policy, seed + i, cache) for i in range(first, first + count)]
+
+
+def _run_eval(args) -> list:
+    """Partidas contra `greedy` alternando colores -> puntos desde el lado de la red."""
+    weights, first, count, seed = args
+    policy = nn_policy(nn.NNEvaluator(nn.MLP(*weights)))
+    cache = LRUCache(sim.CACHE_SIZE)
+    res = []
+    for i in range(first, first + count):
+        nn_color = Board.WHITE if i % 2 == 0 else Board.BLACK
+        if nn_color == Board.WHITE:
+            r = sim.play_game(policy, "greedy", seed + i, cache)
+        else:
+            r = sim.play_game("greedy", policy, seed + i, cache)
+        res.append(0 if r["winner"] == 0 else r["points"] * (1 if r["winner"] == nn_color else -1))
+    return res
+
+
+def _tasks(weights, first: int, games: int, workers: int, *extra) -> list:
+    chunk = max(1, -(-games // workers))
+    return [(weights, i, min(chunk, first + games - i)) + extra for i in range(first, first + games, chunk)]
+
+
+def _map(pool, fn, tasks) -> list:
+    parts = pool.map(fn, tasks) if pool is not None else [fn(t) for t in tasks]
+    return [r for part in parts for r in part]
+
+
+# ---------- learner ----------
+def lambda_targets(model: nn.MLP, rows, to_move, points: int, lam: float = LAMBDA):
+    """Entradas (T, 198) y retornos λ (T, 5) de una trayectoria (sin la posición final)."""
+    x = nn.encode_cells(rows, to_move)
+    values = model.forward(x)
+    values[-1] = _outcome(points)
+    targets = np.empty_like(values)
+    targets[-1] = values[-1]
+    for t in range(len(values) - 2, -1, -1):
+        # G_t = (1-λ) V(s_t+1) + λ G_t+1, visto desde el otro lado (en la final V = G = resultado)
+        targets[t] = _flip((1.0 - lam) * values[t + 1:t + 2] + lam * targets[t + 1:t + 2])[0]
+    return x[:-1], targets[:-1]
+
+
+def learn(model: nn.MLP, opt: Adam, trajectories: list, lam: float = LAMBDA,
+          batch: int = BATCH, rng: np.random.Generator | None = None) -> float:
+    """Una pasada de Adam sobre los retornos λ de las trayectorias; devuelve la pérdida media."""
+    pairs = [lambda_targets(model, rows, to_move, points, lam) for (rows, to_move, points) in trajectories]
+    if not pairs:
+        return 0.0
+    x = np.concatenate([p[0] for p in pairs])
+    y = np.concatenate([p[1] for p in pairs])
+    order = (rng or np.random.default_rng()).permutation(len(x))
+    losses = []
+    for start in range(0, len(x), batch):
+        idx = order[start:start + batch]
+        grads, loss = gradients(model, x[idx], y[idx])
+        opt.step(model, grads)
+        losses.append(loss)
+    return float(np.mean(losses))
+
+
+def evaluate_vs_greedy(model: nn.MLP, games: int, seed: int = 0, workers: int = 1, pool=None) -> dict:
+    """Tasa de victorias y puntos por partida de la red (0-ply) contra `sim.greedy_pip_policy`."""
+    weights = tuple(getattr(model, k) for k in _PARAMS)
+    results = _map(pool, _run_eval, _tasks(weights, 0, games, workers, seed))
+    finished = [r for r in results if r != 0] or [0]
+    return {
+        "games": games,
+        "win_rate": sum(1 for r in finished if r > 0) / len(finished),
+        "ppg": sum(finished) / len(finished),
+    }
+
+
+def train(games: int, workers: int = 1, checkpoint=None, resume: bool = False, seed: int = 0,
+          hidden: int = nn.HIDDEN, lam: float = LAMBDA, lr: float = LEARNING_RATE,
+          games_per_round: int = GAMES_PER_ROUND, epsilon: float = 0.0, eval_every: int = 0,
+          eval_games: int = EVAL_GAMES, log=None, verbose: bool = True) -> dict:
+    """
+    Entrena `games` partidas más. Con `resume` continúa desde `checkpoint`
+    (pesos, Adam y contadores); si no, empieza con pesos aleatorios de
+    `seed`. Guarda el checkpoint al final de cada ronda y devuelve
+    {model, games, rounds, history: [registro por ronda]}.
+    """
+    if games <= 0:
+        raise ValueError("--games debe ser positivo")
+    if workers <= 0:
+        raise ValueError("--workers debe ser positivo")
+    if games_per_round <= 0:
+        raise ValueError("--games-per-round debe ser positivo")
+    if not (0.0 <= lam <= 1.0):
+        raise ValueError("lambda debe estar en [0, 1]")
+    if not (0.0 <= epsilon <= 1.0):
+        raise ValueError("epsilon debe estar en [0, 1]")
+    if resume:
+        if checkpoint is None or not os.path.exists(checkpoint):
+            raise ValueError(f"No hay checkpoint para reanudar: {checkpoint}")
+        model, opt, done, rounds = load_checkpoint(checkpoint)
+    else:
+        model = nn.MLP.random(hidden, seed=seed)
+        opt = Adam(model, lr)
+        done, rounds = 0, 0
+
+    rng = np.random.default_rng(seed + done)
+    history = []
+    target = done + games
+    pool = None
+    if workers > 1:
+        from multiprocessing import Pool  # import diferido: sólo con varios workers
+
+        pool = Pool(workers)
+    try:
+        while done < target:
+            n = min(games_per_round, target - done)
+            weights = tuple(getattr(model, k) for k in _PARAMS)
+            t0 = time.perf_counter()
+            results = _map(pool, _run_selfplay, _tasks(weights, done, n, workers, seed, epsilon))
+            gen_elapsed = time.perf_counter() - t0
+            trajectories = [r for r in results if r is not None]
+            loss = learn(model, opt, trajectories, lam, rng=rng)
+            done += n
+            rounds += 1
+            entry = {
+                "round": rounds, "games": done,
+                "games_per_sec": n / gen_elapsed if gen_elapsed > 0 else 0.0,
+                "positions": sum(len(t[0]) - 1 for t in trajectories),
+                "loss": loss,
+                "elapsed": time.perf_counter() - t0,
+            }
+            if eval_every and rounds % eval_every == 0:
+                entry["vs_greedy"] = evaluate_vs_greedy(model, eval_games, seed, workers, pool)
+            if checkpoint is not None:
+                save_checkpoint(checkpoint, model, opt, done, rounds)
+            history.append(entry)
+            if log is not None:
+                with open(log, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+            if verbose:
+                print(format_entry(entry), flush=True)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return {"model": model, "games": done, "rounds": rounds, "history": history}
+
+
+def format_entry(e: dict) -> str:
+    line = (f"Ronda {e['round']} | Partidas: {e['games']} | Partidas/seg: {e['games_per_sec']:.1f} | "
+            f"Posiciones: {e['positions']} | Pérdida: {e['loss']:.5f}")
+    if "vs_greedy" in e:
+        v = e["vs_greedy"]
+        line += f" | vs greedy: {v['win_rate']:.1%} victorias, {v['ppg']:+.2f} pts/partida"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="backgammon-train")
+    parser.add_argument("--games", type=int, default=10000, help="Partidas de self-play a entrenar")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Procesos generadores")
+    parser.add_argument("--checkpoint", default="saves/td.npz", help="Pesos + estado del optimizador (.npz)")
+    parser.add_argument("--resume", action="store_true", help="Continuar desde --checkpoint")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hidden", type=int, default=nn.HIDDEN, help="Unidades ocultas (sólo al empezar)")
+    parser.add_argument("--lambda", dest="lam", type=float, default=LAMBDA)
+    parser.add_argument("--lr", type=float, default=LEARNING_RATE, help="Tasa de Adam (sólo al empezar)")
+    parser.add_argument("--games-per-round", type=int, default=GAMES_PER_ROUND,
+                        help="Partidas entre actualizaciones/difusión de pesos")
+    parser.add_argument("--epsilon", type=float, default=0.0, help="Probabilidad de jugada al azar")
+    parser.add_argument("--eval-every", type=int, default=10, help="Rondas entre evaluaciones vs greedy (0 = nunca)")
+    parser.add_argument("--eval-games", type=int, default=EVAL_GAMES)
+    parser.add_argument("--log", default=None, help="Registro por ronda en JSON lines")
+    args = parser.parse_args(argv)
+    try:
+        res = train(args.games, args.workers, args.checkpoint, args.resume, args.seed, args.hidden,
+                    args.lam, args.lr, args.games_per_round, args.epsilon, args.eval_every,
+                    args.eval_games, args.log)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Total: {res['games']} partidas en {res['rounds']} rondas | Checkpoint: {args.checkpoint}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark de generación de movimientos: `Board` (lista) vs `ArrayBoard` (array).
+
+Uso:
+    python -m benchmarks.bench_board [--positions N] [--repeat R] [--seed S]
+
+Genera N posiciones por self-play aleatorio y mide posiciones/segundo de
+`legal_moves()` + `legal_bear_off_moves()` sobre cada implementación, además
+del recorrido "checked" (API pública con validaciones) sobre `Board`. Antes
+de medir verifica que las tres filas generen los mismos movimientos (entradas,
+normales y bear-offs); cada fila informa la mejor de `--repeat` pasadas,
+intercaladas, y los bytes por tablero (tracemalloc).
+
+Las dos clases generan con el mismo camino sin validaciones y tablas de
+destinos (`_single_moves` / `_bear_off_steps`), así que en CPython rinden
+parecido (`ArrayBoard` queda ~5-10% por debajo: leer un `array('b')` crea un
+int por acceso); la ventaja de `ArrayBoard` es la memoria, ~40% menos bytes
+por tablero. Las dos sacan ~3x a la API validada.
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+
+
+def _new_game(board=None) -> BackgammonGame:
+    g = BackgammonGame(board)
+    g.add_player("White", "white")
+    g.add_player("Black", "black")
+    g.setup_board()
+    return g
+
+
+def sample_positions(n: int, seed: int = 0) -> list:
+    """Posiciones (dict de to_dict) alcanzadas jugando al azar."""
+    rnd = random.Random(seed)
+    res = []
+    g = _new_game()
+    while len(res) < n:
+        g.start_turn((rnd.randint(1, 6), rnd.randint(1, 6)))
+        res.append(g.to_dict())
+        while True:
+            moves = g.legal_moves() + [(o, None, p) for (o, p) in g.legal_bear_off_moves()]
+            if not moves:
+                break
+            o, _, pip = rnd.choice(moves)
+            g.apply_move(o, pip)
+        g.auto_end_turn()
+        if g.has_won(Board.WHITE) or g.has_won(Board.BLACK):
+            g = _new_game()
+    return res
+
+
+def _checked_moves(g: BackgammonGame) -> tuple:
+    """Mismos movimientos que `_fast_moves`, usando sólo la API pública validada del Board."""
+    b = g.board()
+    color = g._current_color_int()
+    pips = sorted(set(g.pips()))
+    moves, off = [], []
+    if b.bar_count(color):
+        for pip in pips:
+            if b.can_enter(pip, color):
+                moves.append((-1, b.entry_index(pip, color), pip))
+        return moves, off
+    for origin in range(b.num_points()):
+        if b.owner_at(origin) != color or b.count_at(origin) <= 0:
+            continue
+        for pip in pips:
+            if b.can_move(origin, pip, color):
+                moves.append((origin, b.dest_from(origin, pip, color), pip))
+    if b.all_in_home(color):
+        for origin in b.home_indices(color):
+            if b.owner_at(origin) != color or b.count_at(origin) <= 0:
+                continue
+            for pip in pips:
+                if b.can_bear_off(origin, pip, color):
+                    off.append((origin, pip))
+    return moves, off
+
+
+def _fast_moves(g: BackgammonGame) -> tuple:
+    # sin pasar por la caché de movimientos: se mide la generación
+    return g._compute_legal_moves(), g._compute_bear_off_moves()
+
+
+ROWS = (
+    ("Board (API validada)", Board, _checked_moves),
+    ("Board", Board, _fast_moves),
+    ("ArrayBoard", ArrayBoard, _fast_moves),
+)
+
+
+def _games(positions: list, make_board) -> list:
+    return [BackgammonGame.from_dict(d, make_board()) for d in positions]
+
+
+def same_moves(positions: list) -> bool:
+    """True si todas las filas generan los mismos movimientos en cada posición."""
+    per_row = [[tuple(sorted(m) for m in gen(g)) for g in _games(positions, make_board)]
+               for (_, make_board, gen) in ROWS]
+    return all(moves == per_row[0] for moves in per_row[1:])
+
+
+def board_bytes(make_board, n: int = 1000) -> int:
+    """Bytes por tablero con la posición inicial (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        boards = [make_board() for _ in range(n)]
+        for b in boards:
+            b.setup_initial()
+        return tracemalloc.get_traced_memory()[0] // n
+    finally:
+        tracemalloc.stop()
+
+
+def run(positions: list, repeat: int) -> list:
+    """[(nombre, pos/s, bytes por tablero)]: mejor de `repeat` pasadas, filas intercaladas."""
+    games = [_games(positions, make_board) for (_, make_board, _) in ROWS]
+    best = [float("inf")] * len(ROWS)
+    for _ in range(repeat):
+        for i, (_, _, gen) in enumerate(ROWS):
+            t0 = time.perf_counter()
+            for g in games[i]:
+                gen(g)
+            best[i] = min(best[i], time.perf_counter() - t0)
+    return [(name, len(positions) / dt, board_bytes(make_board))
+            for (name, make_board, _), dt in zip(ROWS, best)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_board")
+    parser.add_argument("--positions", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    positions = sample_positions(args.positions, args.seed)
+    if not same_moves(positions):
+        raise SystemExit("Las filas no generan los mismos movimientos: la comparación no vale")
+    rows = run(positions, args.repeat)
+    base = rows[0][1]
+    for name, pps, size in rows:
+        print(f"{name:<22} {pps:>12,.0f} pos/s  (x{pps / base:.2f})  {size:>5} B/tablero")
+
+
+if __name__ == "__main__":
+    main()
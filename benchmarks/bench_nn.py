@@ -0,0 +1,74 @@
+"""
+Benchmark del evaluador por red neuronal (`engine.nn`, requiere NumPy).
+
+Uso:
+    python -m benchmarks.bench_nn [--positions N] [--hidden H] [--seed S]
+
+Mide evaluaciones/segundo (codificación + pasada de la red) con lotes de 1,
+64 y 4096 posiciones, y la evaluación suelta vía `MicroBatcher`.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+from backgammon.engine import nn
+from benchmarks.bench_board import sample_positions
+
+BATCH_SIZES = (1, 64, 4096)
+
+
+def _rows(positions: list):
+    boards = [BackgammonGame.from_dict(d).board() for d in positions]
+    return np.array([nn.board_row(b) for b in boards], dtype=np.int8), boards
+
+
+def run(evaluator: nn.NNEvaluator, rows, batch: int, min_evals: int) -> float:
+    """Evaluaciones/segundo en lotes de `batch` filas (al menos `min_evals` en total)."""
+    if len(rows) < batch:
+        rows = np.resize(rows, (batch, rows.shape[1]))  # repite posiciones
+    n = len(rows)
+    colors = np.full(batch, Board.WHITE)
+    done = 0
+    t0 = time.perf_counter()
+    while done < min_evals:
+        start = done % n
+        chunk = rows[start:start + batch]
+        if len(chunk) < batch:
+            chunk = np.concatenate([chunk, rows[:batch - len(chunk)]])
+        evaluator.evaluate_rows(chunk, colors)
+        done += batch
+    return done / (time.perf_counter() - t0)
+
+
+def run_batcher(evaluator: nn.NNEvaluator, boards: list, max_batch: int) -> float:
+    batcher = nn.MicroBatcher(evaluator, max_batch)
+    t0 = time.perf_counter()
+    tickets = [batcher.submit(b, Board.WHITE) for b in boards]
+    for t in tickets:
+        batcher.result(t)
+    return len(boards) / (time.perf_counter() - t0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_nn")
+    parser.add_argument("--positions", type=int, default=4096)
+    parser.add_argument("--hidden", type=int, default=nn.HIDDEN)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows, boards = _rows(sample_positions(args.positions, args.seed))
+    evaluator = nn.NNEvaluator(nn.MLP.random(args.hidden, seed=args.seed))
+    base = None
+    for batch in BATCH_SIZES:
+        eps = run(evaluator, rows, batch, min_evals=max(2000, 4 * batch))
+        base = base or eps
+        print(f"lote {batch:<5} {eps:>14,.0f} eval/s  (x{eps / base:.1f})")
+    eps = run_batcher(evaluator, boards, 256)
+    print(f"{'MicroBatcher(256)':<10} {eps:>8,.0f} eval/s  (x{eps / base:.1f})")
+
+
+if __name__ == "__main__":
+    main()
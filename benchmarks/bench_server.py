@@ -0,0 +1,159 @@
+"""
+Prueba de carga del servidor de partidas (`backgammon.server`).
+
+Uso:
+    python -m benchmarks.bench_server [--games 1000 10000] [--turns T] [--connections C]
+                                      [--connect HOST:PORT | --unix PATH]
+
+Sin `--connect`/`--unix` levanta el servidor en un subproceso sobre un socket
+Unix temporal. Para cada nivel de concurrencia abre C conexiones y juega N
+partidas a la vez (repartidas entre las conexiones, con pedidos encadenados
+por id): new, y por turno start_turn, legal_moves, apply_move... y end_turn,
+eligiendo siempre el primer movimiento legal; al final close. Informa
+pedidos/seg y latencia p50/p99 por pedido (envío -> respuesta).
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+LEVELS = (1000, 10000)
+
+
+class Connection:
+    """Conexión NDJSON con pedidos encadenados: cada respuesta resuelve su futuro por id."""
+
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+        self.pending = {}
+        self.next_id = 0
+        self.latencies = []
+        self.task = asyncio.ensure_future(self.__read_loop__())
+
+    @classmethod
+    async def open(cls, host=None, port=None, path=None) -> "Connection":
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=1 << 20)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        return cls(reader, writer)
+
+    async def __read_loop__(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            resp = json.loads(line)
+            fut, t0 = self.pending.pop(resp["id"])
+            self.latencies.append(time.perf_counter() - t0)
+            fut.set_result(resp)
+
+    async def request(self, cmd: str, **args) -> dict:
+        self.next_id += 1
+        rid = self.next_id
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[rid] = (fut, time.perf_counter())
+        self.writer.write((json.dumps({"id": rid, "cmd": cmd, **args}) + "\n").encode())
+        resp = await fut
+        if not resp["ok"]:
+            raise RuntimeError(f"{cmd}: {resp['error']}")
+        return resp["result"]
+
+    async def close(self):
+        self.writer.close()
+        self.task.cancel()
+
+
+async def play(conn: Connection, seed: int, turns: int) -> None:
+    """Una partida de hasta `turns` turnos moviendo siempre el primer movimiento legal."""
+    gid = (await conn.request("new", seed=seed))["game"]
+    for _ in range(turns):
+        await conn.request("start_turn", game=gid)
+        won = False
+        while True:
+            legal = await conn.request("legal_moves", game=gid)
+            if legal["moves"]:
+                o, _, pip = legal["moves"][0]
+            elif legal["bear_off"]:
+                o, pip = legal["bear_off"][0]
+            else:
+                break
+            res = await conn.request("apply_move", game=gid, origin=o, pip=pip)
+            won = res["winner"] is not None
+            if won or not res["pips"]:
+                break
+        if won:
+            break
+        await conn.request("end_turn", game=gid)
+    await conn.request("close", game=gid)
+
+
+async def run_level(games: int, turns: int, connections: int, host, port, path) -> dict:
+    conns = [await Connection.open(host, port, path) for _ in range(connections)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(play(conns[i % connections], i, turns) for i in range(games)))
+    elapsed = time.perf_counter() - t0
+    lat = sorted(x for c in conns for x in c.latencies)
+    for c in conns:
+        await c.close()
+    return {
+        "games": games,
+        "requests": len(lat),
+        "elapsed": elapsed,
+        "requests_per_sec": len(lat) / elapsed,
+        "p50_ms": lat[len(lat) // 2] * 1000,
+        "p99_ms": lat[min(len(lat) - 1, int(len(lat) * 0.99))] * 1000,
+    }
+
+
+def _spawn_server(path: str) -> subprocess.Popen:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.Popen([sys.executable, "-m", "backgammon.server", "--unix", path],
+                            env=env, stdout=subprocess.DEVNULL)
+    for _ in range(200):
+        if os.path.exists(path):
+            return proc
+        time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("El servidor no arrancó")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_server")
+    parser.add_argument("--games", type=int, nargs="+", default=list(LEVELS), help="Partidas concurrentes por nivel")
+    parser.add_argument("--turns", type=int, default=4, help="Turnos por partida")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--connect", default=None, metavar="HOST:PORT")
+    parser.add_argument("--unix", default=None, metavar="PATH")
+    args = parser.parse_args(argv)
+
+    host = port = path = None
+    proc = tmp = None
+    if args.connect:
+        host, _, p = args.connect.rpartition(":")
+        port = int(p)
+    elif args.unix:
+        path = args.unix
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp.name, "server.sock")
+        proc = _spawn_server(path)
+    try:
+        for games in args.games:
+            r = asyncio.run(run_level(games, args.turns, args.connections, host, port, path))
+            print(f"{r['games']:>6} partidas | {r['requests']:>8} pedidos | {r['requests_per_sec']:>9,.0f} ped/s | "
+                  f"p50 {r['p50_ms']:.2f} ms | p99 {r['p99_ms']:.2f} ms")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+            tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
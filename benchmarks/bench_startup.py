@@ -0,0 +1,92 @@
+"""
+Benchmark de arranque en frío: tiempo de import según `python -X importtime`.
+
+Uso:
+    python -m benchmarks.bench_startup [--runs R] [--top N]
+
+Para cada módulo de entrada (CLI, core, motor, servidor) importa en un
+proceso nuevo R veces y reporta el mínimo del tiempo acumulado; para la CLI
+lista además los N imports con más tiempo propio. Lo usa también
+`tests/test_validos/test_startup.py` para fallar si la CLI supera su
+presupuesto o arrastra dependencias pesadas.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ENTRY_MODULES = (
+    "backgammon.cli.app",
+    "backgammon.core.game",
+    "backgammon.engine.search",
+    "backgammon.server",
+)
+# dependencias que sólo deben cargarse cuando un comando las necesita
+HEAVY_MODULES = (
+    "numpy", "pandas", "scipy", "sklearn", "matplotlib", "seaborn", "statsmodels", "pygame",
+    "multiprocessing", "sqlite3", "asyncio",
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str, *flags) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return subprocess.run([sys.executable, *flags, "-c", code], env=env, cwd=_ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def import_times(module: str) -> dict:
+    """{módulo: (propio µs, acumulado µs)} de un import en un proceso nuevo."""
+    res = {}
+    for line in _run(f"import {module}", "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:  # encabezado
+            continue
+        res[parts[2].strip()] = (self_us, cum_us)
+    return res
+
+
+def cold_start_ms(module: str, runs: int = 3) -> float:
+    """Mínimo sobre `runs` procesos del tiempo acumulado de importar `module` (ms)."""
+    return min(import_times(module)[module][1] for _ in range(runs)) / 1000
+
+
+def loaded_heavy(module: str) -> list:
+    """Dependencias de HEAVY_MODULES que quedan cargadas tras importar `module`."""
+    code = (f"import sys, {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    out = _run(code).stdout.strip()
+    return out.split(",") if out else []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_startup")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    for module in ENTRY_MODULES:
+        heavy = loaded_heavy(module)
+        print(f"{module:<26} {cold_start_ms(module, args.runs):>7.1f} ms"
+              + (f"  (carga: {', '.join(heavy)})" if heavy else ""))
+
+    times = import_times(ENTRY_MODULES[0])
+    print(f"\nImports con más tiempo propio ({ENTRY_MODULES[0]}):")
+    for name, (self_us, cum_us) in sorted(times.items(), key=lambda kv: -kv[1][0])[:args.top]:
+        print(f"  {name:<32} {self_us / 1000:>6.1f} ms  (acumulado {cum_us / 1000:.1f} ms)")
+
+    t0 = time.perf_counter()
+    for _ in range(args.runs):
+        _run("from backgammon.cli.app import main; main(['--status'])")
+    print(f"\n`cli --status` completo: {(time.perf_counter() - t0) / args.runs * 1000:.1f} ms por proceso")
+
+
+if __name__ == "__main__":
+    main()
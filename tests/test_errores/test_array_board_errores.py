@@ -0,0 +1,51 @@
+import unittest
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+
+
+class TestArrayBoardErrores(unittest.TestCase):
+    def test_get_point_fuera_de_rango(self):
+        a = ArrayBoard()
+        with self.assertRaises(ValueError):
+            a.get_point(24)
+        with self.assertRaises(TypeError):
+            a.get_point("0")
+
+    def test_set_point_cantidad_fuera_de_rango(self):
+        for board in (ArrayBoard(), Board()):
+            for bad in (200, -128):
+                with self.assertRaises(ValueError) as ctx:
+                    board.set_point(3, bad)
+                self.assertEqual(str(ctx.exception), "Cantidad de fichas fuera de rango")
+            self.assertEqual(board.get_point(3), 0)
+
+    def test_color_invalido(self):
+        a = ArrayBoard()
+        with self.assertRaises(ValueError):
+            a.is_blocked(0, 0)
+        with self.assertRaises(ValueError):
+            a.bar_count(2)
+
+    def test_dest_from_fuera_del_tablero(self):
+        a = ArrayBoard()
+        with self.assertRaises(ValueError):
+            a.dest_from(1, 2, Board.WHITE)
+
+    def test_move_invalido_levanta(self):
+        a = ArrayBoard(); a.setup_initial()
+        with self.assertRaises(ValueError):
+            a.move(12, 1, Board.WHITE)
+
+    def test_bear_off_sin_all_in_home_levanta(self):
+        a = ArrayBoard(); a.setup_initial()
+        with self.assertRaises(ValueError):
+            a.bear_off(5, 6, Board.WHITE)
+
+    def test_barra_vacia_levanta(self):
+        a = ArrayBoard()
+        with self.assertRaises(ValueError):
+            a._dec_bar(Board.WHITE)
+
+
+if __name__ == "__main__":
+    unittest.main()
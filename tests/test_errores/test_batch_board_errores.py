@@ -0,0 +1,30 @@
+import unittest
+
+try:
+    import numpy as np
+    from backgammon.core.batch_board import BatchBoard
+except ImportError:  # numpy es opcional fuera de CI
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestBatchBoardErrores(unittest.TestCase):
+    def test_forma_invalida(self):
+        with self.assertRaises(ValueError):
+            BatchBoard(np.zeros((3, 24)))
+
+    def test_color_invalido(self):
+        bb = BatchBoard.zeros(2)
+        with self.assertRaises(ValueError):
+            bb.pip_count(0)
+        with self.assertRaises(ValueError):
+            bb.move_mask(3, 2)
+
+    def test_indice_fuera_de_rango(self):
+        bb = BatchBoard.zeros(2)
+        with self.assertRaises(ValueError):
+            bb.is_blocked(24, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.engine import bearoff
+
+
+class TestBearoffErrores(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "bearoff.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_max_checkers_fuera_de_rango(self):
+        with self.assertRaises(ValueError):
+            bearoff.generate(16)
+
+    def test_archivo_invalido(self):
+        with open(self.path, "wb") as f:
+            f.write(b"XXXX" + bytes(64))
+        with self.assertRaises(ValueError):
+            bearoff.BearoffDatabase(self.path)
+
+    def test_archivo_vacio(self):
+        open(self.path, "wb").close()
+        with self.assertRaises(ValueError):
+            bearoff.BearoffDatabase(self.path)
+
+    def test_consultas_invalidas(self):
+        bearoff.write_database(self.path, max_checkers=2)
+        with bearoff.BearoffDatabase(self.path) as db:
+            with self.assertRaises(ValueError):
+                db.expected_rolls((3, 0, 0, 0, 0, 0))
+            with self.assertRaises(ValueError):
+                db.expected_rolls((1, 0, 0))
+            with self.assertRaises(ValueError):
+                db.distribution((-1, 0, 0, 0, 0, 0))
+
+    def test_board_con_fichas_fuera_del_home(self):
+        b = Board()
+        b.set_point(10, 1)
+        with self.assertRaises(ValueError):
+            bearoff.home_counts(b, Board.WHITE)
+
+
+if __name__ == "__main__":
+    unittest.main()
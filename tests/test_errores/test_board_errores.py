@@ -32,6 +32,11 @@ class TestBoardErrores(unittest.TestCase):
         with self.assertRaises(TypeError):
             b.set_point(1.2, 1)
 
+    def test_board_set_point_cantidad_fuera_de_rango(self):
+        b = Board()
+        with self.assertRaises(ValueError):
+            b.set_point(0, 500)
+
     def test_board_is_blocked_color_invalido(self):
         b = Board()
         with self.assertRaises(ValueError):
@@ -0,0 +1,25 @@
+import unittest
+
+from backgammon.core.cache import LRUCache
+
+
+class TestLRUCacheErrores(unittest.TestCase):
+    def test_maxsize_invalido(self):
+        for n in (0, -1, 1.5, None):
+            with self.assertRaises(ValueError):
+                LRUCache(n)
+
+    def test_resize_invalido(self):
+        c = LRUCache(2)
+        with self.assertRaises(ValueError):
+            c.resize(0)
+
+    def test_get_inexistente_devuelve_default(self):
+        c = LRUCache(2)
+        self.assertIsNone(c.get("x"))
+        self.assertEqual(c.get("x", 7), 7)
+        self.assertEqual(c.misses(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
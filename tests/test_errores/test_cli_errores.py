@@ -40,6 +40,54 @@ class TestCLIErrores(unittest.TestCase):
         with self.assertRaises(ValueError):
             cli_main(["--setup", "--roll", "3,4", "--end-turn"])
 
+    def test_cli_batch_errores_con_numero_de_linea(self):
+        import contextlib, io, os, tempfile
+        with tempfile.TemporaryDirectory() as d:
+            cmds = os.path.join(d, "cmds.txt")
+            with open(cmds, "w", encoding="utf-8") as f:
+                f.write("roll 3,4\nmove 7,3\nvolar 1\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                with self.assertRaisesRegex(ValueError, "Línea 3"):
+                    cli_main(["--setup", "--batch", cmds])
+                with self.assertRaisesRegex(ValueError, "Línea 1"):
+                    from backgammon.cli.session import Session
+                    from backgammon.core.game import BackgammonGame
+                    Session(BackgammonGame()).run_lines(["hint 5"])
+        with self.assertRaises(ValueError):
+            cli_main(["--batch", "no_existe_cmds.txt"])
+        with self.assertRaises(SystemExit):
+            cli_main(["--batch", "-", "--serve", "/tmp/x.sock"])
+
+    def test_session_respond_informa_errores_de_archivo(self):
+        import tempfile
+        from backgammon.cli.session import Session
+        from backgammon.core.board import Board
+        from backgammon.core.journal import Journal
+        from backgammon.sim import new_game
+        with tempfile.TemporaryDirectory() as d:
+            s = Session(new_game(Board))
+            self.assertTrue(s.respond(f"save {d}").startswith("error: No se pudo guardar"))
+            self.assertTrue(s.respond(f"load {d}").startswith("error: No se pudo leer"))
+            with self.assertRaisesRegex(ValueError, "Línea 1: No se pudo guardar"):
+                s.run_lines([f"save {d}"])
+            # el journal no puede escribir (su ruta es un directorio): error, no una excepción
+            s = Session(new_game(Board), Journal(d))
+            self.assertTrue(s.respond("roll 3,4").splitlines()[-1].startswith("error: "))
+            self.assertTrue(s.respond("status").endswith("ok\n"))
+
+    def test_cli_serve_no_pisa_archivos(self):
+        import asyncio, tempfile, os
+        from backgammon.cli.session import Session
+        from backgammon.core.game import BackgammonGame
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            path = f.name
+        try:
+            with self.assertRaises(ValueError):
+                asyncio.run(Session(BackgammonGame()).serve_async(path))
+            self.assertTrue(os.path.exists(path))
+        finally:
+            os.unlink(path)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from backgammon.core.dice import Dice
+from backgammon.core.game import BackgammonGame
+
+
+class TestDiceErrores(unittest.TestCase):
+    def test_seed_y_rng_a_la_vez(self):
+        with self.assertRaises(ValueError):
+            Dice(seed=1, rng=random.Random(1))
+
+    def test_buffer_size_invalido(self):
+        for n in (0, -5, 2.5):
+            with self.assertRaises(ValueError):
+                Dice(buffer_size=n)
+
+    def test_rng_de_tipo_invalido(self):
+        with self.assertRaises(TypeError):
+            Dice(rng=object())
+
+    def test_rolls_negativo(self):
+        with self.assertRaises(ValueError):
+            Dice(seed=1).rolls(-1)
+
+    def test_from_state_invalido(self):
+        for bad in ({}, {"seed": 1}, {"seed": "x", "drawn": 0}, {"seed": 1, "drawn": -1}):
+            with self.assertRaises(ValueError):
+                Dice.from_state(bad)
+
+    def test_game_seed_y_dice_a_la_vez(self):
+        with self.assertRaises(ValueError):
+            BackgammonGame(seed=1, dice=Dice(seed=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
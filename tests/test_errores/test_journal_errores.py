@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.core.journal import Journal, load_game, normalize_state, replay
+from backgammon.sim import new_game
+
+
+class TestJournalErrores(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "last.journal")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _escribir(self, texto):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(texto)
+
+    def _checkpoint(self):
+        with Journal(self.path) as j:
+            j.checkpoint(new_game(Board))
+        return open(self.path, encoding="utf-8").read()
+
+    def test_checkpoint_every_invalido(self):
+        for bad in (0, -1, 2.5, None):
+            with self.assertRaises(ValueError):
+                Journal(self.path, checkpoint_every=bad)
+
+    def test_archivo_inexistente(self):
+        with self.assertRaises(ValueError):
+            load_game(os.path.join(self.tmp.name, "no.journal"))
+
+    def test_sin_checkpoint(self):
+        self._escribir('{"t":"start","roll":[3,4]}\n')
+        with self.assertRaises(ValueError):
+            replay(self.path)
+
+    def test_linea_corrupta_en_el_medio(self):
+        ck = self._checkpoint()
+        self._escribir(ck + '{"t":"sta\n{"t":"end"}\n')
+        with self.assertRaises(ValueError):
+            replay(self.path)
+
+    def test_registro_inconsistente(self):
+        ck = self._checkpoint()
+        # mover sin tirada previa
+        self._escribir(ck + '{"t":"move","o":7,"p":3}\n')
+        with self.assertRaises(ValueError):
+            replay(self.path)
+        self._escribir(ck + '{"t":"teleport"}\n')
+        with self.assertRaises(ValueError):
+            replay(self.path)
+
+    def test_estado_json_invalido(self):
+        with self.assertRaises(ValueError):
+            normalize_state([1, 2, 3])
+        with self.assertRaises(ValueError):
+            normalize_state({"board": [0] * 5})
+        path = os.path.join(self.tmp.name, "roto.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{no es json")
+        with self.assertRaises(ValueError):
+            load_game(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from backgammon.engine import nn
+except ImportError:  # numpy es opcional fuera de CI
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestNNErrores(unittest.TestCase):
+    def test_dimensiones_invalidas(self):
+        with self.assertRaises(ValueError):
+            nn.encode_cells(np.zeros((2, 24), dtype=np.int8), 1)
+        with self.assertRaises(ValueError):
+            nn.encode_cells(np.zeros((2, 26), dtype=np.int8), 0)
+        with self.assertRaises(ValueError):
+            nn.MLP(np.zeros((10, 4)), np.zeros(4), np.zeros((4, 5)), np.zeros(5))
+        with self.assertRaises(ValueError):
+            nn.MLP(np.zeros((198, 4)), np.zeros(3), np.zeros((4, 5)), np.zeros(5))
+
+    def test_npz_incompleto(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "pesos.npz")
+            np.savez(path, w1=np.zeros((198, 4)), b1=np.zeros(4))
+            with self.assertRaises(ValueError):
+                nn.MLP.load(path)
+
+    def test_micro_batcher(self):
+        ev = nn.NNEvaluator(nn.MLP.random(hidden=4, seed=0))
+        with self.assertRaises(ValueError):
+            nn.MicroBatcher(ev, max_batch=0)
+        with self.assertRaises(KeyError):
+            nn.MicroBatcher(ev).result(0)
+
+    def test_micro_batcher_doble_result(self):
+        from backgammon.core.board import Board
+
+        ev = nn.NNEvaluator(nn.MLP.random(hidden=4, seed=0))
+        b = Board(); b.setup_initial()
+        batcher = nn.MicroBatcher(ev)
+        t = batcher.submit(b, Board.WHITE)
+        batcher.result(t)
+        for bad in (t, -1, t + 1):
+            with self.assertRaises(KeyError) as ctx:
+                batcher.result(bad)
+            self.assertIn("Ticket ya consumido o desconocido", str(ctx.exception))
+        self.assertEqual(batcher.batches(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from backgammon.core import position_id
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+
+
+class TestPositionIdErrores(unittest.TestCase):
+    def test_largo_incorrecto(self):
+        with self.assertRaises(ValueError):
+            Board.from_position_id("4HPwATDgc/AB")
+
+    def test_base64_invalido(self):
+        with self.assertRaises(ValueError):
+            Board.from_position_id("4HPwATDgc/AB*A")
+
+    def test_sin_separadores(self):
+        with self.assertRaises(ValueError):
+            Board.from_position_id("/" * 14)
+
+    def test_mas_de_15_fichas_al_codificar(self):
+        b = Board()
+        b.set_point(0, 16)
+        with self.assertRaises(ValueError):
+            b.to_position_id()
+
+    def test_color_invalido(self):
+        with self.assertRaises(ValueError):
+            position_id.encode([0] * 24, 0, 0, 0)
+        with self.assertRaises(ValueError):
+            BackgammonGame.from_position_id("4HPwATDgc/ABMA", "red")
+
+    def test_cli_position_id_invalido(self):
+        from backgammon.cli.app import main
+        with self.assertRaises(ValueError):
+            main(["--position-id", "nada"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.pygame_ui import export
+
+
+class TestExportErrores(unittest.TestCase):
+    def test_id_invalido(self):
+        with self.assertRaises(ValueError):
+            export.parse_source("no-es-un-id")
+
+    def test_color_invalido(self):
+        with self.assertRaises(ValueError):
+            export.parse_source("4HPwATDgc/ABMA:rojo")
+
+    def test_linea_invalida_en_archivo_indica_linea(self):
+        with tempfile.TemporaryDirectory() as d:
+            ids = os.path.join(d, "ids.txt")
+            with open(ids, "w", encoding="utf-8") as f:
+                f.write("4HPwATDgc/ABMA\nmalo\n")
+            with self.assertRaisesRegex(ValueError, "línea 2"):
+                export.collect_jobs([ids])
+
+    def test_politica_desconocida(self):
+        with self.assertRaises(ValueError):
+            export.collect_jobs([], selfplay=1, white="nadie")
+
+    def test_sin_trabajos_o_workers_invalidos(self):
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertRaises(ValueError):
+                export.render_jobs([], d)
+            with self.assertRaises(ValueError):
+                export.render_jobs(export.collect_jobs(["4HPwATDgc/ABMA"]), d, workers=0)
+
+    def test_png_con_tamano_inconsistente(self):
+        with self.assertRaises(ValueError):
+            export.encode_png(b"\x00" * 5, 2, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
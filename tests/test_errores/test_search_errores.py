@@ -0,0 +1,35 @@
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.engine import search
+from backgammon.engine.search import Searcher
+from backgammon.sim import new_game
+
+
+class TestSearchErrores(unittest.TestCase):
+    def test_ply_fuera_de_rango(self):
+        g = new_game(Board)
+        for ply in (-1, 3, 1.5):
+            with self.assertRaises(ValueError):
+                Searcher().search(g, ply, roll=(3, 1))
+        with self.assertRaises(ValueError):
+            Searcher().evaluate(g, 3)
+
+    def test_sin_tirada(self):
+        with self.assertRaises(ValueError):
+            Searcher().search(new_game(Board), 1)
+
+    def test_evaluador_invalido(self):
+        with self.assertRaises(ValueError):
+            Searcher(evaluator="pips")
+        with self.assertRaises(ValueError):
+            search.get_evaluator("nada")
+
+    def test_cli_hint_ply_invalido(self):
+        from backgammon.cli.app import main
+        with self.assertRaises(SystemExit):
+            main(["--setup", "--roll", "3,1", "--hint", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import json
+import unittest
+
+from backgammon.server import GameServer
+
+
+class TestServerErrores(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.s = GameServer()
+        await self.s.handle({"cmd": "new", "game": "g"})
+
+    async def _error(self, req):
+        r = await self.s.handle(req)
+        self.assertFalse(r["ok"])
+        return r["error"]
+
+    async def test_comando_y_partida_desconocidos(self):
+        self.assertIn("desconocido", await self._error({"id": 9, "cmd": "volar"}))
+        self.assertIn("desconocida", await self._error({"cmd": "legal_moves", "game": "nada"}))
+        self.assertIn("ya existe", await self._error({"cmd": "new", "game": "g"}))
+
+    async def test_argumentos_invalidos(self):
+        await self._error({"cmd": "start_turn", "game": "g", "roll": [7, 1]})
+        await self._error({"cmd": "apply_move", "game": "g", "origin": 7, "pip": 3})   # sin turno
+        await self.s.handle({"cmd": "start_turn", "game": "g", "roll": [3, 1]})
+        await self._error({"cmd": "apply_move", "game": "g", "origin": "7", "pip": 3})
+        await self._error({"cmd": "apply_move", "game": "g", "origin": 7, "pip": 5})
+        self.assertIn("pips", await self._error({"cmd": "end_turn", "game": "g"}))
+
+    async def test_linea_invalida(self):
+        resp = json.loads(await self.s.handle_line(b"{no es json\n"))
+        self.assertEqual(resp, {"id": None, "ok": False, "error": "JSON inválido"})
+        resp = json.loads(await self.s.handle_line(b"[1, 2]\n"))
+        self.assertFalse(resp["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
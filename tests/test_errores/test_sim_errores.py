@@ -0,0 +1,22 @@
+import unittest
+
+from backgammon import sim
+
+
+class TestSimErrores(unittest.TestCase):
+    def test_politica_desconocida(self):
+        with self.assertRaises(ValueError):
+            sim.simulate(1, white="nada")
+
+    def test_games_no_positivo(self):
+        with self.assertRaises(ValueError):
+            sim.simulate(0)
+
+    def test_cli_simulate_games_no_numerico(self):
+        from backgammon.cli.app import main
+        with self.assertRaises(SystemExit):
+            main(["simulate", "--games", "x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+import unittest
+
+from backgammon.core.store import GameStore
+
+
+class TestGameStoreErrores(unittest.TestCase):
+    def test_limites_invalidos(self):
+        for kwargs in ({"max_entries": 0}, {"max_entries": 1.5}, {"max_bytes": 0}, {"max_bytes": -10}):
+            with self.assertRaises(ValueError):
+                GameStore(**kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
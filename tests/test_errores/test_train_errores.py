@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from backgammon import train
+except ImportError:  # numpy es opcional fuera de CI
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestTrainErrores(unittest.TestCase):
+    def test_parametros_invalidos(self):
+        for kwargs in ({"games": 0}, {"games": 1, "workers": 0}, {"games": 1, "games_per_round": 0},
+                       {"games": 1, "lam": 1.5}, {"games": 1, "epsilon": -0.1}):
+            with self.assertRaises(ValueError):
+                train.train(verbose=False, **kwargs)
+
+    def test_reanudar_sin_checkpoint(self):
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertRaises(ValueError):
+                train.train(1, checkpoint=os.path.join(d, "nada.npz"), resume=True, verbose=False)
+            path = os.path.join(d, "pesos.npz")
+            train.nn.MLP.random(hidden=4, seed=0).save(path)   # sólo pesos, sin optimizador
+            with self.assertRaises(ValueError):
+                train.load_checkpoint(path)
+
+    def test_cli_error_de_argumentos(self):
+        with self.assertRaises(SystemExit):
+            train.main(["--games", "0", "--workers", "1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
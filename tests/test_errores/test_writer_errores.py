@@ -0,0 +1,24 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.pygame_ui.writer import BackgroundWriter
+
+
+class TestWriterErrores(unittest.TestCase):
+    def test_maxsize_invalido(self):
+        for bad in (0, -1, 1.5, None):
+            with self.assertRaises(ValueError):
+                BackgroundWriter(maxsize=bad)
+
+    def test_submit_tras_close(self):
+        w = BackgroundWriter()
+        w.close()
+        w.close()  # idempotente
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertRaises(ValueError):
+                w.submit(os.path.join(d, "x"), bytes, b"x")
+
+
+if __name__ == "__main__":
+    unittest.main()
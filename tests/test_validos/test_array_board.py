@@ -0,0 +1,120 @@
+import random
+import unittest
+
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+
+
+def _estado(b):
+    return (
+        tuple(b.get_point(i) for i in range(24)),
+        b.bar_count(Board.WHITE), b.bar_count(Board.BLACK),
+        b.off_count(Board.WHITE), b.off_count(Board.BLACK),
+        b.pip_count(Board.WHITE), b.pip_count(Board.BLACK),
+        b.outside_home_count(Board.WHITE), b.outside_home_count(Board.BLACK),
+        b.farthest_back(Board.WHITE), b.farthest_back(Board.BLACK),
+    )
+
+
+def _pips_recalculados(b, color):
+    total = 25 * b.bar_count(color)
+    for i in range(24):
+        v = b.get_point(i) * color
+        if v > 0:
+            total += v * (i + 1 if color == Board.WHITE else 24 - i)
+    return total
+
+
+def _nuevo_juego(board):
+    g = BackgammonGame(board)
+    g.add_player("White", "white")
+    g.add_player("Black", "black")
+    g.setup_board()
+    return g
+
+
+class TestArrayBoardValidos(unittest.TestCase):
+    def test_setup_initial_igual_a_board(self):
+        a = ArrayBoard(); a.setup_initial()
+        b = Board(); b.setup_initial()
+        self.assertEqual(_estado(a), _estado(b))
+        self.assertEqual(a.count_total(Board.WHITE), 15)
+        self.assertEqual(a.count_total(Board.BLACK), 15)
+
+    def test_no_tiene_dict(self):
+        a = ArrayBoard()
+        with self.assertRaises(AttributeError):
+            a.otro_atributo = 1
+
+    def test_move_con_hit_manda_a_barra(self):
+        a = ArrayBoard()
+        a.set_point(10, 1)
+        a.set_point(9, -1)
+        self.assertEqual(a.move(9, 1, Board.BLACK), 10)
+        self.assertEqual(a.get_point(10), -1)
+        self.assertEqual(a.bar_count(Board.WHITE), 1)
+        self.assertFalse(a.can_move(7, 1, Board.WHITE))
+        self.assertTrue(a.can_enter(6, Board.WHITE))
+        self.assertEqual(a.enter_from_bar(6, Board.WHITE), 18)
+
+    def test_bear_off_exacto_y_no_exacto(self):
+        a = ArrayBoard()
+        a.set_point(2, 2)
+        self.assertTrue(a.all_in_home(Board.WHITE))
+        self.assertTrue(a.can_bear_off(2, 3, Board.WHITE))
+        self.assertTrue(a.can_bear_off(2, 6, Board.WHITE))
+        self.assertFalse(a.can_bear_off(2, 1, Board.WHITE))
+        a.bear_off(2, 6, Board.WHITE)
+        self.assertEqual(a.off_count(Board.WHITE), 1)
+
+    def test_copy_independiente(self):
+        a = ArrayBoard(); a.setup_initial()
+        c = a.copy()
+        c.move(7, 3, Board.WHITE)
+        self.assertEqual(a.get_point(7), 3)
+        self.assertEqual(c.get_point(7), 2)
+
+    def test_paridad_con_board_en_partidas_aleatorias(self):
+        rnd = random.Random(1234)
+        for _ in range(30):
+            ga = _nuevo_juego(ArrayBoard())
+            gb = _nuevo_juego(Board())
+            for _turno in range(60):
+                roll = (rnd.randint(1, 6), rnd.randint(1, 6))
+                ga.start_turn(roll)
+                gb.start_turn(roll)
+                while True:
+                    ma = ga.legal_moves() + [(o, None, p) for (o, p) in ga.legal_bear_off_moves()]
+                    mb = gb.legal_moves() + [(o, None, p) for (o, p) in gb.legal_bear_off_moves()]
+                    self.assertEqual(ma, mb)
+                    if not ma:
+                        break
+                    o, _, pip = rnd.choice(ma)
+                    self.assertEqual(ga.apply_move(o, pip), gb.apply_move(o, pip))
+                    self.assertEqual(_estado(ga.board()), _estado(gb.board()))
+                    for color in (Board.WHITE, Board.BLACK):
+                        self.assertEqual(ga.board().pip_count(color), _pips_recalculados(gb.board(), color))
+                ga.auto_end_turn()
+                gb.auto_end_turn()
+
+    def test_from_dict_con_array_board(self):
+        g = _nuevo_juego(Board())
+        g.board().set_bar(Board.BLACK, 1)
+        g.board().set_point(0, -1)
+        g2 = BackgammonGame.from_dict(g.to_dict(), ArrayBoard())
+        self.assertIsInstance(g2.board(), ArrayBoard)
+        self.assertEqual(g2.to_dict(), g.to_dict())
+
+    def test_benchmark_compara_los_mismos_movimientos(self):
+        from benchmarks.bench_board import _fast_moves, _games, board_bytes, sample_positions, same_moves
+
+        positions = sample_positions(300, seed=3)
+        self.assertTrue(any(g["white_bar"] or g["black_bar"] for g in positions))
+        self.assertTrue(any(_fast_moves(g)[1] for g in _games(positions, Board)))   # hay bear-offs
+        self.assertTrue(same_moves(positions))
+        self.assertLess(board_bytes(ArrayBoard, 100), board_bytes(Board, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+
+try:
+    import numpy as np
+    from backgammon.core.batch_board import BatchBoard
+except ImportError:  # numpy es opcional fuera de CI
+    np = None
+
+
+def _posiciones(n, seed=3):
+    rnd = random.Random(seed)
+    res = []
+    g = None
+    while len(res) < n:
+        if g is None or g.has_won(Board.WHITE) or g.has_won(Board.BLACK):
+            g = BackgammonGame()
+            g.add_player("White", "white")
+            g.add_player("Black", "black")
+            g.setup_board()
+        g.start_turn((rnd.randint(1, 6), rnd.randint(1, 6)))
+        while True:
+            moves = g.legal_moves() + [(o, None, p) for (o, p) in g.legal_bear_off_moves()]
+            if not moves:
+                break
+            o, _, pip = rnd.choice(moves)
+            g.apply_move(o, pip)
+            res.append(g.board().copy())
+        g.auto_end_turn()
+    return res
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestBatchBoardValidos(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.boards = _posiciones(1500)
+        cls.batch = BatchBoard.from_boards(cls.boards)
+
+    def test_forma_y_tipo(self):
+        self.assertEqual(self.batch.cells().shape, (len(self.boards), 26))
+        self.assertEqual(self.batch.cells().dtype, np.int8)
+
+    def test_roundtrip_boards_y_dicts(self):
+        back = self.batch.to_boards()
+        for a, b in zip(self.boards[:200], back[:200]):
+            self.assertEqual(a.zobrist_hash(), b.zobrist_hash())
+        again = BatchBoard.from_dicts(self.batch.to_dicts())
+        self.assertTrue(np.array_equal(again.cells(), self.batch.cells()))
+
+    def test_contadores_coinciden_con_board(self):
+        for color in (Board.WHITE, Board.BLACK):
+            self.assertEqual(self.batch.count_total(color).tolist(), [b.count_total(color) for b in self.boards])
+            self.assertEqual(self.batch.pip_count(color).tolist(), [b.pip_count(color) for b in self.boards])
+            self.assertEqual(self.batch.off_count(color).tolist(), [b.off_count(color) for b in self.boards])
+            self.assertEqual(self.batch.all_in_home(color).tolist(), [b.all_in_home(color) for b in self.boards])
+            self.assertEqual(self.batch.is_blocked(7, color).tolist(), [b.is_blocked(7, color) for b in self.boards])
+
+    def test_mascaras_de_legalidad_coinciden_con_board(self):
+        for color in (Board.WHITE, Board.BLACK):
+            for pip in range(1, 7):
+                mm = self.batch.move_mask(pip, color)
+                bm = self.batch.bear_off_mask(pip, color)
+                em = self.batch.enter_mask(pip, color)
+                for k, b in enumerate(self.boards):
+                    esperado = [b.can_move(o, pip, color) for o in range(24)]
+                    self.assertEqual(mm[k].tolist(), esperado)
+                    self.assertEqual(bool(em[k]), b.can_enter(pip, color))
+                    off = [b.owner_at(o) == color and b.can_bear_off(o, pip, color) for o in range(24)]
+                    self.assertEqual(bm[k].tolist(), off)
+
+
+if __name__ == "__main__":
+    unittest.main()
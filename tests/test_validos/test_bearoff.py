@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.engine import bearoff
+
+
+class TestBearoffValidos(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "bearoff.db")
+        bearoff.write_database(cls.path, max_checkers=4)
+        cls.db = bearoff.BearoffDatabase(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.tmp.cleanup()
+
+    def test_indice_perfecto_y_prefijo(self):
+        idx = sorted(bearoff.position_index(p) for p in bearoff._positions(15))
+        self.assertEqual(idx, list(range(54264)))
+        self.assertEqual(bearoff.num_positions(), 54264)
+        chicas = sorted(bearoff.position_index(p) for p in bearoff._positions(4))
+        self.assertEqual(chicas, list(range(bearoff.num_positions(4))))
+
+    def test_valores_conocidos(self):
+        self.assertEqual(len(self.db), bearoff.num_positions(4))
+        self.assertEqual(self.db.expected_rolls((0, 0, 0, 0, 0, 0)), 0.0)
+        self.assertEqual(self.db.expected_rolls((1, 0, 0, 0, 0, 0)), 1.0)
+        # una ficha en el 6: falla sólo con 11, 12, 13, 14 y 23 (9/36)
+        self.assertAlmostEqual(self.db.expected_rolls((0, 0, 0, 0, 0, 1)), 1.25, places=5)
+        dist = self.db.distribution((0, 0, 0, 0, 0, 1))
+        self.assertAlmostEqual(dist[1], 27 / 36, places=4)
+        self.assertAlmostEqual(dist[2], 9 / 36, places=4)
+
+    def test_distribucion_suma_uno_y_media_coincide(self):
+        counts = (1, 0, 2, 0, 0, 1)
+        dist = self.db.distribution(counts)
+        self.assertAlmostEqual(sum(dist), 1.0, places=3)
+        media = sum(k * p for k, p in enumerate(dist))
+        self.assertAlmostEqual(media, self.db.expected_rolls(counts), places=3)
+
+    def test_mas_fichas_nunca_es_mejor(self):
+        self.assertLess(self.db.expected_rolls((0, 0, 0, 0, 0, 1)),
+                        self.db.expected_rolls((0, 0, 0, 0, 0, 2)))
+
+    def test_lookup_desde_board_ambos_colores(self):
+        b = Board()
+        b.set_point(0, 1)    # WHITE a 1 pip
+        b.set_point(5, 2)    # WHITE a 6 pips
+        b.set_point(23, -1)  # BLACK a 1 pip
+        b.set_point(18, -2)  # BLACK a 6 pips
+        self.assertEqual(bearoff.home_counts(b, Board.WHITE), (1, 0, 0, 0, 0, 2))
+        self.assertEqual(bearoff.home_counts(b, Board.BLACK), (1, 0, 0, 0, 0, 2))
+        self.assertEqual(self.db.expected_rolls_board(b, Board.WHITE),
+                         self.db.expected_rolls_board(b, Board.BLACK))
+
+
+if __name__ == "__main__":
+    unittest.main()
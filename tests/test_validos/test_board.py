@@ -79,6 +79,38 @@ class TestBoardValidos(unittest.TestCase):
         self.assertGreater(b.get_point(9), 0)
         self.assertEqual(b.bar_count(Board.BLACK), 1)
 
+    def test_board_pip_count_inicial_y_tras_mover(self):
+        b = Board()
+        b.setup_initial()
+        self.assertEqual(b.pip_count(Board.WHITE), 167)
+        self.assertEqual(b.pip_count(Board.BLACK), 167)
+        b.move(12, 3, Board.WHITE)
+        self.assertEqual(b.pip_count(Board.WHITE), 164)
+
+    def test_board_contadores_con_hit_y_barra(self):
+        b = Board()
+        b.setup_initial()
+        b.set_point(9, -1)
+        self.assertEqual(b.pip_count(Board.BLACK), 167 + 15)
+        b.move(12, 3, Board.WHITE)  # golpea: la negra de 9 va a la barra (25 pips)
+        self.assertEqual(b.pip_count(Board.BLACK), 167 + 25)
+        self.assertEqual(b.count_total(Board.BLACK), 15)
+        self.assertEqual(b.outside_home_count(Board.BLACK), 11)
+        self.assertEqual(b.farthest_back(Board.BLACK), -1)
+
+    def test_board_farthest_back_y_all_in_home(self):
+        b = Board()
+        b.set_point(4, 3)
+        b.set_point(2, 2)
+        self.assertTrue(b.all_in_home(Board.WHITE))
+        self.assertEqual(b.farthest_back(Board.WHITE), 4)
+        b.set_point(4, 0)
+        self.assertEqual(b.farthest_back(Board.WHITE), 2)
+        self.assertIsNone(b.farthest_back(Board.BLACK))
+        b.set_point(6, 1)
+        self.assertFalse(b.all_in_home(Board.WHITE))
+        self.assertEqual(b.outside_home_count(Board.WHITE), 1)
+
 def test_bear_off_white_exact_and_inexact():
     from backgammon.core.board import Board
     b = Board()
@@ -102,6 +134,8 @@ def test_bear_off_white_exact_and_inexact():
     # inexacto: desde 1 con pip=6 -> permitido solo si no hay fichas en >1 (dentro de home)
     # aún quedan fichas en 2,3,4 -> NO permitido
     assert not b.can_bear_off(1, 6, Board.WHITE)
+    # exacto desde un punto bajo: permitido aunque haya fichas más alejadas
+    assert b.can_bear_off(1, 2, Board.WHITE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+import unittest
+
+from backgammon import sim
+from backgammon.core.board import Board
+from backgammon.core.cache import LRUCache
+from backgammon.core.game import BackgammonGame
+
+
+class TestLRUCacheValidos(unittest.TestCase):
+    def test_desaloja_la_menos_usada(self):
+        c = LRUCache(2)
+        c.put("a", 1)
+        c.put("b", 2)
+        self.assertEqual(c.get("a"), 1)   # "a" pasa a ser la más reciente
+        c.put("c", 3)
+        self.assertNotIn("b", c)
+        self.assertIn("a", c)
+        self.assertEqual(len(c), 2)
+
+    def test_contadores_y_resize(self):
+        c = LRUCache(4)
+        c.put(1, "x")
+        c.get(1)
+        c.get(2)
+        self.assertEqual((c.hits(), c.misses()), (1, 1))
+        self.assertEqual(c.stats()["hit_rate"], 0.5)
+        for k in range(2, 6):
+            c.put(k, k)
+        c.resize(2)
+        self.assertEqual(len(c), 2)
+        self.assertEqual(c.maxsize(), 2)
+        c.reset_stats()
+        self.assertEqual((c.hits(), c.misses()), (0, 0))
+
+
+class TestCacheDeMovimientosValidos(unittest.TestCase):
+    def test_segunda_consulta_es_hit(self):
+        g = sim.new_game(Board)
+        g.start_turn((3, 1))
+        primera = g.legal_moves()
+        self.assertEqual(g.move_cache().misses(), 1)
+        self.assertEqual(g.legal_moves(), primera)
+        self.assertEqual(g.move_cache().hits(), 1)
+        self.assertEqual(primera, g._compute_legal_moves())
+
+    def test_apply_move_y_set_point_invalidan(self):
+        g = sim.new_game(Board)
+        g.start_turn((3, 1))
+        g.legal_moves()
+        g.apply_move(7, 3)
+        self.assertEqual(g.legal_moves(), g._compute_legal_moves())
+        self.assertEqual(g.move_cache().hits(), 0)
+        g.board().set_point(4, -2)   # bloquea 7->4 / 5->4
+        moves = g.legal_moves()
+        self.assertEqual(moves, g._compute_legal_moves())
+        self.assertNotIn((5, 4, 1), moves)
+        self.assertEqual(g.move_cache().hits(), 0)
+
+    def test_modificar_resultado_no_altera_cache(self):
+        g = sim.new_game(Board)
+        g.start_turn((6, 5))
+        g.legal_plays().clear()
+        self.assertTrue(g.legal_plays())
+
+    def test_cache_compartida_y_color(self):
+        cache = LRUCache(16)
+        g1 = BackgammonGame(move_cache=cache)
+        g1.add_player("White", "white"); g1.add_player("Black", "black"); g1.setup_board()
+        g2 = BackgammonGame(move_cache=cache)
+        g2.add_player("Black", "black"); g2.add_player("White", "white"); g2.setup_board()
+        g1.start_turn((2, 1))
+        g2.start_turn((2, 1))
+        m1 = g1.legal_moves()
+        self.assertNotEqual(m1, g2.legal_moves())   # mismo tablero, otro color
+        g3 = BackgammonGame(move_cache=cache)
+        g3.add_player("White", "white"); g3.add_player("Black", "black"); g3.setup_board()
+        g3.start_turn((1, 2))
+        self.assertEqual(g3.legal_moves(), m1)      # mismos pips en otro orden -> hit
+        self.assertEqual(cache.hits(), 1)
+
+    def test_has_any_move_y_bear_off_cacheados(self):
+        g = sim.new_game(Board)
+        b = g.board()
+        for i in range(24):
+            b.set_point(i, 0)
+        b.set_point(2, 2)
+        b.set_off(Board.WHITE, 13)
+        g.start_turn((6, 6))
+        self.assertTrue(g.has_any_move())
+        self.assertEqual(g.legal_bear_off_moves(), [(2, 6)])
+        self.assertGreaterEqual(g.move_cache().hits(), 1)
+
+    def test_simulate_reporta_cache(self):
+        s = sim.simulate(3, workers=1, seed=2)
+        self.assertGreater(s["cache_misses"], 0)
+        self.assertIn("Caché de jugadas", sim.format_summary(s))
+
+
+if __name__ == "__main__":
+    unittest.main()
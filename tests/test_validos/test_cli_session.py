@@ -0,0 +1,92 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from backgammon.cli.app import main
+from backgammon.cli.session import Session
+from backgammon.core.board import Board
+from backgammon.sim import new_game
+
+
+class TestCLIBatchValidos(unittest.TestCase):
+    def test_batch_desde_archivo_con_misma_salida_que_los_flags(self):
+        with tempfile.TemporaryDirectory() as d:
+            cmds = os.path.join(d, "cmds.txt")
+            save = os.path.join(d, "partida.json")
+            with open(cmds, "w", encoding="utf-8") as f:
+                f.write("# turno de White\nroll 3,4\n--move 7,3\nmove 5,4\n\nend-turn\nlist-moves\nsave " + save + "\n")
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                main(["--setup", "--batch", cmds, "--status"])
+            out = buf.getvalue()
+            self.assertIn("Move: 7->4 (pip 3)", out)
+            self.assertIn("Turno ahora: black", out)
+            self.assertIn("Legal moves:", out)          # tiró los dados solo para Black
+            self.assertIn("Jugador: black", out)
+            data = json.loads(open(save, encoding="utf-8").read())
+            self.assertEqual(data["current_player_index"], 1)
+
+            flags = io.StringIO()
+            with contextlib.redirect_stdout(flags):
+                main(["--setup", "--roll", "3,4", "--move", "7,3", "--move", "5,4", "--end-turn"])
+            self.assertIn(flags.getvalue().split("Resumen tablero:\n", 1)[1].split("Turno ahora")[0],
+                          out.split("Resumen tablero:\n", 1)[1])
+
+    def test_batch_desde_stdin(self):
+        old = sys.stdin
+        sys.stdin = io.StringIO("setup\nroll 6,5\nmove 23,6\nhistory\n")
+        try:
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                main(["--batch", "-"])
+        finally:
+            sys.stdin = old
+        self.assertIn("23->17 (pip 6)", buf.getvalue())
+
+    def test_session_cuenta_comandos_y_cambia_de_partida(self):
+        s = Session(new_game(Board))
+        with contextlib.redirect_stdout(io.StringIO()):
+            n = s.run_lines(["", "# nada", "position-id 4HPwATDgc/ABMA black", "status"])
+        self.assertEqual(n, 2)
+        self.assertEqual(s.game._current_color_int(), -1)
+
+
+class TestCLIServeValidos(unittest.IsolatedAsyncioTestCase):
+    async def test_serve_responde_y_conserva_la_partida_entre_conexiones(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "bg.sock")
+            session = Session(new_game(Board))
+            task = asyncio.ensure_future(session.serve_async(path))
+            for _ in range(100):
+                if os.path.exists(path):
+                    break
+                await asyncio.sleep(0.01)
+
+            async def send(lines):
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write("".join(l + "\n" for l in lines).encode())
+                await writer.drain()
+                writer.write_eof()
+                data = (await reader.read()).decode()
+                writer.close()
+                return data
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                out = await send(["roll 3,1", "move 7,3", "nada"])
+                self.assertIn("Move: 7->4 (pip 3)\nDados: (3, 1)\nPips: (1,)\nok\n", out)
+                self.assertTrue(out.endswith("error: Comando desconocido: nada\n"))
+                out = await send(["move 5,1", "end-turn"])
+                self.assertIn("Turno ahora: black\nok\n", out)
+                self.assertEqual(await send(["shutdown"]), "ok\n")
+                await asyncio.wait_for(task, 5)
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(session.game._current_color_int(), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
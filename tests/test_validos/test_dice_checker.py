@@ -1,5 +1,7 @@
+import random
 import unittest
-from backgammon.core.dice import Dice
+from backgammon.core.dice import ALL_ROLLS, Dice
+from backgammon.core.game import BackgammonGame
 from backgammon.core.checker import Checker
 from backgammon.core.player import Player
 
@@ -11,6 +13,58 @@ class TestDiceCheckerPlayerValidos(unittest.TestCase):
         self.assertIn(b, range(1, 7))
         self.assertIsInstance(dice.is_double(), bool)
 
+    def test_dice_misma_semilla_misma_secuencia(self):
+        a = Dice(seed=7, buffer_size=16)
+        b = Dice(seed=7)
+        seq = [a.roll() for _ in range(50)]   # cruza varios rellenos del buffer
+        self.assertEqual(seq, b.rolls(50))
+        self.assertEqual(b.last_roll(), seq[-1])
+        self.assertNotEqual(seq, Dice(seed=8).rolls(50))
+        self.assertTrue(all(r in ALL_ROLLS for r in seq))
+
+    def test_dice_state_retoma_el_flujo(self):
+        a = Dice(seed=7, buffer_size=16)
+        a.rolls(20); a.roll()
+        b = Dice.from_state(a.state(), buffer_size=64)
+        self.assertEqual(a.state(), {"seed": 7, "drawn": 21})
+        self.assertEqual(b.last_roll(), a.last_roll())
+        self.assertEqual(b.rolls(30), a.rolls(30))
+        self.assertIsNone(Dice().state())
+        self.assertIsNone(Dice(rng=random.Random(3)).state())
+        self.assertIsInstance(Dice.from_state(None), Dice)
+
+    def test_dice_distribucion_uniforme(self):
+        rolls = Dice(seed=1).rolls(36000)
+        for r in ALL_ROLLS:
+            self.assertAlmostEqual(rolls.count(r) / 36000, 1 / 36, delta=0.005)
+
+    def test_dice_con_random_externo_y_spawn(self):
+        d = Dice(rng=random.Random(3))
+        hijos = d.spawn(2)
+        self.assertNotEqual(hijos[0].rolls(20), hijos[1].rolls(20))
+        otros = Dice(rng=random.Random(3)).spawn(2)
+        self.assertEqual(Dice(rng=random.Random(3)).spawn(2)[0].rolls(5), otros[0].rolls(5))
+
+    def test_dice_con_numpy_generator(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy no instalado")
+        a = Dice(rng=np.random.default_rng(5), buffer_size=10).rolls(25)
+        b = Dice(rng=np.random.default_rng(5), buffer_size=10).rolls(25)
+        self.assertEqual(a, b)
+        self.assertTrue(all(r in ALL_ROLLS for r in a))
+        self.assertEqual(len(Dice(rng=np.random.default_rng(5)).spawn(3)), 3)
+
+    def test_game_con_seed_es_reproducible(self):
+        g1 = BackgammonGame(seed=42)
+        g2 = BackgammonGame(seed=42)
+        for g in (g1, g2):
+            g.add_player("White", "white")
+            g.add_player("Black", "black")
+        self.assertEqual([g1.start_turn() for _ in range(10)], [g2.start_turn() for _ in range(10)])
+        self.assertIsInstance(g1.dice(), Dice)
+
     def test_checker_creation(self):
         checker = Checker("black")
         self.assertEqual(checker.__color__, "black")
@@ -236,5 +236,178 @@ class TestGameValidos(unittest.TestCase):
         self.assertGreaterEqual(white_off, 0)
 
 
+class TestLegalPlaysValidos(unittest.TestCase):
+    def _juego(self):
+        g = BackgammonGame()
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        return g
+
+    def _final(self, g, roll, play):
+        h = BackgammonGame.from_dict(g.to_dict())
+        h.start_turn(roll)
+        for (o, pip) in play:
+            h.apply_move(o, pip)
+        return tuple(h.to_dict()["points"]), h.bar_count(Board.BLACK)
+
+    def test_apertura_usa_ambos_dados_y_sin_duplicados(self):
+        g = self._juego(); g.setup_board()
+        plays = g.legal_plays((3, 1))
+        self.assertTrue(plays)
+        self.assertTrue(all(len(p) == 2 for p in plays))
+        finales = [self._final(g, (3, 1), p) for p in plays]
+        self.assertEqual(len(finales), len(set(finales)))
+
+    def test_dobles_deduplica_por_posicion_final(self):
+        g = self._juego(); g.setup_board()
+        plays = g.legal_plays((2, 2))
+        self.assertTrue(all(len(p) == 4 for p in plays))
+        finales = {self._final(g, (2, 2), p) for p in plays}
+        self.assertEqual(len(finales), len(plays))
+
+    def test_debe_usar_ambos_dados_si_es_posible(self):
+        g = self._juego()
+        b = g.board()
+        b.set_point(23, 14); b.set_point(12, 1)
+        b.set_point(17, -2); b.set_point(18, -2); b.set_point(6, -2)
+        self.assertEqual(g.legal_plays((6, 5)), [((12, 5), (7, 6))])
+
+    def test_si_solo_se_juega_un_dado_debe_ser_el_mayor(self):
+        g = self._juego()
+        b = g.board()
+        b.set_point(23, 14); b.set_point(10, 1)
+        b.set_point(17, -2); b.set_point(18, -2)
+        self.assertEqual(g.legal_plays((6, 5)), [((10, 6),)])
+
+    def test_sin_movimientos_devuelve_jugada_vacia(self):
+        g = self._juego()
+        b = g.board()
+        b.set_bar(Board.WHITE, 1)
+        for i in range(18, 24):
+            b.set_point(i, -2)
+        self.assertEqual(g.legal_plays((3, 4)), [()])
+
+    def test_usa_pips_restantes_del_turno(self):
+        g = self._juego(); g.setup_board()
+        g.start_turn((3, 4))
+        g.apply_move(7, 3)
+        plays = g.legal_plays()
+        self.assertTrue(all(len(p) == 1 and p[0][1] == 4 for p in plays))
+
+
+class TestMakeUnmakeValidos(unittest.TestCase):
+    def _juego(self):
+        g = BackgammonGame()
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        g.setup_board()
+        return g
+
+    def _estado(self, g):
+        return (g.to_dict(), g.turn_history(), g.position_key())
+
+    def test_apply_move_sigue_devolviendo_destino(self):
+        g = self._juego()
+        g.start_turn((3, 4))
+        self.assertEqual(g.apply_move(7, 3), 4)
+
+    def test_unmake_restaura_hit_barra_y_pips(self):
+        g = self._juego()
+        g.board().set_point(6, -1)
+        g.start_turn((1, 4))
+        antes = self._estado(g)
+        rec = g.make_move(7, 1)
+        self.assertTrue(rec[5])
+        self.assertEqual(g.bar_count(Board.BLACK), 1)
+        g.unmake(rec)
+        self.assertEqual(self._estado(g), antes)
+
+    def test_unmake_respeta_orden_de_pips(self):
+        g = self._juego()
+        g.start_turn((3, 4))
+        rec = g.make_move(7, 3)
+        self.assertEqual(g.pips(), (4,))
+        g.unmake(rec)
+        self.assertEqual(g.pips(), (3, 4))
+
+    def test_make_unmake_en_partidas_aleatorias(self):
+        import random
+        rnd = random.Random(99)
+        g = self._juego()
+        for _ in range(150):
+            roll = (rnd.randint(1, 6), rnd.randint(1, 6))
+            antes_turno = self._estado(g)
+            g.unmake(g.make_start_turn(roll))
+            self.assertEqual(self._estado(g), antes_turno)
+            g.make_start_turn(roll)
+            while True:
+                moves = g.legal_moves() + [(o, None, p) for (o, p) in g.legal_bear_off_moves()]
+                if not moves:
+                    break
+                o, _, pip = rnd.choice(moves)
+                antes = self._estado(g)
+                rec = g.make_move(o, pip)
+                g.unmake(rec)
+                self.assertEqual(self._estado(g), antes)
+                g.make_move(o, pip)
+            antes_fin = self._estado(g)
+            rec_end = g.make_end_turn(force=True)
+            g.unmake(rec_end)
+            self.assertEqual(self._estado(g), antes_fin)
+            g.make_end_turn(force=True)
+            if g.has_won(Board.WHITE) or g.has_won(Board.BLACK):
+                break
+
+    def test_make_end_turn_sin_force_valida_pips(self):
+        g = self._juego()
+        g.start_turn((3, 4))
+        with self.assertRaises(ValueError):
+            g.make_end_turn()
+
+
+class TestPlaysByRollValidos(unittest.TestCase):
+    def _juego(self):
+        g = BackgammonGame()
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        g.setup_board()
+        return g
+
+    def test_tabla_rolls(self):
+        from backgammon.core.dice import ROLLS
+        self.assertEqual(len(ROLLS), 21)
+        self.assertEqual(sum(1 for (r, _, _) in ROLLS if r[0] != r[1]), 15)
+        self.assertAlmostEqual(sum(p for (_, _, p) in ROLLS), 1.0)
+        self.assertIn(((6, 6), (6, 6, 6, 6), 1 / 36), ROLLS)
+        self.assertIn(((6, 5), (6, 5), 2 / 36), ROLLS)
+        self.assertEqual(len({r for (r, _, _) in ROLLS}), 21)
+
+    def test_coincide_con_legal_plays_y_no_toca_el_turno(self):
+        g = self._juego()
+        g.start_turn((2, 1))
+        g.apply_move(12, 2)
+        g.make_end_turn(force=True)        # BLACK al turno, con un blot blanco en 10
+        res = list(g.plays_by_roll())
+        self.assertEqual(len(res), 21)
+        self.assertIsNone(g.last_roll())
+        self.assertEqual(g.pips(), ())
+        otro = BackgammonGame.from_dict(g.to_dict())
+        for (roll, prob, plays) in res:
+            self.assertEqual(plays, otro.legal_plays(roll))
+
+    def test_con_fichas_en_barra_y_cache_compartida(self):
+        g = self._juego()
+        g.board().set_point(5, 4)
+        g.board().set_bar(Board.WHITE, 1)
+        res = {roll: plays for (roll, _, plays) in g.plays_by_roll()}
+        self.assertTrue(all(p == () or p[0][0] == -1 for p in res[(6, 5)]))
+        hits = g.move_cache().hits()
+        g.start_turn((5, 6))
+        self.assertEqual(sorted(g.legal_plays()), sorted(res[(6, 5)]))
+        g.start_turn((3, 3))
+        self.assertEqual(g.legal_plays(), res[(3, 3)])
+        self.assertEqual(g.move_cache().hits(), hits + 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,166 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from backgammon.cli.app import main
+from backgammon.cli.session import Session
+from backgammon.core.board import Board
+from backgammon.core.journal import Journal, load_game, normalize_state, replay
+from backgammon.sim import new_game
+
+
+def _jugar(g, j):
+    """Un turno de White (3,4), fin de turno y una jugada de Black (6,5)."""
+    g.start_turn((3, 4)); j.started(g)
+    j.moved(g, g.make_move(7, 3))
+    j.moved(g, g.make_move(5, 4))
+    g.make_end_turn(force=True); j.ended(g)
+    g.start_turn((6, 5)); j.started(g)
+    j.moved(g, g.make_move(g.legal_moves()[0][0], g.legal_moves()[0][2]))
+
+
+class TestJournalValidos(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "saves", "last.journal")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ida_y_vuelta_con_historial_del_turno(self):
+        g = new_game(Board)
+        with Journal(self.path) as j:
+            j.checkpoint(g)
+            _jugar(g, j)
+            self.assertEqual(j.records_since_checkpoint(), 6)
+        r = replay(self.path)
+        self.assertEqual(r.to_dict(), g.to_dict())
+        self.assertEqual(r.turn_history(), g.turn_history())
+        # cada registro de movimiento pesa unas decenas de bytes, no el estado entero
+        lines = open(self.path, encoding="utf-8").read().splitlines()
+        self.assertEqual(len(lines), 7)
+        self.assertTrue(all(len(line) < 40 for line in lines[1:]))
+
+    def test_compacta_cada_n_registros(self):
+        g = new_game(Board)
+        with Journal(self.path, checkpoint_every=4) as j:
+            j.checkpoint(g)
+            _jugar(g, j)
+            self.assertEqual(j.records_since_checkpoint(), 2)
+        lines = open(self.path, encoding="utf-8").read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[0])["t"], "ck")
+        self.assertEqual(replay(self.path).to_dict(), g.to_dict())
+
+    def test_sin_archivo_el_primer_registro_crea_checkpoint(self):
+        g = new_game(Board)
+        g.start_turn((3, 4))
+        with Journal(self.path) as j:
+            j.started(g)
+        self.assertEqual(replay(self.path).last_roll(), (3, 4))
+
+    def test_ultima_linea_cortada_se_ignora(self):
+        g = new_game(Board)
+        with Journal(self.path) as j:
+            j.checkpoint(g)
+            g.start_turn((3, 4)); j.started(g)
+            j.moved(g, g.make_move(7, 3))
+        esperado = g.to_dict()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"t":"move","o":5')     # caída a mitad de escritura
+        self.assertEqual(replay(self.path).to_dict(), esperado)
+
+    def test_resume_recorta_la_cola_cortada_y_sigue_agregando(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(["--setup", "--journal", self.path, "--roll", "3,1", "--move", "7,3"])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"t":"mo')            # caída a mitad de escritura
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(["--journal", self.path, "--move", "5,1"])
+            main(["--journal", self.path, "--end-turn"])
+        lines = open(self.path, encoding="utf-8").read().splitlines()
+        self.assertEqual([json.loads(line)["t"] for line in lines], ["ck", "start", "move", "move", "end"])
+        g = replay(self.path)
+        self.assertEqual(g.to_dict()["current_player_index"], 1)
+        self.assertEqual(g.board().count_at(4), 2)
+
+    def test_ultimo_registro_entero_sin_salto_de_linea_se_conserva(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(["--setup", "--journal", self.path, "--roll", "3,1", "--move", "7,3"])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"t":"move","o":5,"p":1}')     # caída justo antes del "\n"
+        self.assertEqual(replay(self.path).board().count_at(4), 2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(["--journal", self.path, "--end-turn"])
+        lines = open(self.path, encoding="utf-8").read().splitlines()
+        self.assertEqual([json.loads(line)["t"] for line in lines], ["ck", "start", "move", "move", "end"])
+        g = replay(self.path)
+        self.assertEqual(g.to_dict()["current_player_index"], 1)
+        self.assertEqual(g.board().count_at(4), 2)
+
+    def test_journal_nuevo_no_pisa_el_archivo_hasta_la_primera_accion(self):
+        g = new_game(Board)
+        with Journal(self.path) as j:
+            j.checkpoint(g)
+            _jugar(g, j)
+        antes = open(self.path, "rb").read()
+        nuevo = new_game(Board)
+        with Journal(self.path) as j:
+            self.assertEqual(open(self.path, "rb").read(), antes)
+            nuevo.start_turn((2, 1)); j.started(nuevo)
+        self.assertEqual(replay(self.path).to_dict(), nuevo.to_dict())
+
+    def test_compactacion_en_el_writer(self):
+        from backgammon.pygame_ui.writer import BackgroundWriter
+
+        w = BackgroundWriter()
+        try:
+            g = new_game(Board)
+            with Journal(self.path, checkpoint_every=2, writer=w) as j:
+                j.checkpoint(g)
+                _jugar(g, j)
+            w.wait()
+            self.assertEqual(replay(self.path).to_dict(), g.to_dict())
+            self.assertEqual([r[0] for r in w.poll()], ["Autoguardado"] * 4)
+        finally:
+            w.close()
+
+    def test_formatos_json_de_estado(self):
+        g = new_game(Board)
+        plano = g.to_dict()
+        viejo = {k: v for k, v in plano.items() if k not in ("points", "current_player_index")}
+        viejo.update(board=plano["points"], current_index=plano["current_player_index"])
+        for nombre, data in (("plano", plano), ("envuelto", {"board": plano}), ("viejo", viejo)):
+            path = os.path.join(self.tmp.name, nombre + ".json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.assertEqual(load_game(path).to_dict(), plano, nombre)
+        self.assertIs(normalize_state(plano), plano)
+
+    def test_cli_journal_retoma_entre_invocaciones(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(["--setup", "--journal", self.path, "--roll", "3,4", "--move", "7,3"])
+            main(["--journal", self.path, "--move", "5,4", "--end-turn"])
+        g = load_game(self.path)
+        self.assertEqual(g.to_dict()["current_player_index"], 1)
+        self.assertEqual(g.board().count_at(4), 1)
+        # la CLI y load_game leen lo mismo
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            main(["--load", self.path, "--status"])
+        self.assertIn("Jugador: black", buf.getvalue())
+
+    def test_session_registra_comandos(self):
+        with Journal(self.path) as j:
+            s = Session(new_game(Board), j)
+            with contextlib.redirect_stdout(io.StringIO()):
+                s.run_lines(["roll 3,4", "move 7,3", "move 5,4", "end-turn"])
+            esperado = s.game.to_dict()
+        self.assertEqual(replay(self.path).to_dict(), esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.sim import new_game
+
+try:
+    import numpy as np
+    from backgammon.engine import nn
+except ImportError:  # numpy es opcional fuera de CI
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestNNValidos(unittest.TestCase):
+    def test_codificacion_posicion_inicial(self):
+        b = new_game(Board).board()
+        x = nn.encode([b, b], [Board.WHITE, Board.BLACK])
+        self.assertEqual(x.shape, (2, nn.NUM_INPUTS))
+        self.assertEqual(x.dtype, np.float32)
+        # 2, 5, 3 y 5 fichas por color: (1+1) + (1+1+1+1) + (1+1+1) + (1+1+1+1)
+        self.assertAlmostEqual(float(x[0, :96].sum()), 13.0)
+        self.assertTrue(np.array_equal(x[0, :96], x[0, 96:192]))   # posición simétrica
+        self.assertEqual(x[0, 192:196].tolist(), [0, 0, 0, 0])
+        self.assertEqual(x[0, 196:].tolist(), [1, 0])
+        self.assertEqual(x[1, 196:].tolist(), [0, 1])
+
+    def test_codificacion_barra_y_retiradas(self):
+        b = Board()
+        b.set_point(0, 2)
+        b.set_bar(Board.WHITE, 1)
+        b.set_off(Board.WHITE, 12)
+        b.set_point(23, -15)
+        x = nn.encode([b], Board.WHITE)[0]
+        self.assertEqual(x[0:4].tolist(), [1, 1, 0, 0])
+        self.assertEqual(x[96:100].tolist(), [1, 1, 1, 6])   # 15 negras en su punto 1
+        self.assertAlmostEqual(float(x[192]), 0.5)
+        self.assertAlmostEqual(float(x[194]), 12 / 15)
+
+    def test_forward_por_lotes_coincide_con_suelto(self):
+        model = nn.MLP.random(hidden=16, seed=1)
+        x = nn.encode([new_game(Board).board()] * 3, Board.WHITE)
+        out = model.forward(x)
+        self.assertEqual(out.shape, (3, nn.NUM_OUTPUTS))
+        self.assertTrue(np.allclose(out[0], model.forward(x[:1])[0]))
+        self.assertTrue((out[:, nn.WIN_GAMMON] <= out[:, nn.WIN]).all())
+        self.assertTrue((out[:, nn.LOSE_BACKGAMMON] <= out[:, nn.LOSE_GAMMON]).all())
+
+    def test_guardar_y_cargar_npz(self):
+        model = nn.MLP.random(hidden=8, seed=2)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "pesos.npz")
+            model.save(path)
+            again = nn.MLP.load(path)
+        self.assertEqual(again.hidden_size(), 8)
+        self.assertTrue(np.array_equal(again.w1, model.w1))
+        self.assertTrue(np.array_equal(again.b2, model.b2))
+
+    def test_evaluador_y_micro_batcher(self):
+        ev = nn.NNEvaluator(nn.MLP.random(hidden=16, seed=3))
+        b = new_game(Board).board()
+        v = ev(b, Board.WHITE)
+        self.assertTrue(-1.0 <= v <= 1.0)
+        self.assertAlmostEqual(ev.evaluate_many([b, b], [Board.WHITE, Board.BLACK])[0], v, places=6)
+        batcher = nn.MicroBatcher(ev, max_batch=4)
+        tickets = [batcher.submit(b, Board.WHITE) for _ in range(6)]
+        self.assertEqual(batcher.batches(), 1)        # se vació solo al llegar a 4
+        self.assertAlmostEqual(batcher.result(tickets[5]), v, places=6)
+        self.assertEqual(batcher.batches(), 2)
+        self.assertAlmostEqual(batcher.result(tickets[0]), v, places=6)
+
+    def test_busqueda_por_lotes_coincide_con_evaluacion_suelta(self):
+        from backgammon.engine.search import Searcher
+        ev = nn.NNEvaluator(nn.MLP.random(hidden=16, seed=4))
+        g = new_game(Board)
+        por_lotes = Searcher(ev).search(g, 1, roll=(3, 1))
+        suelto = Searcher(lambda board, color: ev(board, color)).search(g, 1, roll=(3, 1))
+        self.assertEqual(por_lotes["play"], suelto["play"])
+        self.assertAlmostEqual(por_lotes["value"], suelto["value"], places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import io
+import contextlib
+import random
+import unittest
+
+from backgammon.core import position_id
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+from backgammon import sim
+
+
+def _estado(b):
+    return (
+        tuple(b.get_point(i) for i in range(24)),
+        b.bar_count(Board.WHITE), b.bar_count(Board.BLACK),
+        b.off_count(Board.WHITE), b.off_count(Board.BLACK),
+    )
+
+
+class TestPositionIdValidos(unittest.TestCase):
+    def test_posicion_inicial_coincide_con_gnubg(self):
+        b = Board(); b.setup_initial()
+        self.assertEqual(b.to_position_id(), "4HPwATDgc/ABMA")
+        self.assertEqual(b.to_position_id(Board.BLACK), "4HPwATDgc/ABMA")
+
+    def test_roundtrip_en_partidas_aleatorias(self):
+        rnd = random.Random(9)
+        for n in range(20):
+            g = sim.new_game()
+            for _ in range(rnd.randint(0, 80)):
+                color = g._current_color_int()
+                g.start_turn((rnd.randint(1, 6), rnd.randint(1, 6)))
+                for (o, pip) in rnd.choice(g.legal_plays()):
+                    g.apply_move(o, pip)
+                if g.has_won(color):
+                    break
+                g.make_end_turn(force=True)
+            b = g.board()
+            for color in (Board.WHITE, Board.BLACK):
+                pid = b.to_position_id(color)
+                self.assertEqual(len(pid), 14)
+                b2 = Board.from_position_id(pid, color)
+                self.assertEqual(_estado(b2), _estado(b))
+                self.assertEqual(b2.zobrist_hash(), b.zobrist_hash())
+                a2 = ArrayBoard.from_position_id(pid, color)
+                self.assertEqual(_estado(a2), _estado(b))
+
+    def test_el_id_depende_del_lado_al_turno(self):
+        b = Board()
+        b.set_point(0, 2)
+        b.set_off(Board.WHITE, 13)
+        b.set_off(Board.BLACK, 15)
+        self.assertNotEqual(b.to_position_id(Board.WHITE), b.to_position_id(Board.BLACK))
+
+    def test_game_roundtrip_con_color_al_turno(self):
+        g = BackgammonGame()
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        g.setup_board()
+        g.start_turn((3, 1))
+        g.apply_move(7, 3)
+        g.apply_move(5, 1)
+        g.end_turn()
+        pid = g.to_position_id()
+        g2 = BackgammonGame.from_position_id(pid, "black")
+        self.assertEqual(g2._current_color_int(), Board.BLACK)
+        self.assertEqual(_estado(g2.board()), _estado(g.board()))
+        self.assertEqual(g2.to_position_id(), pid)
+
+    def test_cli_position_id_y_status(self):
+        from backgammon.cli.app import main
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            main(["--position-id", "4HPwATDgc/ABMA", "--turn", "black", "--roll", "6,5", "--move", "0,6", "--status"])
+        out = buf.getvalue()
+        self.assertIn("Move: 0->6 (pip 6)", out)
+        self.assertIn("Jugador: black", out)
+        self.assertIn("Position ID: ", out)
+        self.assertNotIn("Position ID: 4HPwATDgc/ABMA", out)
+
+    def test_decode_devuelve_off_deducido(self):
+        points, wbar, bbar, woff, boff = position_id.decode(position_id.encode([0] * 24, 1, 0))
+        self.assertEqual((wbar, bbar, woff, boff), (1, 0, 14, 15))
+
+
+if __name__ == "__main__":
+    unittest.main()
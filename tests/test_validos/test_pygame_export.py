@@ -0,0 +1,77 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from backgammon.core.game import BackgammonGame
+from backgammon.pygame_ui import export
+
+try:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+except ImportError:  # Pygame es opcional (no se instala en CI)
+    pygame = None
+
+INICIAL = "4HPwATDgc/ABMA"
+
+
+class TestExportValidos(unittest.TestCase):
+    def test_parse_source_con_color(self):
+        self.assertEqual(export.parse_source(INICIAL), (INICIAL, "white"))
+        self.assertEqual(export.parse_source(f"{INICIAL}:black"), (INICIAL, "black"))
+        self.assertEqual(export.parse_source(f"{INICIAL} black"), (INICIAL, "black"))
+
+    def test_collect_jobs_ids_archivo_y_selfplay(self):
+        with tempfile.TemporaryDirectory() as d:
+            ids = os.path.join(d, "ids.txt")
+            with open(ids, "w", encoding="utf-8") as f:
+                f.write(f"# posiciones\n{INICIAL}\n\n{INICIAL} black\n")
+            jobs = export.collect_jobs([INICIAL, ids], selfplay=2, seed=5)
+        self.assertEqual([j[0] for j in jobs], ["id", "id", "id", "game", "game"])
+        self.assertEqual([j[2] for j in jobs[:3]], ["00000.png", "00001.png", "00002.png"])
+        self.assertEqual(jobs[2][1], (INICIAL, "black"))
+        self.assertEqual([j[2] for j in jobs[3:]], ["game-5", "game-6"])
+
+
+@unittest.skipIf(pygame is None, "requiere pygame")
+class TestExportRenderValidos(unittest.TestCase):
+    def test_encode_png_ida_y_vuelta(self):
+        surf = pygame.Surface((7, 3))
+        surf.fill((10, 200, 30))
+        surf.set_at((2, 1), (255, 0, 0))
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "x.png")
+            with open(path, "wb") as f:
+                f.write(export.encode_png(pygame.image.tobytes(surf, "RGB"), 7, 3))
+            back = pygame.image.load(path)
+            self.assertEqual(pygame.image.tobytes(back, "RGB"), pygame.image.tobytes(surf, "RGB"))
+
+    def test_render_ids_partida_guardada_y_selfplay(self):
+        g = BackgammonGame()
+        g.add_player("White", "white")
+        g.add_player("Black", "black")
+        g.setup_board()
+        with tempfile.TemporaryDirectory() as d:
+            saved = os.path.join(d, "partida.json")
+            with open(saved, "w", encoding="utf-8") as f:
+                json.dump({"board": g.to_dict()}, f)   # formato envuelto
+            out = os.path.join(d, "out")
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                from backgammon.pygame_ui.__main__ import main
+                main(["render", INICIAL, f"{INICIAL}:black", saved, "--selfplay", "1", "--out", out])
+            self.assertIn("imágenes/seg", buf.getvalue())
+            frames = os.listdir(os.path.join(out, "game-0"))
+            self.assertTrue(frames)
+            for name in ("00000.png", "00001.png", "00002.png", os.path.join("game-0", "turn-0001.png")):
+                self.assertEqual(pygame.image.load(os.path.join(out, name)).get_size(), (800, 600))
+            with open(os.path.join(out, "index.tsv"), encoding="utf-8") as f:
+                self.assertEqual(len(f.read().splitlines()), 4)
+            s = export.render_jobs(export.collect_jobs([INICIAL]), out)
+            self.assertEqual((s["jobs"], s["images"]), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+try:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+except ImportError:  # Pygame es opcional (no se instala en CI)
+    pygame = None
+
+
+@unittest.skipIf(pygame is None, "requiere pygame")
+class TestPygameIdleValidos(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)   # el juego crea saves/ en el directorio actual
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _guion(self, pasos):
+        """Postea eventos desde otro hilo: [(segundos de espera, evento), ...]."""
+        def run():
+            while pygame.display.get_surface() is None:
+                time.sleep(0.01)
+            for espera, event in pasos:
+                time.sleep(espera)
+                pygame.event.post(event)
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        return t
+
+    def test_sin_eventos_no_se_redibuja(self):
+        from backgammon.pygame_ui import __main__ as ui
+
+        tecla = lambda k: pygame.event.Event(pygame.KEYDOWN, key=k)
+        hilo = self._guion([
+            (0.4, tecla(pygame.K_RETURN)),      # menú quieto y entrar al juego
+            (1.0, pygame.event.Event(pygame.QUIT)),  # juego quieto y volver al menú
+            (0.3, tecla(pygame.K_ESCAPE)),      # salir
+        ])
+        frames = []
+        real_flip, real_update = pygame.display.flip, pygame.display.update
+        with mock.patch.object(pygame.display, "flip", lambda: (frames.append("flip"), real_flip())), \
+                mock.patch.object(pygame.display, "update",
+                                  lambda *a: (frames.append("update"), real_update(*a))):
+            t0 = time.perf_counter()
+            ui.main([])
+            elapsed = time.perf_counter() - t0
+        hilo.join(1)
+        self.assertGreater(elapsed, 1.5)
+        # girando a 60 FPS serían ~100 cuadros; en idle: menú, juego, menú de nuevo
+        self.assertLessEqual(len(frames), 6, frames)
+
+    def test_guardado_y_captura_en_segundo_plano(self):
+        from backgammon.pygame_ui import __main__ as ui
+
+        tecla = lambda k: pygame.event.Event(pygame.KEYDOWN, key=k)
+        hilo = self._guion([
+            (0.1, tecla(pygame.K_RETURN)),
+            (0.2, tecla(pygame.K_g)),
+            (0.1, tecla(pygame.K_s)),
+            (0.1, tecla(pygame.K_f)),
+            (0.2, pygame.event.Event(pygame.QUIT)),
+            (0.1, tecla(pygame.K_ESCAPE)),
+        ])
+        ui.main([])
+        hilo.join(1)
+        from backgammon.core.journal import load_game
+        self.assertIsNone(load_game(os.path.join("saves", "last.json")).last_roll())
+        self.assertEqual(load_game(os.path.join("saves", "last.journal")).last_roll(), (3, 4))
+        snaps = os.listdir("screens")
+        self.assertEqual(len(snaps), 1)
+        self.assertEqual(pygame.image.load(os.path.join("screens", snaps[0])).get_size(), (800, 600))
+        self.assertFalse([n for n in os.listdir("saves") if n.endswith(".tmp")])
+
+    def test_partida_nueva_no_pisa_el_autoguardado_y_continuar_lo_retoma(self):
+        from backgammon.pygame_ui import __main__ as ui
+        from backgammon.core.journal import Journal, load_game
+        from backgammon.pygame_ui.render import W, H
+        from backgammon.sim import new_game
+
+        g = new_game()
+        path = os.path.join("saves", "last.journal")
+        with Journal(path) as j:
+            g.start_turn((3, 4)); j.started(g)
+            j.moved(g, g.make_move(7, 3))
+        antes = open(path, "rb").read()
+
+        tecla = lambda k: pygame.event.Event(pygame.KEYDOWN, key=k)
+        click = lambda pos: pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+        hilo = self._guion([
+            (0.1, tecla(pygame.K_RETURN)),            # partida nueva sin jugar
+            (0.2, pygame.event.Event(pygame.QUIT)),
+            (0.1, click((W // 2, H // 2 + 44))),      # "Continuar autoguardado"
+            (0.2, tecla(pygame.K_f)),                 # tirada sobre la partida retomada
+            (0.1, pygame.event.Event(pygame.QUIT)),
+            (0.1, tecla(pygame.K_ESCAPE)),
+        ])
+        ui.main([])
+        hilo.join(1)
+        despues = open(path, "rb").read()
+        self.assertEqual(despues, antes + b'{"t":"start","roll":[3,4]}\n')
+        g.start_turn((3, 4))
+        self.assertEqual(load_game(path).to_dict(), g.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
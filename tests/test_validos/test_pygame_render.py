@@ -0,0 +1,81 @@
+import os
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.sim import new_game
+
+try:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+except ImportError:  # Pygame es opcional (no se instala en CI)
+    pygame = None
+
+
+@unittest.skipIf(pygame is None, "requiere pygame")
+class TestBoardRendererValidos(unittest.TestCase):
+    def setUp(self):
+        from backgammon.pygame_ui import render
+        pygame.init()
+        self.render = render
+        self.screen = pygame.display.set_mode((render.W, render.H))
+        fonts = (pygame.font.SysFont(None, 32), pygame.font.SysFont(None, 20), pygame.font.SysFont(None, 14))
+        self.fonts = fonts
+        self.rend = render.BoardRenderer(*fonts)
+        self.game = new_game(Board)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _escena(self, **kw):
+        kw.setdefault("status", self.render.status_lines(self.game))
+        return kw
+
+    def _igual_a_completo(self, **kw):
+        """El cuadro incremental debe coincidir píxel a píxel con uno dibujado entero."""
+        ref = pygame.Surface(self.screen.get_size())
+        self.render.BoardRenderer(*self.fonts).draw(ref, self.game.board(), full=True, **self._escena(**kw))
+        self.assertEqual(pygame.image.tobytes(self.screen, "RGB"), pygame.image.tobytes(ref, "RGB"))
+
+    def test_sin_cambios_no_hay_rectangulos(self):
+        board = self.game.board()
+        first = self.rend.draw(self.screen, board, full=True, **self._escena())
+        self.assertEqual(first, [self.screen.get_rect()])
+        self.assertEqual(self.rend.draw(self.screen, board, **self._escena()), [])
+
+    def test_hover_redibuja_solo_dos_columnas(self):
+        board = self.game.board()
+        self.rend.draw(self.screen, board, hover=3, full=True, **self._escena())
+        rects = self.rend.draw(self.screen, board, hover=15, **self._escena())
+        lay = self.rend.layout()
+        self.assertEqual(rects, [lay.column_rect(3), lay.column_rect(15)])
+        self._igual_a_completo(hover=15)
+
+    def test_incremental_igual_a_completo(self):
+        board = self.game.board()
+        self.rend.draw(self.screen, board, full=True, **self._escena())
+        self.game.start_turn((3, 1))
+        legal = [(d, pip) for (o, d, pip) in self.game.legal_moves() if o == 7]
+        self.rend.draw(self.screen, board, origin=7, legal=legal, **self._escena(readout="60 FPS | 1.0 ms"))
+        self._igual_a_completo(origin=7, legal=legal, readout="60 FPS | 1.0 ms")
+
+        self.game.make_move(7, 3)
+        trails = [(7, 4, self.render.LAST_MOVE_CLR, 4)]
+        rects = self.rend.draw(self.screen, board, trails=trails, moves=["7->4 (pip 3)"], **self._escena())
+        self.assertIn(self.rend.layout().board_area(), rects)
+        self._igual_a_completo(trails=trails, moves=["7->4 (pip 3)"])
+
+        # mover otra ficha con la línea ya dibujada: sólo cambian dos columnas + filas del panel
+        self.game.make_move(5, 1)
+        rects = self.rend.draw(self.screen, board, trails=trails, moves=["7->4 (pip 3)"], **self._escena())
+        self.assertLess(self.rend.dirty_area, self.screen.get_width() * self.screen.get_height() // 4)
+        self.assertTrue(rects)
+        self._igual_a_completo(trails=trails, moves=["7->4 (pip 3)"])
+
+    def test_textos_y_fondo_cacheados(self):
+        self.assertIs(self.rend.glyph("Listo"), self.rend.glyph("Listo"))
+        self.assertIs(self.rend.background((800, 600)), self.rend.background((800, 600)))
+        self.assertIsNot(self.rend.background((800, 600)), self.rend.background((1024, 768)))
+
+
+if __name__ == "__main__":
+    unittest.main()
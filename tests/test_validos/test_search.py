@@ -0,0 +1,128 @@
+import contextlib
+import io
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.core.dice import ROLLS
+from backgammon.core.game import BackgammonGame
+from backgammon.engine import search
+from backgammon.engine.search import Searcher, pip_evaluator
+
+
+def _juego(points, white_off, black_off):
+    g = BackgammonGame()
+    g.add_player("White", "white")
+    g.add_player("Black", "black")
+    b = g.board()
+    for i, v in points.items():
+        b.set_point(i, v)
+    b.set_off(Board.WHITE, white_off)
+    b.set_off(Board.BLACK, black_off)
+    return g
+
+
+def _azar_sin_poda(view, color, depth):
+    """Expectiminimax de referencia: sin poda ni tabla de transposición."""
+    board = view.board()
+    total = 0.0
+    for (roll, _pips, prob) in ROLLS:
+        best = None
+        for play in view.legal_plays(roll):
+            undos = search._apply_play(board, color, play)
+            if board.off_count(color) >= 15:
+                v = search.EVAL_MAX
+            elif depth == 1:
+                v = pip_evaluator(board, color)
+            else:
+                view.next_turn()
+                v = -_azar_sin_poda(view, -color, depth - 1)
+                view.next_turn()
+            search._undo_play(board, undos)
+            best = v if best is None else max(best, v)
+        total += prob * best
+    return total
+
+
+def _raiz_sin_poda(game, roll, ply):
+    color = game._current_color_int()
+    board = game.board()
+    view = BackgammonGame(board)
+    view.add_player("White", "white")
+    view.add_player("Black", "black")
+    best = None
+    for play in game.legal_plays(roll):
+        undos = search._apply_play(board, color, play)
+        view.next_turn()
+        v = -_azar_sin_poda(view, -color, ply) if ply else pip_evaluator(board, color)
+        view.next_turn()
+        search._undo_play(board, undos)
+        if best is None or v > best:
+            best = v
+    return best
+
+
+POS = {0: 2, 3: 1, 5: 2, 14: 1, 20: -2, 22: -1, 10: -1}
+
+
+class TestSearchValidos(unittest.TestCase):
+    def test_evaluate_igual_a_referencia(self):
+        g = _juego(POS, 11, 11)
+        for ply in (1, 2):
+            self.assertAlmostEqual(Searcher().evaluate(g, ply), _azar_sin_poda(g, Board.WHITE, ply), places=9)
+
+    def test_search_igual_a_referencia_y_restaura_tablero(self):
+        g = _juego(POS, 11, 11)
+        antes = g.to_dict()
+        for ply in (0, 1, 2):
+            res = Searcher().search(g, ply, roll=(4, 2))
+            self.assertAlmostEqual(res["value"], _raiz_sin_poda(g, (4, 2), ply), places=9)
+            self.assertIn(res["play"], g.legal_plays((4, 2)))
+        self.assertEqual(g.to_dict(), antes)
+
+    def test_reporta_estadisticas_por_ply(self):
+        g = _juego(POS, 11, 11)
+        g.start_turn((6, 3))
+        s = Searcher()
+        res = s.search(g, 2)
+        self.assertEqual([p["ply"] for p in res["per_ply"]], [0, 1, 2])
+        for p in res["per_ply"]:
+            self.assertGreater(p["nodes"], 0)
+            self.assertGreaterEqual(p["elapsed"], 0.0)
+        self.assertEqual(res["nodes"], sum(p["nodes"] for p in res["per_ply"]))
+        # la tabla de transposición persiste entre llamadas
+        otra = s.search(g, 2)
+        self.assertGreater(otra["tt_hits"], 0)
+        self.assertLess(otra["nodes"], res["nodes"])
+        self.assertEqual(otra["play"], res["play"])
+
+    def test_time_limit_corta_la_profundizacion(self):
+        g = _juego(POS, 11, 11)
+        res = Searcher().search(g, 2, roll=(5, 5), time_limit=0.0)
+        self.assertEqual(res["ply"], 0)
+        self.assertEqual(len(res["per_ply"]), 1)
+
+    def test_gana_si_puede_retirar_todo(self):
+        g = _juego({0: 1, 4: 1, 23: -3}, 13, 12)
+        res = Searcher().search(g, 1, roll=(5, 1))
+        self.assertEqual(res["value"], search.EVAL_MAX)
+        self.assertEqual(sorted(res["play"]), [(0, 1), (4, 5)])
+
+    def test_negras_y_sin_movimientos(self):
+        g = _juego({0: 2, 1: 2, 2: 2, 3: 2, 4: 2, 5: 2}, 3, 13)
+        g.board().set_bar(Board.BLACK, 2)   # tablero cerrado: BLACK no puede entrar
+        g.next_turn()
+        res = Searcher().search(g, 1, roll=(6, 6))
+        self.assertEqual(res["play"], ())
+
+    def test_cli_hint(self):
+        from backgammon.cli.app import main
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            main(["--setup", "--roll", "3,1", "--hint", "0"])
+        out = buf.getvalue()
+        self.assertIn("Sugerencia (0-ply):", out)
+        self.assertIn("ply 0: nodos", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from backgammon.server import GameServer
+
+
+class TestServerValidos(unittest.IsolatedAsyncioTestCase):
+    async def test_partida_completa_de_un_turno(self):
+        s = GameServer()
+        r = await s.handle({"id": 1, "cmd": "new", "seed": 3})
+        self.assertEqual(r["id"], 1)
+        gid = r["result"]["game"]
+        self.assertEqual(r["result"]["current"], "white")
+        r = await s.handle({"cmd": "start_turn", "game": gid, "roll": [3, 1]})
+        self.assertEqual(r["result"], {"roll": [3, 1], "pips": [3, 1]})
+        moves = (await s.handle({"cmd": "legal_moves", "game": gid}))["result"]["moves"]
+        self.assertIn([7, 4, 3], moves)
+        r = await s.handle({"cmd": "apply_move", "game": gid, "origin": 7, "pip": 3})
+        self.assertEqual(r["result"], {"dest": 4, "pips": [1], "winner": None})
+        await s.handle({"cmd": "apply_move", "game": gid, "origin": 5, "pip": 1})
+        r = await s.handle({"cmd": "end_turn", "game": gid})
+        self.assertEqual(r["result"]["current"], "black")
+        state = (await s.handle({"cmd": "to_dict", "game": gid}))["result"]
+        self.assertEqual(state["points"][4], 2)
+        self.assertEqual(state["current_player_index"], 1)
+        self.assertEqual((await s.handle({"cmd": "close", "game": gid}))["result"], {"closed": gid})
+        self.assertEqual(s.games(), 0)
+
+    async def test_partidas_independientes_y_semilla(self):
+        s = GameServer()
+        a = (await s.handle({"cmd": "new", "game": "a", "seed": 5}))["result"]["game"]
+        b = (await s.handle({"cmd": "new", "game": "b", "seed": 5}))["result"]["game"]
+        ra = await s.handle({"cmd": "start_turn", "game": a})
+        rb = await s.handle({"cmd": "start_turn", "game": b})
+        self.assertEqual(ra["result"], rb["result"])
+        self.assertEqual(s.stats()["games"], 2)
+
+    async def test_partidas_inactivas_se_desalojan_y_vuelven(self):
+        s = GameServer(max_games=2)
+        for gid in ("a", "b", "c"):
+            await s.handle({"cmd": "new", "game": gid})
+        await s.handle({"cmd": "start_turn", "game": "a", "roll": [3, 1]})   # vuelve desde la base
+        st = s.stats()["store"]
+        self.assertEqual((st["hot"], st["cold"], st["rehydrations"]), (2, 1, 1))
+        self.assertEqual(s.games(), 3)
+        r = await s.handle({"cmd": "apply_move", "game": "a", "origin": 7, "pip": 3})
+        self.assertTrue(r["ok"])
+
+    async def test_semilla_respetada_aunque_se_desaloje(self):
+        async def tiradas(max_games):
+            s = GameServer(max_games=max_games)
+            await s.handle({"cmd": "new", "game": "a", "seed": 7})
+            res = []
+            for i in range(2):
+                res.append((await s.handle({"cmd": "start_turn", "game": "a"}))["result"]["roll"])
+                await s.handle({"cmd": "new", "game": f"x{i}"})    # con max_games=1 desaloja "a"
+            return res
+
+        self.assertEqual(await tiradas(1), await tiradas(10))
+
+    async def test_pedidos_concurrentes_con_desalojo_entre_medio(self):
+        s = GameServer(max_games=1)
+        await s.handle({"cmd": "new", "game": "a"})
+        rs = await asyncio.gather(
+            s.handle({"cmd": "start_turn", "game": "a", "roll": [3, 1]}),
+            s.handle({"cmd": "new", "game": "x"}),                          # desaloja "a"
+            s.handle({"cmd": "apply_move", "game": "a", "origin": 7, "pip": 3}),
+            s.handle({"cmd": "to_dict", "game": "x"}),                      # desaloja "a" otra vez
+            s.handle({"cmd": "apply_move", "game": "a", "origin": 5, "pip": 1}),
+            s.handle({"cmd": "end_turn", "game": "a"}),
+            s.handle({"cmd": "close", "game": "x"}),
+        )
+        self.assertTrue(all(r["ok"] for r in rs), rs)
+        state = (await s.handle({"cmd": "to_dict", "game": "a"}))["result"]
+        self.assertEqual((state["points"][4], state["current_player_index"]), (2, 1))
+        self.assertEqual(s.games(), 1)
+
+    async def test_por_socket_unix_con_pedidos_encadenados(self):
+        s = GameServer()
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "srv.sock")
+            server = await s.serve(path=path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(path)
+                reqs = [{"id": 1, "cmd": "new", "game": "x"},
+                        {"id": 2, "cmd": "start_turn", "game": "x", "roll": [6, 5]},
+                        {"id": 3, "cmd": "legal_moves", "game": "x"},
+                        {"id": 4, "cmd": "stats"}]
+                writer.write("".join(json.dumps(r) + "\n" for r in reqs).encode())
+                resps = [json.loads(await reader.readline()) for _ in reqs]
+                writer.close()
+                await writer.wait_closed()
+        self.assertEqual([r["id"] for r in resps], [1, 2, 3, 4])
+        self.assertTrue(all(r["ok"] for r in resps))
+        self.assertEqual(resps[3]["result"]["connections"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import contextlib
+import io
+import unittest
+
+from backgammon import sim
+from backgammon.core.board import Board
+
+
+class TestSimValidos(unittest.TestCase):
+    def test_play_game_termina_y_es_reproducible(self):
+        a = sim.play_game("random", "random", seed=5)
+        b = sim.play_game("random", "random", seed=5)
+        self.assertEqual(a, b)
+        self.assertIn(a["winner"], (Board.WHITE, Board.BLACK))
+        self.assertIn(a["points"], (1, 2, 3))
+        self.assertGreater(a["moves"], 0)
+
+    def test_greedy_le_gana_a_random(self):
+        s = sim.simulate(6, workers=1, seed=11, white="greedy", black="random")
+        self.assertGreaterEqual(s["white_wins"], 0.5)
+
+    def test_resultado_no_depende_de_workers(self):
+        s1 = sim.simulate(4, workers=1, seed=3)
+        s2 = sim.simulate(4, workers=2, seed=3)
+        for k in ("moves", "white_wins", "gammons", "backgammons"):
+            self.assertEqual(s1[k], s2[k])
+
+    def test_game_points_gammon_y_backgammon(self):
+        g = sim.new_game(Board)
+        b = g.board()
+        for i in range(24):
+            b.set_point(i, 0)
+        b.set_off(Board.WHITE, 15)
+        b.set_point(10, -15)
+        self.assertEqual(sim.game_points(b, Board.WHITE), 2)
+        b.set_point(10, -14)
+        b.set_point(3, -1)
+        self.assertEqual(sim.game_points(b, Board.WHITE), 3)
+
+    def test_cli_simulate(self):
+        from backgammon.cli.app import main
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            main(["simulate", "--games", "2", "--seed", "1"])
+        out = buf.getvalue()
+        self.assertIn("Partidas: 2", out)
+        self.assertIn("Partidas/seg", out)
+        self.assertIn("Gammons", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
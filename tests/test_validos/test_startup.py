@@ -0,0 +1,30 @@
+import os
+import unittest
+
+from benchmarks.bench_startup import cold_start_ms, import_times, loaded_heavy
+
+# presupuesto de arranque en frío de la CLI (ms); holgado para máquinas lentas de CI
+STARTUP_BUDGET_MS = float(os.environ.get("BACKGAMMON_STARTUP_BUDGET_MS", "150"))
+
+
+class TestStartupValidos(unittest.TestCase):
+    def test_cli_dentro_del_presupuesto(self):
+        ms = cold_start_ms("backgammon.cli.app", runs=3)
+        self.assertLess(ms, STARTUP_BUDGET_MS,
+                        f"import de backgammon.cli.app tardó {ms:.1f} ms (presupuesto {STARTUP_BUDGET_MS:.0f} ms)")
+
+    def test_modulos_livianos_no_cargan_dependencias_pesadas(self):
+        for module in ("backgammon.cli.app", "backgammon.core.game", "backgammon.engine.search",
+                       "backgammon.sim", "backgammon.pygame_ui.__main__"):
+            with self.subTest(module=module):
+                self.assertEqual(loaded_heavy(module), [])
+
+    def test_importtime_reporta_el_modulo(self):
+        times = import_times("backgammon.core.board")
+        self_us, cum_us = times["backgammon.core.board"]
+        self.assertGreaterEqual(cum_us, self_us)
+        self.assertGreater(cum_us, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+
+from backgammon.core.dice import Dice
+from backgammon.core.game import BackgammonGame
+from backgammon.core.store import GameStore, estimate_bytes
+
+
+def _juego(roll=None):
+    g = BackgammonGame(dice=Dice(buffer_size=16))
+    g.add_player("White", "white")
+    g.add_player("Black", "black")
+    g.setup_board()
+    if roll is not None:
+        g.start_turn(roll)
+    return g
+
+
+class TestGameStoreValidos(unittest.TestCase):
+    def test_desalojo_lru_y_rehidratacion(self):
+        s = GameStore(max_entries=2)
+        a = _juego((3, 1))
+        a.apply_move(7, 3)
+        s.put("a", a)
+        s.put("b", _juego())
+        self.assertIs(s.get("a"), a)          # "a" pasa a ser la más reciente
+        s.put("c", _juego())                  # desaloja "b"
+        self.assertEqual((s.hot(), s.cold(), len(s)), (2, 1, 3))
+        s.put("d", _juego())                  # desaloja "a"
+        back = s.get("a")
+        self.assertIsNot(back, a)
+        self.assertEqual(back.to_dict(), a.to_dict())   # pips pendientes incluidos
+        self.assertEqual(s.stats()["evictions"], 3)     # "b", "a" y luego "c" al volver "a"
+        self.assertEqual(s.stats()["rehydrations"], 1)
+        self.assertEqual(s.stats()["hits"], 1)
+        self.assertIsNone(s.get("nada"))
+        self.assertEqual(s.stats()["misses"], 1)
+
+    def test_limite_de_memoria(self):
+        g = _juego()
+        s = GameStore(max_bytes=3 * estimate_bytes(g))
+        for i in range(5):
+            s.put(str(i), _juego())
+        self.assertEqual(s.hot(), 3)
+        self.assertLessEqual(s.memory_bytes(), 3 * estimate_bytes(g))
+
+    def test_estimacion_contra_tracemalloc(self):
+        import gc
+        import random
+        import tracemalloc
+
+        from backgammon.core.board import Board
+        from backgammon.sim import new_game
+
+        rnd = random.Random(30)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            g = new_game(Board)                 # caché de movimientos propia
+            for _ in range(30):
+                g.start_turn()
+                for _ in range(4):
+                    moves = g.legal_moves() + [(o, None, p) for (o, p) in g.legal_bear_off_moves()]
+                    g.has_any_move()
+                    if not moves:
+                        break
+                    o, _, pip = rnd.choice(moves)
+                    g.apply_move(o, pip)
+                g.auto_end_turn() or g.make_end_turn(force=True)
+                if g.has_won(Board.WHITE) or g.has_won(Board.BLACK):
+                    break
+            gc.collect()                        # sólo lo que la partida retiene
+            medido = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(len(g.move_cache()), 100)
+        self.assertAlmostEqual(estimate_bytes(g) / medido, 1, delta=0.3)
+
+    def test_rehidratadas_usan_la_cache_compartida(self):
+        s = GameStore(max_entries=1)
+        a = _juego((3, 1))
+        a.legal_moves()
+        s.put("a", a)
+        self.assertEqual(s.memory_bytes(), estimate_bytes(a))   # caché propia: cuenta sus entradas
+        self.assertGreater(estimate_bytes(a), estimate_bytes(a, a.move_cache()))
+        s.put("b", _juego())
+        back = s.get("a")
+        self.assertIs(back.move_cache(), s.move_cache())
+        self.assertEqual(s.memory_bytes(), estimate_bytes(back, s.move_cache()))
+
+    def test_get_vuelve_a_estimar(self):
+        s = GameStore()
+        g = _juego((3, 1))
+        s.put("a", g)
+        antes = s.memory_bytes()
+        g.legal_moves()
+        g.apply_move(7, 3)
+        self.assertIs(s.get("a"), g)
+        self.assertGreater(s.memory_bytes(), antes)
+        self.assertEqual(s.memory_bytes(), estimate_bytes(g))
+
+    def test_borrar_y_reemplazar(self):
+        s = GameStore(max_entries=1)
+        s.put("a", _juego())
+        s.put("b", _juego())
+        self.assertIn("a", s)
+        self.assertTrue(s.delete("a"))        # estaba en disco
+        self.assertFalse(s.delete("a"))
+        s.put("b", _juego((6, 5)))
+        self.assertEqual(s.get("b").pips(), (6, 5))
+        self.assertEqual(len(s), 1)
+
+    def test_persistencia_en_archivo(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "games.db")
+            with GameStore(path, max_entries=1) as s:
+                s.put("a", _juego((3, 1)))
+                s.put("b", _juego((6, 5)))
+            with GameStore(path) as s:
+                self.assertEqual(len(s), 2)
+                self.assertEqual(s.get("b").last_roll(), (6, 5))
+
+    def test_desalojos_confirmados_sin_close(self):
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "games.db")
+            s = GameStore(path, max_entries=1)
+            s.put("a", _juego((3, 1)))
+            s.put("b", _juego())                # desaloja "a"
+            # otra conexión (como un proceso nuevo tras un kill) ya la ve
+            with sqlite3.connect(path) as db:
+                self.assertEqual(db.execute("SELECT id FROM games").fetchall(), [("a",)])
+            s.close()
+
+    def test_partida_con_semilla_sigue_su_secuencia_tras_desalojo(self):
+        def jugar(max_entries):
+            s = GameStore(max_entries=max_entries)
+            g = BackgammonGame(seed=7)
+            s.put("a", g)
+            rolls = []
+            for i in range(3):
+                rolls.append(s.get("a").start_turn())
+                s.put(f"x{i}", _juego())        # con max_entries=1 desaloja "a"
+            return rolls, s.stats()["rehydrations"]
+
+        seguidas, sin_desalojo = jugar(10)
+        desalojadas, rehidratadas = jugar(1)
+        self.assertEqual((sin_desalojo, rehidratadas), (0, 2))
+        self.assertEqual(desalojadas, seguidas)
+        self.assertEqual(seguidas, Dice(seed=7).rolls(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from backgammon.core import tables
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+from backgammon import sim
+
+
+class TestTablasValidos(unittest.TestCase):
+    def test_dest_coincide_con_la_aritmetica(self):
+        for color in (Board.WHITE, Board.BLACK):
+            for origin in range(24):
+                for pip in range(1, tables.MAX_PIP + 1):
+                    d = origin - pip * color
+                    esperado = d if 0 <= d < 24 else tables.OFF
+                    self.assertEqual(tables.DEST[color][origin][pip], esperado)
+        self.assertIs(tables.dest(0, 30, Board.BLACK), tables.OFF)
+
+    def test_entry_y_distancias(self):
+        self.assertEqual(tables.ENTRY[Board.WHITE][1], 23)
+        self.assertEqual(tables.ENTRY[Board.WHITE][6], 18)
+        self.assertEqual(tables.ENTRY[Board.BLACK][1], 0)
+        self.assertEqual(tables.ENTRY[Board.BLACK][6], 5)
+        self.assertIs(tables.entry(25, Board.WHITE), tables.OFF)
+        self.assertEqual(tables.BEAR_DIST[Board.WHITE][0], 1)
+        self.assertEqual(tables.BEAR_DIST[Board.BLACK][18], 6)
+
+    def test_bear_off_steps_igual_a_can_bear_off(self):
+        rnd = random.Random(21)
+        for board_cls in (Board, ArrayBoard):
+            for _ in range(200):
+                b = board_cls()
+                color = rnd.choice((Board.WHITE, Board.BLACK))
+                home = list(b.home_indices(color))
+                for _k in range(rnd.randint(1, 8)):
+                    i = rnd.choice(home + [12])
+                    b.set_point(i, b.get_point(i) + color)
+                pips = sorted(set(rnd.sample(range(1, 7), 2)))
+                esperado = [(o, None, pip) for o in home for pip in pips
+                            if b.get_point(o) * color > 0 and b.can_bear_off(o, pip, color)]
+                self.assertEqual(b._bear_off_steps(color, pips), esperado)
+
+    def test_legal_bear_off_moves_en_partidas(self):
+        # paridad entre el camino rápido y el genérico en finales reales
+        rnd = random.Random(4)
+        for _ in range(3):
+            g = sim.new_game(Board)
+            for _turno in range(400):
+                color = g._current_color_int()
+                g.start_turn((rnd.randint(1, 6), rnd.randint(1, 6)))
+                b = g.board()
+                pips = sorted(set(g.pips()))
+                genericos = []
+                if b.bar_count(color) == 0 and b.all_in_home(color):
+                    genericos = [(o, p) for o in b.home_indices(color) for p in pips
+                                 if b.get_point(o) * color > 0 and b.can_bear_off(o, p, color)]
+                self.assertEqual(g.legal_bear_off_moves(), genericos)
+                for (o, pip) in rnd.choice(g.legal_plays()):
+                    g.apply_move(o, pip)
+                if g.has_won(color):
+                    break
+                g.make_end_turn(force=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
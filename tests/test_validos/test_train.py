@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from backgammon import train
+    from backgammon.engine import nn
+except ImportError:  # numpy es opcional fuera de CI
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy no instalado")
+class TestTrainValidos(unittest.TestCase):
+    def test_gradientes_coinciden_con_diferencias_finitas(self):
+        model = nn.MLP.random(hidden=4, seed=0, scale=0.5)
+        rng = np.random.default_rng(1)
+        x = rng.random((3, nn.NUM_INPUTS)).astype(np.float32)
+        y = rng.random((3, nn.NUM_OUTPUTS)).astype(np.float32)
+        grads, _ = train.gradients(model, x, y)
+        for name, idx in (("w2", (1, 2)), ("b2", (0,)), ("w1", (5, 3)), ("b1", (2,))):
+            param = getattr(model, name)
+            old = param[idx]
+            param[idx] = old + 1e-2
+            up = train.gradients(model, x, y)[1]
+            param[idx] = old - 1e-2
+            down = train.gradients(model, x, y)[1]
+            param[idx] = old
+            self.assertAlmostEqual(float(grads[name][idx]), (up - down) / 2e-2, places=3)
+
+    def test_retornos_lambda(self):
+        model = nn.MLP.random(hidden=4, seed=0)
+        rows = np.zeros((3, 26), dtype=np.int8)
+        to_move = np.array([1, -1, 1], dtype=np.int8)
+        x, y = train.lambda_targets(model, rows, to_move, points=2, lam=1.0)
+        self.assertEqual(x.shape, (2, nn.NUM_INPUTS))
+        # con λ = 1 el objetivo es el resultado final visto por quien mueve
+        self.assertEqual(y[1].tolist(), [1, 1, 0, 0, 0])   # ganó el que movió último, gammon
+        self.assertEqual(y[0].tolist(), [0, 0, 0, 1, 0])
+
+    def test_entrenar_guardar_y_reanudar(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "td.npz")
+            log = os.path.join(d, "log.jsonl")
+            res = train.train(4, checkpoint=path, games_per_round=2, hidden=8, eval_every=2, eval_games=2,
+                              log=log, verbose=False)
+            self.assertEqual((res["games"], res["rounds"]), (4, 2))
+            self.assertIn("vs_greedy", res["history"][-1])
+            self.assertGreater(res["history"][0]["games_per_sec"], 0)
+            model, opt, games, rounds = train.load_checkpoint(path)
+            self.assertEqual((games, rounds), (4, 2))
+            self.assertGreater(opt.steps, 0)
+            self.assertTrue(np.array_equal(model.w1, res["model"].w1))
+            self.assertEqual(nn.MLP.load(path).hidden_size(), 8)   # legible como pesos sueltos
+            again = train.train(2, checkpoint=path, resume=True, games_per_round=2, verbose=False)
+            self.assertEqual((again["games"], again["rounds"]), (6, 3))
+            with open(log, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from backgammon.pygame_ui.writer import BackgroundWriter, atomic_write
+
+
+class TestWriterValidos(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_escritura_atomica_sin_temporales(self):
+        path = os.path.join(self.dir, "sub", "a.json")
+        atomic_write(path, b"uno")
+        atomic_write(path, b"dos")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"dos")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["a.json"])
+
+    def test_codifica_y_escribe_en_segundo_plano(self):
+        avisos = []
+        w = BackgroundWriter(notify=lambda: avisos.append(threading.current_thread().name))
+        path = os.path.join(self.dir, "saves", "last.json")
+        self.assertTrue(w.submit(path, lambda d: json.dumps(d).encode(), {"points": [1, 2]}, "Guardado"))
+        w.wait()
+        self.assertEqual(w.poll(), [("Guardado", path, None)])
+        self.assertEqual(w.poll(), [])
+        self.assertEqual(avisos, ["ui-writer"])
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"points": [1, 2]})
+        w.close()
+
+    def test_cola_llena_no_bloquea(self):
+        liberar = threading.Event()
+        w = BackgroundWriter(maxsize=1)
+        bloqueante = lambda d: (liberar.wait(5), d)[1]
+        self.assertTrue(w.submit(os.path.join(self.dir, "a"), bloqueante, b"a"))
+        # el primero puede estar ya en el hilo: a lo sumo uno más entra en la cola
+        results = [w.submit(os.path.join(self.dir, f"b{i}"), bloqueante, b"b") for i in range(3)]
+        self.assertIn(False, results)
+        liberar.set()
+        w.close()
+        self.assertEqual(w.pending(), 0)
+        self.assertTrue(os.path.exists(os.path.join(self.dir, "a")))
+
+    def test_error_se_informa_en_poll(self):
+        w = BackgroundWriter()
+        bloqueo = os.path.join(self.dir, "archivo")
+        open(bloqueo, "w").close()
+        path = os.path.join(bloqueo, "x.png")      # el padre es un archivo
+        w.submit(path, bytes, b"x", "Captura guardada")
+        w.wait()
+        (label, got, error), = w.poll()
+        self.assertEqual((label, got), ("Captura guardada", path))
+        self.assertIsNotNone(error)
+        w.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from backgammon.core.array_board import ArrayBoard
+from backgammon.core.board import Board
+from backgammon.core.game import BackgammonGame
+from backgammon.core.zobrist import board_hash
+
+
+def _nuevo_juego(board=None):
+    g = BackgammonGame(board)
+    g.add_player("White", "white")
+    g.add_player("Black", "black")
+    g.setup_board()
+    return g
+
+
+def _hash_desde_cero(b):
+    return board_hash([b.get_point(i) for i in range(24)],
+                      b.bar_count(Board.WHITE), b.bar_count(Board.BLACK),
+                      b.off_count(Board.WHITE), b.off_count(Board.BLACK))
+
+
+def _self_play(rnd, board_factory, juegos, max_turnos=200):
+    """Genera (board, game) tras cada movimiento de partidas aleatorias."""
+    for _ in range(juegos):
+        g = _nuevo_juego(board_factory())
+        for _turno in range(max_turnos):
+            g.start_turn((rnd.randint(1, 6), rnd.randint(1, 6)))
+            while True:
+                moves = g.legal_moves() + [(o, None, p) for (o, p) in g.legal_bear_off_moves()]
+                if not moves:
+                    break
+                o, _, pip = rnd.choice(moves)
+                g.apply_move(o, pip)
+                yield g
+            g.auto_end_turn()
+            if g.has_won(Board.WHITE) or g.has_won(Board.BLACK):
+                break
+
+
+class TestZobristValidos(unittest.TestCase):
+    def test_hash_incremental_igual_a_recalculado(self):
+        for factory in (Board, ArrayBoard):
+            rnd = random.Random(7)
+            for g in _self_play(rnd, factory, 5):
+                b = g.board()
+                self.assertEqual(b.zobrist_hash(), _hash_desde_cero(b))
+
+    def test_board_y_array_board_coinciden(self):
+        a = ArrayBoard(); a.setup_initial()
+        b = Board(); b.setup_initial()
+        self.assertEqual(a.zobrist_hash(), b.zobrist_hash())
+        a.move(12, 3, Board.WHITE); b.move(12, 3, Board.WHITE)
+        self.assertEqual(a.zobrist_hash(), b.zobrist_hash())
+
+    def test_set_point_y_vuelta_restaura_hash(self):
+        b = Board(); b.setup_initial()
+        h0 = b.zobrist_hash()
+        b.set_point(9, -1)
+        self.assertNotEqual(b.zobrist_hash(), h0)
+        b.set_point(9, 0)
+        self.assertEqual(b.zobrist_hash(), h0)
+
+    def test_tasa_de_colisiones_en_self_play(self):
+        rnd = random.Random(2025)
+        vistos = {}
+        colisiones = 0
+        for g in _self_play(rnd, ArrayBoard, 150):
+            b = g.board()
+            exacta = b._state_key()
+            h = b.zobrist_hash()
+            previa = vistos.setdefault(h, exacta)
+            if previa != exacta:
+                colisiones += 1
+        self.assertGreater(len(vistos), 10000)
+        self.assertEqual(colisiones, 0)
+
+    def test_position_key_incluye_turno_y_pips(self):
+        g = _nuevo_juego()
+        g.start_turn((3, 4))
+        k_white = g.position_key()
+        g2 = _nuevo_juego()
+        g2.start_turn((4, 3))
+        self.assertEqual(g2.position_key(), k_white)
+        g2.start_turn((3, 3))
+        self.assertNotEqual(g2.position_key(), k_white)
+        g3 = _nuevo_juego()
+        g3.next_turn()
+        g3.start_turn((3, 4))
+        self.assertNotEqual(g3.position_key(), k_white)
+
+
+if __name__ == "__main__":
+    unittest.main()